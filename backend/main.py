@@ -1,11 +1,26 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import uvicorn
+import asyncio
+import io
 import os
+import time
 from dotenv import load_dotenv
 
+from models.bootstrap import ModelBootstrapper, ModelNotReadyError
+from services.automation_engine import AutomationEngine
+from utils.config import Settings
+from utils.database import DatabaseManager
+from utils.lazy_imports import lazy_import
+from utils.metrics import CONTENT_TYPE, MetricsMiddleware, registry
+from utils.roi_sweep import MAX_SWEEP_CELLS, SweepAxis, check_reductions, reduce_sweep
+
+# Only the ROI sweep route needs numpy
+np = lazy_import('numpy')
+
 # Load environment variables
 load_dotenv()
 
@@ -25,6 +40,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost, so latency includes CORS handling and error responses are counted
+app.add_middleware(MetricsMiddleware)
+
 # Example model
 class Item(BaseModel):
     name: str
@@ -32,9 +50,57 @@ class Item(BaseModel):
     price: float
     tax: Optional[float] = None
 
+class SkillsAssessmentRequest(BaseModel):
+    current_industry: str
+    target_industry: Optional[str] = None
+    experience_years: str
+    skills: List[str]
+    education_level: Optional[str] = "bachelor"
+    certifications: List[str] = []
+
+class BatchAssessmentRequest(BaseModel):
+    profiles: List[SkillsAssessmentRequest]
+
+class BatchAssessmentResponse(BaseModel):
+    results: List[Dict[str, Any]]
+    count: int
+    elapsed_ms: float
+    profiles_per_second: float
+
+class ROISweepRequest(BaseModel):
+    industries: Optional[List[str]] = None
+    employee_counts: SweepAxis
+    training_budgets: SweepAxis
+    reductions: List[str] = []
+    include_grid: bool = True
+    format: str = "json"
+
 # Example database (replace with your actual database setup)
 fake_db = []
 
+# AI models are fitted or loaded in worker processes; handlers await them via get_model
+settings = Settings()
+bootstrapper = ModelBootstrapper()
+db_manager = DatabaseManager(settings.database_url, settings)
+automation_engine = AutomationEngine(db_manager=db_manager, model_provider=bootstrapper)
+
+@app.on_event("startup")
+async def load_models():
+    bootstrapper.start()
+    automation_engine.start(asyncio.get_running_loop())
+
+@app.on_event("shutdown")
+async def stop_models():
+    automation_engine.stop()
+    await bootstrapper.shutdown()
+    await db_manager.close()
+
+async def get_model(name: str):
+    try:
+        return await bootstrapper.get(name, timeout=settings.model_ready_timeout)
+    except ModelNotReadyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -54,11 +120,111 @@ async def create_item(item: Item):
 async def read_items():
     return fake_db
 
+@app.post("/api/assess/batch", response_model=BatchAssessmentResponse)
+async def assess_skills_batch(request: BatchAssessmentRequest):
+    skills_model = await get_model('skills_assessment')
+    
+    start = time.perf_counter()
+    results = await skills_model.assess_skills_batch([profile.model_dump() for profile in request.profiles])
+    elapsed = time.perf_counter() - start
+    
+    return {
+        "results": results,
+        "count": len(results),
+        "elapsed_ms": round(elapsed * 1000, 2),
+        "profiles_per_second": round(len(results) / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
+@app.get("/api/job-market/{industry}")
+async def job_market_analysis(industry: str):
+    market_analyzer = await get_model('job_market')
+    return await market_analyzer.analyze_market(industry)
+
+@app.get("/api/users/{user_id}/assessments")
+async def user_assessment_history(user_id: str, cursor: Optional[str] = None, page_size: Optional[int] = None,
+                                  summary: bool = False):
+    """One newest-first page of a user's assessments; pass next_cursor back for the following page"""
+    try:
+        return await db_manager.get_user_assessments_page(user_id, cursor, page_size, summary)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/api/roi/sweep")
+async def roi_scenario_sweep(request: ROISweepRequest):
+    """Evaluate ROI over an industries x headcounts x budgets grid, returned column-oriented"""
+    roi_calculator = await get_model('roi_calculator')
+    
+    industries = request.industries or list(roi_calculator.industry_data)
+    if request.format not in ("json", "npz"):
+        raise HTTPException(status_code=422, detail="format must be 'json' or 'npz'")
+    # Sized from the request alone, so an oversized sweep is rejected before any array is allocated
+    cells = len(industries) * request.employee_counts.size() * request.training_budgets.size()
+    if cells == 0 or cells > MAX_SWEEP_CELLS:
+        raise HTTPException(status_code=422, detail=f"Sweep must have between 1 and {MAX_SWEEP_CELLS} scenarios, got {cells}")
+    try:
+        check_reductions(request.reductions)
+        employee_counts = request.employee_counts.to_array()
+        training_budgets = request.training_budgets.to_array()
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if (employee_counts <= 0).any() or (training_budgets < 0).any():
+        raise HTTPException(status_code=422, detail="Employee counts must be positive and budgets non-negative")
+    
+    # Evaluation, reduction and encoding are all CPU-bound, so none of it runs on the event loop
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _evaluate_sweep, roi_calculator, request,
+                                      industries, employee_counts, training_budgets)
+
+def _evaluate_sweep(roi_calculator, request: ROISweepRequest, industries: List[str],
+                    employee_counts, training_budgets) -> Response:
+    """Evaluate, reduce and encode a validated sweep; runs on a worker thread"""
+    start = time.perf_counter()
+    grid = roi_calculator.sweep_roi(industries, employee_counts, training_budgets)
+    reductions = reduce_sweep(grid, industries, employee_counts, training_budgets, request.reductions)
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+    
+    axes = {'industry': industries, 'employee_count': employee_counts, 'training_budget': training_budgets}
+    columns = grid if request.include_grid else {}
+    
+    if request.format == "npz":
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, industry=np.asarray(industries), employee_count=employee_counts,
+                            training_budget=training_budgets, **columns)
+        return Response(buffer.getvalue(), media_type="application/octet-stream", headers={
+            "Content-Disposition": 'attachment; filename="roi_sweep.npz"',
+            "X-Sweep-Shape": ",".join(map(str, grid['roi_percentage'].shape)),
+            "X-Elapsed-Ms": str(elapsed_ms)
+        })
+    
+    # Columns are flattened in C order over (industry, employee_count, training_budget)
+    return JSONResponse({
+        'shape': list(grid['roi_percentage'].shape),
+        'axes': {name: list(values) if name == 'industry' else values.tolist() for name, values in axes.items()},
+        'columns': {name: np.round(values, 2).ravel().tolist() for name, values in columns.items()},
+        'reductions': reductions,
+        'scenarios': int(grid['roi_percentage'].size),
+        'elapsed_ms': elapsed_ms
+    })
+
+@app.post("/api/automation/trigger/{task_name}")
+async def trigger_automation_task(task_name: str):
+    return await automation_engine.trigger_manual_task(task_name)
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics")
+async def metrics():
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+# Readiness endpoint: 200 once every model is loaded, 503 while loading or after a failure
+@app.get("/ready")
+async def readiness_check():
+    readiness = bootstrapper.readiness()
+    return JSONResponse(readiness, status_code=200 if readiness['ready'] else 503)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
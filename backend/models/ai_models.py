@@ -6,17 +6,94 @@ from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.metrics import accuracy_score, mean_squared_error
 import joblib
 import asyncio
+import copy
+import time
 from typing import Dict, List, Any, Optional
 import logging
 
+from services.data_processor import DataProcessor
+from utils.config import Settings
+from utils.metrics import MODEL_INFERENCE, timed
+from .artifact_store import ModelArtifactStore
+from .feature_encoding import (
+    INDUSTRIES, SKILLS, SKILLS_SLICE, EXPERIENCE_YEARS, encode_skills_features,
+    encode_skills_matrix, encode_transition_features, encode_transition_matrix
+)
+from .market_snapshots import MarketSnapshotIndex
+from .prediction_tables import SkillsPredictionTable, TransitionPredictionTable, load_or_build_table
+from .synthetic_data import sample_skills_profiles, sample_transitions
+from .tree_compiler import select_predictor
+
 logger = logging.getLogger(__name__)
 
+# Score boundaries between the foundational, intermediate and advanced tiers
+RECOMMENDATION_THRESHOLDS = [40, 70]
+RECOMMENDATION_TIERS = (
+    (
+        "🎯 Focus on foundational digital literacy skills",
+        "📚 Complete AI Fundamentals Bootcamp",
+        "🔧 Develop basic process automation understanding"
+    ),
+    (
+        "🚀 Advance to intermediate cross-sector skills", 
+        "📊 Pursue Cross-Sector Data Science certification",
+        "🤖 Explore industry-specific AI applications"
+    ),
+    (
+        "🏆 Ready for leadership roles in automation",
+        "🌟 Consider emerging roles like AI Ethics Specialist",
+        "🎓 Pursue advanced cross-industry certifications"
+    )
+)
+
+def _serving_predictor(model, backend: str, X: np.ndarray, table_cls, 
+                       artifact_store: ModelArtifactStore, artifact_name: str, key: str):
+    """Pick the estimator that answers requests: the model itself, its compiled form or its prediction table"""
+    if backend == 'table':
+        return load_or_build_table(table_cls, model, artifact_store, artifact_name, key, X)
+    return select_predictor(model, backend, X)
+
+def _grow_ensemble(model, X: np.ndarray, y: np.ndarray, extra_estimators: int):
+    """Copy a fitted ensemble and warm-start ``extra_estimators`` more trees/stages on (X, y)"""
+    grown = copy.deepcopy(model)
+    grown.set_params(warm_start=True, n_estimators=model.n_estimators + extra_estimators)
+    grown.fit(X, y)
+    grown.set_params(warm_start=False)
+    return grown
+
+# Salary estimate used when no salary progression data is loaded
+FALLBACK_BASE_SALARIES = {
+    'cybersecurity': 85000,
+    'healthcare': 75000,
+    'manufacturing': 65000,
+    'finance': 90000,
+    'retail': 55000,
+    'education': 60000,
+    'logistics': 58000,
+    'legal': 95000
+}
+FALLBACK_EXPERIENCE_MULTIPLIERS = {'0-2': 1.0, '3-5': 1.2, '6-10': 1.5, '10+': 1.8}
+FALLBACK_TRAINING_UPLIFT = 1.15
+
+# Terminal career_transitions statuses usable as training labels
+TRANSITION_OUTCOMES = {'completed': 1, 'successful': 1, 'failed': 0, 'abandoned': 0}
+
 class SkillsAssessmentModel:
-    def __init__(self):
+    artifact_name = 'skills_assessment'
+    training_rows = 5000
+    min_retrain_rows = 20
+    
+    def __init__(self, artifact_store: Optional[ModelArtifactStore] = None, inference_backend: Optional[str] = None):
         self.model = None
+        self.predictor = None
         self.scaler = StandardScaler()
         self.skill_encoder = LabelEncoder()
         self.industry_encoder = LabelEncoder()
+        self.hyperparameters = {'n_estimators': 100, 'random_state': 42}
+        self.artifact_store = artifact_store or ModelArtifactStore()
+        self.inference_backend = inference_backend or Settings().inference_backend
+        self.model_key = None
+        self.base_key = None
         self.is_ready = False
         
     async def initialize(self):
@@ -28,85 +105,91 @@ class SkillsAssessmentModel:
             # Prepare features
             X, y = self._prepare_features(data)
             
-            # Train model
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+            # Reuse a previously fitted model when data and hyperparameters are unchanged
+            key = self.artifact_store.compute_key(self.artifact_name, X, y, self.hyperparameters)
+            model = self.artifact_store.load(self.artifact_name, key)
             
-            self.model = RandomForestRegressor(n_estimators=100, random_state=42)
-            self.model.fit(X_train, y_train)
+            if model is None:
+                # Train model
+                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+                
+                model = RandomForestRegressor(**self.hyperparameters)
+                model.fit(X_train, y_train)
+                
+                # Evaluate
+                predictions = model.predict(X_test)
+                mse = mean_squared_error(y_test, predictions)
+                logger.info(f"Skills model MSE: {mse}")
+                
+                self.artifact_store.save(self.artifact_name, key, model)
             
-            # Evaluate
-            predictions = self.model.predict(X_test)
-            mse = mean_squared_error(y_test, predictions)
-            logger.info(f"Skills model MSE: {mse}")
+            # Serve the latest incrementally retrained descendant of this base model, if any
+            self.base_key = key
+            retrained = self.artifact_store.load(f"{self.artifact_name}_retrained", key)
+            if retrained is not None:
+                model, key = retrained['model'], retrained['key']
             
+            self._activate(model, X, key)
             self.is_ready = True
             
         except Exception as e:
             logger.error(f"Skills model initialization failed: {e}")
             
-    def _generate_training_data(self):
-        """Generate synthetic training data for skills assessment"""
-        np.random.seed(42)
-        
-        industries = ['cybersecurity', 'healthcare', 'manufacturing', 'finance', 'retail', 'education', 'logistics', 'legal']
-        skills = ['ai-ml', 'data-analysis', 'digital-literacy', 'process-automation', 'human-ai-collaboration', 
-                 'critical-thinking', 'adaptability', 'communication', 'project-management', 'ethical-decision']
-        
-        data = []
-        for _ in range(5000):
-            industry = np.random.choice(industries)
-            num_skills = np.random.randint(3, 8)
-            user_skills = np.random.choice(skills, num_skills, replace=False).tolist()
-            experience = np.random.choice(['0-2', '3-5', '6-10', '10+'])
-            
-            # Calculate score based on skills and experience
-            base_score = len(user_skills) * 8
-            if 'ai-ml' in user_skills: base_score += 15
-            if 'data-analysis' in user_skills: base_score += 12
-            if experience == '10+': base_score += 20
-            elif experience == '6-10': base_score += 15
-            elif experience == '3-5': base_score += 10
-            
-            score = min(base_score + np.random.normal(0, 5), 100)
-            
-            data.append({
+    def _activate(self, model, X: np.ndarray, key: str):
+        """Build the serving predictor for ``model`` and swap it in; in-flight calls keep the one they read"""
+        predictor = _serving_predictor(model, self.inference_backend, X, SkillsPredictionTable,
+                                       self.artifact_store, self.artifact_name, key)
+        self.model, self.predictor, self.model_key = model, predictor, key
+    
+    async def update_incremental(self, data: pd.DataFrame, extra_estimators: int = 10) -> Dict[str, Any]:
+        """Add trees fitted on new rows to a copy of the forest and hot-swap it into serving"""
+        if not self.is_ready:
+            raise Exception("Model not initialized")
+        
+        X, y = self._prepare_features(data)
+        if len(X) < self.min_retrain_rows:
+            return {'status': 'skipped', 'rows': len(X)}
+        
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        model = await loop.run_in_executor(None, _grow_ensemble, self.model, X, y, extra_estimators)
+        key = self.artifact_store.compute_key(self.artifact_name, X, y, {'parent': self.model_key, 'extra_estimators': extra_estimators})
+        await loop.run_in_executor(None, self._activate, model, X, key)
+        await loop.run_in_executor(None, self.artifact_store.save, f"{self.artifact_name}_retrained", self.base_key, {'model': model, 'key': key})
+        
+        return {
+            'status': 'completed',
+            'rows': len(X),
+            'n_estimators': model.n_estimators,
+            'duration_seconds': round(time.perf_counter() - start, 3)
+        }
+    
+    @staticmethod
+    def training_frame_from_assessments(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Turn stored skills_assessments rows into training rows, dropping those without skills or experience"""
+        records = []
+        for row in rows:
+            data = row.get('assessment_data') or {}
+            industry = row.get('industry') or data.get('current_industry')
+            if industry is None or row.get('overall_score') is None:
+                continue
+            if data.get('skills') is None or data.get('experience_years') is None:
+                continue
+            records.append({
                 'industry': industry,
-                'skills': user_skills,
-                'experience': experience,
-                'score': max(score, 20)
+                'skills': data['skills'],
+                'experience': data['experience_years'],
+                'score': row['overall_score']
             })
-            
-        return pd.DataFrame(data)
+        return pd.DataFrame(records, columns=['industry', 'skills', 'experience', 'score'])
+    
+    def _generate_training_data(self, n_rows: Optional[int] = None, seed: int = 42):
+        """Generate synthetic training data for skills assessment"""
+        return sample_skills_profiles(np.random.default_rng(seed), n_rows or self.training_rows)
     
     def _prepare_features(self, data):
         """Prepare features for training"""
-        # Create feature matrix
-        features = []
-        scores = []
-        
-        all_skills = ['ai-ml', 'data-analysis', 'digital-literacy', 'process-automation', 'human-ai-collaboration', 
-                     'critical-thinking', 'adaptability', 'communication', 'project-management', 'ethical-decision']
-        
-        for _, row in data.iterrows():
-            feature_vector = []
-            
-            # Industry encoding (one-hot)
-            industry_encoded = [1 if row['industry'] == ind else 0 
-                              for ind in ['cybersecurity', 'healthcare', 'manufacturing', 'finance', 'retail', 'education', 'logistics', 'legal']]
-            feature_vector.extend(industry_encoded)
-            
-            # Skills encoding (binary)
-            skills_encoded = [1 if skill in row['skills'] else 0 for skill in all_skills]
-            feature_vector.extend(skills_encoded)
-            
-            # Experience encoding
-            exp_map = {'0-2': 1, '3-5': 2, '6-10': 3, '10+': 4}
-            feature_vector.append(exp_map[row['experience']])
-            
-            features.append(feature_vector)
-            scores.append(row['score'])
-            
-        return np.array(features), np.array(scores)
+        return encode_skills_features(data), data['score'].to_numpy()
     
     async def assess_skills(self, current_industry: str, target_industry: Optional[str], 
                           experience_years: str, skills: List[str], 
@@ -115,80 +198,83 @@ class SkillsAssessmentModel:
         if not self.is_ready:
             raise Exception("Model not initialized")
             
-        # Prepare input features
-        all_skills = ['ai-ml', 'data-analysis', 'digital-literacy', 'process-automation', 'human-ai-collaboration', 
-                     'critical-thinking', 'adaptability', 'communication', 'project-management', 'ethical-decision']
-        
-        feature_vector = []
-        
-        # Industry encoding
-        industries = ['cybersecurity', 'healthcare', 'manufacturing', 'finance', 'retail', 'education', 'logistics', 'legal']
-        industry_encoded = [1 if current_industry == ind else 0 for ind in industries]
-        feature_vector.extend(industry_encoded)
-        
-        # Skills encoding
-        skills_encoded = [1 if skill in skills else 0 for skill in all_skills]
-        feature_vector.extend(skills_encoded)
-        
-        # Experience encoding
-        exp_map = {'0-2': 1, '3-5': 2, '6-10': 3, '10+': 4}
-        feature_vector.append(exp_map.get(experience_years, 1))
-        
-        # Predict score
-        score = self.model.predict([feature_vector])[0]
-        
-        # Generate skill gaps
-        skill_gaps = []
-        for skill in all_skills:
-            if skill not in skills:
-                importance = np.random.uniform(0.6, 0.9)
-                skill_gaps.append({
-                    'skill': skill,
-                    'importance': importance,
-                    'current_level': 0,
-                    'target_level': 80,
-                    'training_time_weeks': int(importance * 10)
-                })
+        return self._assess_profiles([current_industry], [skills], [experience_years])[0]
+    
+    async def assess_skills_batch(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Assess many profiles with a single model invocation"""
+        if not self.is_ready:
+            raise Exception("Model not initialized")
         
-        # Generate recommendations
-        recommendations = self._generate_recommendations(score, skills, current_industry)
+        start = time.perf_counter()
+        results = self._assess_profiles(
+            [profile['current_industry'] for profile in profiles],
+            [profile.get('skills', []) for profile in profiles],
+            [profile['experience_years'] for profile in profiles]
+        )
+        elapsed = time.perf_counter() - start
+        
+        if profiles:
+            logger.info(f"Assessed {len(profiles)} profiles in {elapsed:.3f}s "
+                        f"({len(profiles) / max(elapsed, 1e-9):.0f} profiles/sec)")
+        return results
+    
+    @timed(MODEL_INFERENCE, 'skills_assessment', 'assess')
+    def _assess_profiles(self, industries: List[str], skill_sets: List[List[str]], 
+                         experience: List[str]) -> List[Dict[str, Any]]:
+        """Score, gap-analyse and tier a batch of profiles in vectorized form"""
+        if not industries:
+            return []
         
-        return {
-            'overall_score': float(score),
-            'skill_gaps': skill_gaps,
-            'recommendations': recommendations,
-            'estimated_timeline': len(skill_gaps) * 2
-        }
+        # Prepare input features
+        feature_matrix = encode_skills_matrix(industries, skill_sets, experience)
+        
+        # Predict scores
+        scores = self.predictor.predict(feature_matrix)
+        
+        # Skill gaps are the untracked columns of the multi-hot block
+        missing = feature_matrix[:, SKILLS_SLICE] == 0
+        importance = np.random.uniform(0.6, 0.9, size=missing.shape)
+        training_weeks = (importance * 10).astype(int)
+        tiers = np.digitize(scores, RECOMMENDATION_THRESHOLDS)
+        timelines = missing.sum(axis=1) * 2
+        
+        results = []
+        for i, score in enumerate(scores.tolist()):
+            skill_gaps = [{
+                'skill': SKILLS[j],
+                'importance': float(importance[i, j]),
+                'current_level': 0,
+                'target_level': 80,
+                'training_time_weeks': int(training_weeks[i, j])
+            } for j in np.flatnonzero(missing[i])]
+            
+            results.append({
+                'overall_score': score,
+                'skill_gaps': skill_gaps,
+                'recommendations': list(RECOMMENDATION_TIERS[tiers[i]]),
+                'estimated_timeline': int(timelines[i])
+            })
+        
+        return results
     
     def _generate_recommendations(self, score: float, skills: List[str], industry: str) -> List[str]:
         """Generate personalized recommendations"""
-        recommendations = []
-        
-        if score < 40:
-            recommendations.extend([
-                "🎯 Focus on foundational digital literacy skills",
-                "📚 Complete AI Fundamentals Bootcamp",
-                "🔧 Develop basic process automation understanding"
-            ])
-        elif score < 70:
-            recommendations.extend([
-                "🚀 Advance to intermediate cross-sector skills", 
-                "📊 Pursue Cross-Sector Data Science certification",
-                "🤖 Explore industry-specific AI applications"
-            ])
-        else:
-            recommendations.extend([
-                "🏆 Ready for leadership roles in automation",
-                "🌟 Consider emerging roles like AI Ethics Specialist",
-                "🎓 Pursue advanced cross-industry certifications"
-            ])
-            
-        return recommendations
+        return list(RECOMMENDATION_TIERS[np.digitize(score, RECOMMENDATION_THRESHOLDS)])
 
 
 class CareerTransitionPredictor:
-    def __init__(self):
+    artifact_name = 'career_transition'
+    training_rows = 3000
+    min_retrain_rows = 20
+    
+    def __init__(self, artifact_store: Optional[ModelArtifactStore] = None, inference_backend: Optional[str] = None):
         self.model = None
+        self.predictor = None
+        self.hyperparameters = {'n_estimators': 100, 'random_state': 42}
+        self.artifact_store = artifact_store or ModelArtifactStore()
+        self.inference_backend = inference_backend or Settings().inference_backend
+        self.model_key = None
+        self.base_key = None
         self.is_ready = False
         
     async def initialize(self):
@@ -199,119 +285,153 @@ class CareerTransitionPredictor:
             
             # Train model
             X, y = self._prepare_transition_features(data)
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+            key = self.artifact_store.compute_key(self.artifact_name, X, y, self.hyperparameters)
+            model = self.artifact_store.load(self.artifact_name, key)
             
-            self.model = GradientBoostingClassifier(n_estimators=100, random_state=42)
-            self.model.fit(X_train, y_train)
+            if model is None:
+                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+                
+                model = GradientBoostingClassifier(**self.hyperparameters)
+                model.fit(X_train, y_train)
+                
+                # Evaluate
+                predictions = model.predict(X_test)
+                accuracy = accuracy_score(y_test, predictions)
+                logger.info(f"Career transition model accuracy: {accuracy}")
+                
+                self.artifact_store.save(self.artifact_name, key, model)
             
-            # Evaluate
-            predictions = self.model.predict(X_test)
-            accuracy = accuracy_score(y_test, predictions)
-            logger.info(f"Career transition model accuracy: {accuracy}")
+            # Serve the latest incrementally retrained descendant of this base model, if any
+            self.base_key = key
+            retrained = self.artifact_store.load(f"{self.artifact_name}_retrained", key)
+            if retrained is not None:
+                model, key = retrained['model'], retrained['key']
             
+            self._activate(model, X, key)
             self.is_ready = True
             
         except Exception as e:
             logger.error(f"Career transition model initialization failed: {e}")
     
-    def _generate_transition_data(self):
-        """Generate synthetic career transition data"""
-        np.random.seed(42)
+    def _activate(self, model, X: np.ndarray, key: str):
+        """Build the serving predictor for ``model`` and swap it in; in-flight calls keep the one they read"""
+        predictor = _serving_predictor(model, self.inference_backend, X, TransitionPredictionTable,
+                                       self.artifact_store, self.artifact_name, key)
+        self.model, self.predictor, self.model_key = model, predictor, key
+    
+    async def update_incremental(self, data: pd.DataFrame, extra_estimators: int = 10) -> Dict[str, Any]:
+        """Add boosting stages fitted on new rows to a copy of the model and hot-swap it into serving"""
+        if not self.is_ready:
+            raise Exception("Model not initialized")
         
-        industries = ['cybersecurity', 'healthcare', 'manufacturing', 'finance', 'retail', 'education', 'logistics', 'legal']
+        X, y = self._prepare_transition_features(data)
+        if len(X) < self.min_retrain_rows or len(np.unique(y)) < 2:
+            return {'status': 'skipped', 'rows': len(X)}
         
-        data = []
-        for _ in range(3000):
-            from_industry = np.random.choice(industries)
-            to_industry = np.random.choice([ind for ind in industries if ind != from_industry])
-            
-            # Compatibility matrix
-            compatibility = {
-                ('cybersecurity', 'finance'): 0.85,
-                ('healthcare', 'education'): 0.80,
-                ('manufacturing', 'logistics'): 0.90,
-                ('finance', 'legal'): 0.75
-            }
-            
-            base_success = compatibility.get((from_industry, to_industry), 0.60)
-            success = 1 if np.random.random() < base_success else 0
-            
-            data.append({
-                'from_industry': from_industry,
-                'to_industry': to_industry,
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        model = await loop.run_in_executor(None, _grow_ensemble, self.model, X, y, extra_estimators)
+        key = self.artifact_store.compute_key(self.artifact_name, X, y, {'parent': self.model_key, 'extra_estimators': extra_estimators})
+        await loop.run_in_executor(None, self._activate, model, X, key)
+        await loop.run_in_executor(None, self.artifact_store.save, f"{self.artifact_name}_retrained", self.base_key, {'model': model, 'key': key})
+        
+        return {
+            'status': 'completed',
+            'rows': len(X),
+            'n_estimators': model.n_estimators,
+            'duration_seconds': round(time.perf_counter() - start, 3)
+        }
+    
+    @staticmethod
+    def training_frame_from_transitions(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Turn stored career_transitions rows into training rows; only terminal statuses carry a label"""
+        records = []
+        for row in rows:
+            success = TRANSITION_OUTCOMES.get(row.get('status'))
+            if success is None or row.get('skills') is None:
+                continue
+            records.append({
+                'from_industry': row['from_industry'],
+                'to_industry': row['to_industry'],
                 'success': success,
-                'experience_years': np.random.randint(1, 15),
-                'num_skills': np.random.randint(3, 10)
+                'experience_years': EXPERIENCE_YEARS.get(row.get('experience_level'), 4),
+                'num_skills': len(row['skills'])
             })
-            
-        return pd.DataFrame(data)
+        return pd.DataFrame(records, columns=['from_industry', 'to_industry', 'success', 'experience_years', 'num_skills'])
+    
+    def _generate_transition_data(self, n_rows: Optional[int] = None, seed: int = 42):
+        """Generate synthetic career transition data"""
+        return sample_transitions(np.random.default_rng(seed), n_rows or self.training_rows)
     
     def _prepare_transition_features(self, data):
         """Prepare features for transition prediction"""
-        features = []
-        labels = []
-        
-        industries = ['cybersecurity', 'healthcare', 'manufacturing', 'finance', 'retail', 'education', 'logistics', 'legal']
-        
-        for _, row in data.iterrows():
-            feature_vector = []
-            
-            # From industry encoding
-            from_encoded = [1 if row['from_industry'] == ind else 0 for ind in industries]
-            feature_vector.extend(from_encoded)
-            
-            # To industry encoding  
-            to_encoded = [1 if row['to_industry'] == ind else 0 for ind in industries]
-            feature_vector.extend(to_encoded)
-            
-            # Other features
-            feature_vector.extend([row['experience_years'], row['num_skills']])
-            
-            features.append(feature_vector)
-            labels.append(row['success'])
-            
-        return np.array(features), np.array(labels)
+        return encode_transition_features(data), data['success'].to_numpy()
     
     async def predict_transitions(self, current_industry: str, skills: List[str], experience_years: str) -> List[Dict[str, Any]]:
         """Predict career transition opportunities"""
         if not self.is_ready:
             return []
-            
-        industries = ['cybersecurity', 'healthcare', 'manufacturing', 'finance', 'retail', 'education', 'logistics', 'legal']
-        opportunities = []
         
-        exp_years = {'0-2': 1, '3-5': 4, '6-10': 8, '10+': 12}.get(experience_years, 4)
+        return self._rank_transitions([current_industry], [len(skills)], [experience_years])[0]
+    
+    async def predict_transitions_batch(self, profiles: List[Dict[str, Any]], top_k: int = 3) -> List[List[Dict[str, Any]]]:
+        """Rank transition opportunities for many users with a single model invocation"""
+        if not self.is_ready:
+            return [[] for _ in profiles]
+        
+        return self._rank_transitions(
+            [profile['current_industry'] for profile in profiles],
+            [len(profile.get('skills', [])) for profile in profiles],
+            [profile['experience_years'] for profile in profiles],
+            top_k=top_k
+        )
+    
+    @timed(MODEL_INFERENCE, 'career_transition', 'rank')
+    def _rank_transitions(self, current_industries: List[str], skill_counts: List[int], 
+                          experience: List[str], top_k: int = 3) -> List[List[Dict[str, Any]]]:
+        """Score every (user, target industry) pair at once and keep the top-k per user"""
+        n, k = len(current_industries), len(INDUSTRIES)
+        if n == 0:
+            return []
         
-        for target_industry in industries:
-            if target_industry != current_industry:
-                # Prepare features
-                feature_vector = []
-                
-                # From industry
-                from_encoded = [1 if current_industry == ind else 0 for ind in industries]
-                feature_vector.extend(from_encoded)
-                
-                # To industry
-                to_encoded = [1 if target_industry == ind else 0 for ind in industries]
-                feature_vector.extend(to_encoded)
-                
-                # Experience and skills
-                feature_vector.extend([exp_years, len(skills)])
-                
-                # Predict success probability
-                success_prob = self.model.predict_proba([feature_vector])[0][1]
-                
-                if success_prob > 0.6:
-                    opportunities.append({
-                        'title': f'{current_industry.title()} → {target_industry.title()}',
-                        'compatibility': int(success_prob * 100),
-                        'salaryChange': np.random.randint(-5000, 25000),
-                        'trainingTime': np.random.randint(4, 12),
-                        'description': f'High compatibility transition based on your profile'
-                    })
-        
-        return sorted(opportunities, key=lambda x: x['compatibility'], reverse=True)[:3]
+        exp_years = [EXPERIENCE_YEARS.get(level, 4) for level in experience]
+        
+        # One candidate row per target industry for every user
+        from_industries = np.repeat(np.asarray(current_industries, dtype=object), k)
+        to_industries = np.tile(np.asarray(INDUSTRIES, dtype=object), n)
+        feature_matrix = encode_transition_matrix(
+            from_industries, to_industries, np.repeat(exp_years, k), np.repeat(skill_counts, k)
+        )
+        
+        # Predict success probabilities
+        success_prob = self.predictor.predict_proba(feature_matrix)[:, 1].reshape(n, k)
+        compatibility = (success_prob * 100).astype(int)
+        eligible = (success_prob > 0.6) & (from_industries != to_industries).reshape(n, k)
+        
+        # Stable descending sort keeps industry order among equal compatibility
+        ranked = np.argsort(np.where(eligible, -compatibility, 1), axis=1, kind='stable')[:, :top_k]
+        ranked_eligible = np.take_along_axis(eligible, ranked, axis=1)
+        salary_change = np.random.randint(-5000, 25000, size=ranked.shape)
+        training_time = np.random.randint(4, 12, size=ranked.shape)
+        
+        results = []
+        for i, current_industry in enumerate(current_industries):
+            opportunities = []
+            for rank, j in enumerate(ranked[i]):
+                if not ranked_eligible[i, rank]:
+                    break
+                opportunities.append({
+                    'title': f'{current_industry.title()} → {INDUSTRIES[j].title()}',
+                    'compatibility': int(compatibility[i, j]),
+                    'salaryChange': int(salary_change[i, rank]),
+                    'trainingTime': int(training_time[i, rank]),
+                    'description': f'High compatibility transition based on your profile'
+                })
+            results.append(opportunities)
+        
+        return results
     
+    @timed(MODEL_INFERENCE, 'career_transition', 'predict_success')
     async def predict_transition_success(self, current_role: str, current_industry: str, 
                                        target_industry: str, skills: List[str], 
                                        experience_years: int, location: str) -> Dict[str, Any]:
@@ -372,6 +492,7 @@ class ROICalculator:
         except Exception as e:
             logger.error(f"ROI Calculator initialization failed: {e}")
     
+    @timed(MODEL_INFERENCE, 'roi_calculator', 'calculate')
     async def calculate_comprehensive_roi(self, industry: str, employee_count: int, 
                                         training_budget: float, current_productivity: float) -> Dict[str, Any]:
         """Calculate comprehensive ROI analysis"""
@@ -416,6 +537,36 @@ class ROICalculator:
                 'Provide ongoing support'
             ]
         }
+    
+    @timed(MODEL_INFERENCE, 'roi_calculator', 'sweep')
+    def sweep_roi(self, industries: List[str], employee_counts: List[float],
+                  training_budgets: List[float]) -> Dict[str, np.ndarray]:
+        """Evaluate calculate_comprehensive_roi over industries x headcounts x budgets in one broadcast pass
+        
+        Every returned array has shape (len(industries), len(employee_counts), len(training_budgets)).
+        Pure CPU work, so it is synchronous and callers run it on a worker thread.
+        """
+        if not self.is_ready:
+            raise Exception("ROI Calculator not initialized")
+        
+        metrics = [self.industry_data.get(industry, self.industry_data['cybersecurity']) for industry in industries]
+        cost_per_employee = np.array([m['cost_per_employee'] for m in metrics], dtype=float)[:, None, None]
+        gain_per_employee = np.array([m['productivity_gain'] for m in metrics], dtype=float)[:, None, None]
+        employees = np.asarray(employee_counts, dtype=float)[None, :, None]
+        budgets = np.asarray(training_budgets, dtype=float)[None, None, :]
+        
+        training_cost = employees * cost_per_employee
+        total_cost = training_cost + budgets * 0.2
+        productivity_gain = employees * gain_per_employee
+        total_benefit = productivity_gain + training_cost * 0.3
+        
+        shape = (len(industries), len(employee_counts), len(training_budgets))
+        return {
+            'roi_percentage': (total_benefit - total_cost) / total_cost * 100,
+            'payback_months': total_cost / (total_benefit / 12),
+            'total_cost': np.broadcast_to(total_cost, shape),
+            'total_benefit': np.broadcast_to(total_benefit, shape)
+        }
 
 
 class TrainingRecommendationEngine:
@@ -427,6 +578,7 @@ class TrainingRecommendationEngine:
         self.is_ready = True
         logger.info("Training Recommendation Engine initialized")
     
+    @timed(MODEL_INFERENCE, 'training_recommendations', 'learning_path')
     async def generate_learning_path(self, current_skills: List[str], target_industry: str, 
                                    skill_gaps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Generate personalized learning path"""
@@ -468,6 +620,7 @@ class TrainingRecommendationEngine:
         
         return path[:5]  # Limit to 5 courses
     
+    @timed(MODEL_INFERENCE, 'training_recommendations', 'recommend')
     async def generate_recommendations(self, user_id: str, current_skills: List[str], 
                                      target_skills: List[str], industry: str, 
                                      learning_style: str, time_availability: int) -> Dict[str, Any]:
@@ -493,39 +646,54 @@ class TrainingRecommendationEngine:
 
 
 class JobMarketAnalyzer:
-    def __init__(self):
+    def __init__(self, data_processor: Optional[DataProcessor] = None):
+        self.data_processor = data_processor
+        self.market = MarketSnapshotIndex()
         self.is_ready = False
         
     async def initialize(self):
         """Initialize job market analyzer"""
-        self.is_ready = True
-        logger.info("Job Market Analyzer initialized")
+        try:
+            processor = self.data_processor or DataProcessor()
+            job_market = processor.datasets.get('job_market_trends')
+            if job_market is None:
+                job_market = processor._generate_job_market_data()
+            salary_progression = processor.datasets.get('salary_progression')
+            if salary_progression is None:
+                salary_progression = processor._generate_salary_data()
+            
+            self.market.load(job_market, salary_progression)
+            self.is_ready = True
+            logger.info("Job Market Analyzer initialized")
+            
+        except Exception as e:
+            logger.error(f"Job market analyzer initialization failed: {e}")
+            raise
     
+    def ingest_market_rows(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """Apply new monthly job market rows; returns the industries whose snapshots changed"""
+        return self.market.ingest_market_rows(rows)
+    
+    @timed(MODEL_INFERENCE, 'job_market', 'predict_salary')
     async def predict_salary(self, industry: str, skills: List[str], experience_years: str) -> Dict[str, float]:
         """Predict salary based on industry, skills, and experience"""
         
-        base_salaries = {
-            'cybersecurity': 85000,
-            'healthcare': 75000,
-            'manufacturing': 65000,
-            'finance': 90000,
-            'retail': 55000,
-            'education': 60000,
-            'logistics': 58000,
-            'legal': 95000
-        }
-        
-        base_salary = base_salaries.get(industry, 70000)
+        if not self.is_ready:
+            raise Exception("Model not initialized")
         
-        # Experience multiplier
-        exp_multipliers = {'0-2': 1.0, '3-5': 1.2, '6-10': 1.5, '10+': 1.8}
-        multiplier = exp_multipliers.get(experience_years, 1.0)
+        band = self.market.salary_band(industry, experience_years)
         
         # Skills bonus
         skill_bonus = len(skills) * 2000
         
-        current_salary = base_salary * multiplier + skill_bonus
-        projected_salary = current_salary * 1.15  # 15% increase with training
+        if band is None:
+            base_salary = FALLBACK_BASE_SALARIES.get(industry, 70000) * FALLBACK_EXPERIENCE_MULTIPLIERS.get(experience_years, 1.0)
+            current_salary = base_salary + skill_bonus
+            projected_salary = current_salary * FALLBACK_TRAINING_UPLIFT
+        else:
+            base_salary, with_ai_skills = band
+            current_salary = base_salary + skill_bonus
+            projected_salary = current_salary * with_ai_skills / base_salary
         
         return {
             'current_estimate': round(current_salary, 0),
@@ -533,30 +701,11 @@ class JobMarketAnalyzer:
             'increase': round(projected_salary - current_salary, 0)
         }
     
+    @timed(MODEL_INFERENCE, 'job_market', 'analyze')
     async def analyze_market(self, industry: str) -> Dict[str, Any]:
         """Analyze job market for specific industry"""
         
-        return {
-            'demand_score': np.random.uniform(7.0, 9.5),
-            'salary_trends': {
-                'current_avg': np.random.randint(60000, 120000),
-                'growth_rate': np.random.uniform(3.0, 8.0)
-            },
-            'top_skills': ['AI/ML', 'Data Analysis', 'Process Automation', 'Digital Literacy'],
-            'growth_forecast': np.random.uniform(5.0, 15.0),
-            'automation_risk': np.random.uniform(20.0, 60.0),
-            'emerging_positions': [
-                'AI Ethics Specialist',
-                'Human-AI Collaboration Manager',
-                'Digital Transformation Lead'
-            ],
-            'location_data': {
-                'remote_percentage': np.random.uniform(40.0, 80.0),
-                'top_cities': ['San Francisco', 'New York', 'Seattle', 'Austin']
-            },
-            'insights': [
-                f'{industry.title()} sector showing strong growth',
-                'High demand for AI-skilled professionals',
-                'Remote work opportunities increasing'
-            ]
-        }
+        if not self.is_ready:
+            raise Exception("Model not initialized")
+        
+        return self.market.snapshot(industry)
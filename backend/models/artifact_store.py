@@ -0,0 +1,85 @@
+"""
+Model artifact store for WorkforceTransformer Universal
+Content-hashed joblib cache so fitted models are reused across processes and restarts
+"""
+
+from typing import Any, Dict, Optional
+from pathlib import Path
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+import joblib
+import numpy as np
+import sklearn
+
+from utils.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class ModelArtifactStore:
+    """Persist fitted models under ``Settings.model_cache_dir`` keyed by training content"""
+
+    def __init__(self, cache_dir: Optional[str] = None, mmap_mode: Optional[str] = 'r'):
+        self.cache_dir = Path(cache_dir or Settings().model_cache_dir)
+        self.mmap_mode = mmap_mode
+
+    @staticmethod
+    def compute_key(name: str, X: np.ndarray, y: np.ndarray, params: Dict[str, Any]) -> str:
+        """Hash the encoded training data, hyperparameters and library version"""
+        hasher = hashlib.sha256()
+        hasher.update(name.encode())
+        hasher.update(sklearn.__version__.encode())
+        hasher.update(json.dumps(params, sort_keys=True, default=str).encode())
+        for array in (X, y):
+            array = np.ascontiguousarray(array)
+            hasher.update(f"{array.dtype.str}{array.shape}".encode())
+            hasher.update(array.data)
+        return hasher.hexdigest()
+
+    def path_for(self, name: str, key: str, suffix: str = 'joblib') -> Path:
+        """Location of the artifact for ``name`` at ``key``"""
+        return self.cache_dir / f"{name}-{key[:16]}.{suffix}"
+
+    def load(self, name: str, key: str, suffix: str = 'joblib') -> Optional[Any]:
+        """Load a cached artifact memory-mapped, or return None on a miss"""
+        path = self.path_for(name, key, suffix)
+        if not path.exists():
+            return None
+        try:
+            artifact = joblib.load(path, mmap_mode=self.mmap_mode)
+            logger.info(f"Loaded {name} artifact from {path}")
+            return artifact
+        except Exception as e:
+            logger.warning(f"Discarding unreadable {name} artifact {path}: {e}")
+            return None
+
+    def save(self, name: str, key: str, artifact: Any, suffix: str = 'joblib') -> Optional[Path]:
+        """Atomically write an artifact and drop older versions of the same name"""
+        path = self.path_for(name, key, suffix)
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{name}-", suffix='.tmp')
+            os.close(fd)
+            # Uncompressed so numpy arrays can be memory-mapped on load
+            joblib.dump(artifact, tmp_path, compress=0)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not persist {name} artifact to {path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return None
+
+        for stale in self.cache_dir.glob(f"{name}-*.{suffix}"):
+            if stale != path:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+
+        logger.info(f"Saved {name} artifact to {path}")
+        return path
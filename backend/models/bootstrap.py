@@ -0,0 +1,164 @@
+"""
+Model bootstrapper for WorkforceTransformer Universal
+Initializes every model concurrently in a process pool so fitting never runs on the
+event loop, and lets request handlers await a model instead of failing while it loads
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Classes are named rather than imported so the serving process does not load pandas
+# and scikit-learn at import time, only once a model is loaded into it
+MODEL_REGISTRY = {
+    'skills_assessment': 'SkillsAssessmentModel',
+    'career_transition': 'CareerTransitionPredictor',
+    'roi_calculator': 'ROICalculator',
+    'training_recommendations': 'TrainingRecommendationEngine',
+    'job_market': 'JobMarketAnalyzer'
+}
+
+
+class ModelNotReadyError(Exception):
+    """Raised when a model failed to initialize or did not become ready in time"""
+
+
+def model_class(name: str) -> type:
+    """Import ``models.ai_models`` on first use and return the class registered as ``name``"""
+    ai_models = importlib.import_module('.ai_models', __package__)
+    return getattr(ai_models, MODEL_REGISTRY[name])
+
+
+def _initialize(name: str) -> Any:
+    model = model_class(name)()
+    asyncio.run(model.initialize())
+    if not model.is_ready:
+        raise ModelNotReadyError('initialize() did not mark the model ready')
+    return model
+
+
+def _initialize_in_worker(name: str) -> Tuple[Optional[Any], float]:
+    """Fit or load one model in a pool process
+
+    Models backed by the artifact store are only fitted and persisted here; None is
+    returned and the serving process loads the artifact memory-mapped. Other models
+    hold no large arrays and are pickled back ready to serve.
+    """
+    start = time.perf_counter()
+    model = _initialize(name)
+    if getattr(model, 'artifact_name', None):
+        model = None
+    return model, time.perf_counter() - start
+
+
+class ModelBootstrapper:
+    """Fit or load the registered models in parallel and track per-model readiness"""
+
+    def __init__(self, names: Optional[Iterable[str]] = None, max_workers: Optional[int] = None,
+                 mp_context: str = 'spawn'):
+        self.names = list(names or MODEL_REGISTRY)
+        self.max_workers = max_workers or min(len(self.names), os.cpu_count() or 1)
+        # spawn keeps pool children clear of locks held by server threads at fork time
+        self.mp_context = mp_context
+        self.futures: Dict[str, asyncio.Future] = {}
+        self.status = {name: {'state': 'pending', 'init_seconds': None, 'load_seconds': None,
+                              'ready_after_seconds': None, 'error': None}
+                       for name in self.names}
+        self.started_at = None
+        self.time_to_ready = None
+        self._executor = None
+        self._watcher = None
+
+    def start(self):
+        """Submit every model to the pool and return immediately"""
+        if self.futures:
+            return
+        loop = asyncio.get_running_loop()
+        self.started_at = time.perf_counter()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(self.mp_context)
+        )
+        for name in self.names:
+            self.status[name]['state'] = 'loading'
+            future = asyncio.ensure_future(self._bootstrap(name))
+            future.add_done_callback(partial(self._on_done, name))
+            self.futures[name] = future
+        self._watcher = asyncio.create_task(self._report_when_ready())
+        logger.info(f"Bootstrapping {len(self.names)} models on {self.max_workers} worker processes")
+
+    async def _bootstrap(self, name: str) -> Tuple[Any, float]:
+        loop = asyncio.get_running_loop()
+        model, elapsed = await loop.run_in_executor(self._executor, _initialize_in_worker, name)
+        if model is None:
+            # The worker persisted the fitted artifact; initializing here hits the store and maps
+            # its arrays instead of unpickling a private copy (it fits only if the save failed)
+            start = time.perf_counter()
+            model = await loop.run_in_executor(None, _initialize, name)
+            self.status[name]['load_seconds'] = round(time.perf_counter() - start, 3)
+        return model, elapsed
+
+    def _on_done(self, name: str, future: asyncio.Future):
+        status = self.status[name]
+        status['ready_after_seconds'] = round(time.perf_counter() - self.started_at, 3)
+        if future.cancelled():
+            status['state'] = 'failed'
+            status['error'] = 'cancelled'
+            return
+        if future.exception() is not None:
+            status['state'] = 'failed'
+            status['error'] = str(future.exception())
+            logger.error(f"Model {name} failed to initialize: {future.exception()}")
+            return
+
+        _, elapsed = future.result()
+        status['init_seconds'] = round(elapsed, 3)
+        status['state'] = 'ready'
+        logger.info(f"Model {name} ready in {elapsed:.2f}s")
+
+    async def _report_when_ready(self):
+        await asyncio.gather(*self.futures.values(), return_exceptions=True)
+        self.time_to_ready = round(time.perf_counter() - self.started_at, 3)
+        ready = sum(status['state'] == 'ready' for status in self.status.values())
+        logger.info(f"Time to ready: {self.time_to_ready:.2f}s ({ready}/{len(self.names)} models ready)")
+        self._executor.shutdown(wait=False)
+
+    async def get(self, name: str, timeout: Optional[float] = None) -> Any:
+        """Wait for ``name`` to finish initializing and return the ready model"""
+        if name not in self.futures:
+            raise ModelNotReadyError(f"Model {name} has not been scheduled")
+        try:
+            model, _ = await asyncio.wait_for(asyncio.shield(self.futures[name]), timeout)
+        except asyncio.TimeoutError:
+            raise ModelNotReadyError(f"Model {name} not ready after {timeout}s")
+        except Exception as e:
+            raise ModelNotReadyError(f"Model {name} failed to initialize: {e}")
+        return model
+
+    def is_ready(self, name: Optional[str] = None) -> bool:
+        names = [name] if name else self.names
+        return all(self.status[n]['state'] == 'ready' for n in names)
+
+    def readiness(self) -> Dict[str, Any]:
+        """Per-model readiness snapshot for health and readiness routes"""
+        return {
+            'ready': self.is_ready(),
+            'time_to_ready_seconds': self.time_to_ready,
+            'models': self.status
+        }
+
+    async def shutdown(self):
+        if self._watcher and not self._watcher.done():
+            self._watcher.cancel()
+        for future in self.futures.values():
+            future.cancel()
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
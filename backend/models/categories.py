@@ -0,0 +1,10 @@
+"""
+Categories for WorkforceTransformer Universal
+Industries, skills and experience buckets the models encode, kept free of heavy imports so
+services can share the one definition without loading numpy or pandas
+"""
+
+INDUSTRIES = ['cybersecurity', 'healthcare', 'manufacturing', 'finance', 'retail', 'education', 'logistics', 'legal']
+SKILLS = ['ai-ml', 'data-analysis', 'digital-literacy', 'process-automation', 'human-ai-collaboration',
+          'critical-thinking', 'adaptability', 'communication', 'project-management', 'ethical-decision']
+EXPERIENCE_LEVELS = ['0-2', '3-5', '6-10', '10+']
@@ -0,0 +1,99 @@
+"""
+Feature encoding for WorkforceTransformer Universal models
+Columnar encoders shared by training and inference so the two never drift apart
+"""
+
+from itertools import chain
+from typing import Sequence
+import numpy as np
+import pandas as pd
+
+from .categories import EXPERIENCE_LEVELS, INDUSTRIES, SKILLS
+
+# Ordinal used by the skills model, representative years used by the transition model
+EXPERIENCE_ORDINAL = {'0-2': 1, '3-5': 2, '6-10': 3, '10+': 4}
+EXPERIENCE_YEARS = {'0-2': 1, '3-5': 4, '6-10': 8, '10+': 12}
+
+SKILLS_FEATURE_COUNT = len(INDUSTRIES) + len(SKILLS) + 1
+SKILLS_SLICE = slice(len(INDUSTRIES), len(INDUSTRIES) + len(SKILLS))
+TRANSITION_FEATURE_COUNT = 2 * len(INDUSTRIES) + 2
+
+FEATURE_DTYPE = np.float32
+
+_industry_index = pd.Index(INDUSTRIES)
+_skill_index = pd.Index(SKILLS)
+_experience_index = pd.Index(EXPERIENCE_LEVELS)
+_experience_ordinal = np.array([EXPERIENCE_ORDINAL[level] for level in EXPERIENCE_LEVELS], dtype=FEATURE_DTYPE)
+
+
+def _one_hot(out: np.ndarray, values: Sequence[str], index: pd.Index) -> None:
+    """Write a one-hot block into ``out``; unknown values leave the row all zeros"""
+    codes = index.get_indexer(np.asarray(values, dtype=object))
+    rows = np.flatnonzero(codes >= 0)
+    out[rows, codes[rows]] = 1
+
+
+def _multi_hot(out: np.ndarray, skill_sets: Sequence[Sequence[str]], index: pd.Index) -> None:
+    """Write a multi-hot block into ``out`` from a sequence of skill lists"""
+    lengths = np.fromiter((len(s) for s in skill_sets), dtype=np.intp, count=len(skill_sets))
+    if not lengths.sum():
+        return
+    flat = np.fromiter(chain.from_iterable(skill_sets), dtype=object, count=int(lengths.sum()))
+    codes = index.get_indexer(flat)
+    rows = np.repeat(np.arange(len(skill_sets)), lengths)
+    known = codes >= 0
+    out[rows[known], codes[known]] = 1
+
+
+def experience_ordinal(experience: Sequence[str]) -> np.ndarray:
+    """Map experience buckets to the 1-4 ordinal; unknown buckets fall back to 1"""
+    codes = _experience_index.get_indexer(np.asarray(experience, dtype=object))
+    return np.where(codes >= 0, _experience_ordinal[codes], 1).astype(FEATURE_DTYPE)
+
+
+def encode_skills_matrix(industries: Sequence[str], skill_sets: Sequence[Sequence[str]],
+                         experience: Sequence[str]) -> np.ndarray:
+    """Encode skills-assessment profiles as [industry one-hot | skill multi-hot | experience ordinal]"""
+    n = len(industries)
+    X = np.zeros((n, SKILLS_FEATURE_COUNT), dtype=FEATURE_DTYPE)
+    if n == 0:
+        return X
+    _one_hot(X[:, :SKILLS_SLICE.start], industries, _industry_index)
+    _multi_hot(X[:, SKILLS_SLICE], skill_sets, _skill_index)
+    X[:, SKILLS_SLICE.stop] = experience_ordinal(experience)
+    return X
+
+
+def encode_skills_features(data: pd.DataFrame) -> np.ndarray:
+    """Encode a DataFrame with ``industry``, ``skills`` and ``experience`` columns"""
+    return encode_skills_matrix(
+        data['industry'].to_numpy(),
+        data['skills'].to_numpy(),
+        data['experience'].to_numpy()
+    )
+
+
+def encode_transition_matrix(from_industries: Sequence[str], to_industries: Sequence[str],
+                             experience_years: Sequence[float], num_skills: Sequence[int]) -> np.ndarray:
+    """Encode transitions as [from one-hot | to one-hot | experience years | skill count]"""
+    n = len(from_industries)
+    k = len(INDUSTRIES)
+    X = np.zeros((n, TRANSITION_FEATURE_COUNT), dtype=FEATURE_DTYPE)
+    if n == 0:
+        return X
+    _one_hot(X[:, :k], from_industries, _industry_index)
+    _one_hot(X[:, k:2 * k], to_industries, _industry_index)
+    X[:, 2 * k] = experience_years
+    X[:, 2 * k + 1] = num_skills
+    return X
+
+
+def encode_transition_features(data: pd.DataFrame) -> np.ndarray:
+    """Encode a DataFrame with ``from_industry``, ``to_industry``, ``experience_years`` and ``num_skills`` columns"""
+    return encode_transition_matrix(
+        data['from_industry'].to_numpy(),
+        data['to_industry'].to_numpy(),
+        data['experience_years'].to_numpy(),
+        data['num_skills'].to_numpy()
+    )
+
@@ -0,0 +1,183 @@
+"""
+Job market snapshots for WorkforceTransformer Universal
+Per-industry market summaries materialized from the monthly job market and salary
+progression datasets, so serving a market or salary query is a dictionary lookup
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .feature_encoding import EXPERIENCE_LEVELS
+
+logger = logging.getLogger(__name__)
+
+HISTORY_MONTHS = 24
+MARKET_COLUMNS = ('job_postings', 'avg_salary', 'remote_percentage', 'ai_skill_demand')
+
+# Salary progression levels matching the experience buckets used by the models
+EXPERIENCE_SALARY_LEVELS = {'0-2': 'Entry', '3-5': 'Mid', '6-10': 'Senior', '10+': 'Executive'}
+
+# Snapshot served for industries without market rows
+OVERALL = 'all'
+
+TOP_SKILLS = ['AI/ML', 'Data Analysis', 'Process Automation', 'Digital Literacy']
+EMERGING_POSITIONS = ['AI Ethics Specialist', 'Human-AI Collaboration Manager', 'Digital Transformation Lead']
+TOP_CITIES = ['San Francisco', 'New York', 'Seattle', 'Austin']
+
+
+def _annual_growth(values: np.ndarray, window: int = 3) -> float:
+    """Year-over-year % change of the trailing ``window``-month mean, annualized from the span when shorter"""
+    if len(values) >= 12 + window:
+        prior = values[-12 - window:-12].mean()
+        return float((values[-window:].mean() / prior - 1) * 100) if prior else 0.0
+    if len(values) >= 2 and values[0] > 0:
+        return float(((values[-1] / values[0]) ** (12 / (len(values) - 1)) - 1) * 100)
+    return 0.0
+
+
+class MarketSnapshotIndex:
+    """Market snapshots and salary bands indexed by industry
+
+    Each industry keeps a bounded window of its monthly rows; a new month only
+    recomputes the snapshot of the industry it belongs to (plus the cross-industry one).
+    """
+
+    def __init__(self, history_months: int = HISTORY_MONTHS):
+        self.history_months = history_months
+        self.snapshots: Dict[str, Dict[str, Any]] = {}
+        self.salaries: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._history: Dict[str, deque] = {}
+
+    def load(self, job_market: pd.DataFrame, salary_progression: Optional[pd.DataFrame] = None):
+        """Rebuild every snapshot from the full datasets"""
+        self._history.clear()
+        self.snapshots.clear()
+        ordered = job_market.assign(date=pd.to_datetime(job_market['date'])).sort_values(['industry', 'date'])
+        for industry, rows in ordered.groupby('industry', sort=False):
+            history = deque(maxlen=self.history_months)
+            history.extend(zip(rows['date'], *(rows[column].to_numpy(dtype=float) for column in MARKET_COLUMNS)))
+            self._history[industry] = history
+            self.snapshots[industry] = self._build_snapshot(industry)
+        self._refresh_overall()
+
+        if salary_progression is not None:
+            self.load_salaries(salary_progression)
+        logger.info(f"Materialized market snapshots for {len(self._history)} industries")
+
+    def load_salaries(self, salary_progression: pd.DataFrame):
+        """Precompute (base, with AI skills) salary bands per industry and experience bucket"""
+        levels = salary_progression.groupby(['industry', 'experience_level'])[['base_salary', 'with_ai_skills_bonus']].mean()
+        overall = salary_progression.groupby('experience_level')[['base_salary', 'with_ai_skills_bonus']].mean()
+
+        self.salaries.clear()
+        for (industry, level), (base, with_ai) in levels.iterrows():
+            self.salaries[(industry, level)] = (float(base), float(with_ai))
+        for level, (base, with_ai) in overall.iterrows():
+            self.salaries[(OVERALL, level)] = (float(base), float(with_ai))
+
+    def ingest_market_rows(self, rows: Iterable[Dict[str, Any]]) -> List[str]:
+        """Append new monthly rows and refresh only the industries they touch
+
+        Rows are keyed by calendar month: a row dated anywhere in an industry's latest month
+        replaces it, so daily updates never grow the window; rows for older months are ignored.
+        """
+        touched = set()
+        for row in rows:
+            industry = row['industry']
+            month = pd.Timestamp(row['date']).to_period('M')
+            entry = (month.to_timestamp(), *(float(row[column]) for column in MARKET_COLUMNS))
+            history = self._history.setdefault(industry, deque(maxlen=self.history_months))
+
+            latest = history[-1][0].to_period('M') if history else None
+            if latest is not None and month < latest:
+                logger.warning(f"Ignoring out-of-order market row for {industry} dated {month}")
+                continue
+            if month == latest:
+                history.pop()
+            history.append(entry)
+            touched.add(industry)
+
+        for industry in touched:
+            self.snapshots[industry] = self._build_snapshot(industry)
+        if touched:
+            self._refresh_overall()
+        return sorted(touched)
+
+    def snapshot(self, industry: str) -> Optional[Dict[str, Any]]:
+        return self.snapshots.get(industry, self.snapshots.get(OVERALL))
+
+    def salary_band(self, industry: str, experience_years: str) -> Optional[Tuple[float, float]]:
+        level = EXPERIENCE_SALARY_LEVELS.get(experience_years, EXPERIENCE_SALARY_LEVELS[EXPERIENCE_LEVELS[0]])
+        return self.salaries.get((industry, level), self.salaries.get((OVERALL, level)))
+
+    def _build_snapshot(self, industry: str) -> Dict[str, Any]:
+        history = self._history[industry]
+        dates = [entry[0] for entry in history]
+        postings, salary, remote, ai_demand = np.array([entry[1:] for entry in history]).T
+        return self._snapshot_payload(
+            industry=industry,
+            as_of=dates[-1].strftime('%Y-%m-%d'),
+            months=len(history),
+            demand_score=ai_demand[-3:].mean() / 10,
+            current_avg=salary[-1],
+            salary_growth=_annual_growth(salary, window=1),
+            growth_forecast=_annual_growth(postings),
+            # AI skill demand (a 40-90 index) mapped onto a 20-60% automation risk band
+            automation_risk=20 + (ai_demand[-12:].mean() - 40) * 0.8,
+            remote_percentage=remote[-1]
+        )
+
+    def _refresh_overall(self):
+        industries = [snapshot for name, snapshot in self.snapshots.items() if name != OVERALL]
+        if not industries:
+            return
+
+        def mean(field) -> float:
+            return float(np.mean([field(snapshot) for snapshot in industries]))
+
+        self.snapshots[OVERALL] = self._snapshot_payload(
+            industry=OVERALL,
+            as_of=max(snapshot['as_of'] for snapshot in industries),
+            months=max(snapshot['months_of_history'] for snapshot in industries),
+            demand_score=mean(lambda s: s['demand_score']),
+            current_avg=mean(lambda s: s['salary_trends']['current_avg']),
+            salary_growth=mean(lambda s: s['salary_trends']['growth_rate']),
+            growth_forecast=mean(lambda s: s['growth_forecast']),
+            automation_risk=mean(lambda s: s['automation_risk']),
+            remote_percentage=mean(lambda s: s['location_data']['remote_percentage'])
+        )
+
+    @staticmethod
+    def _snapshot_payload(industry: str, as_of: str, months: int, demand_score: float, current_avg: float,
+                          salary_growth: float, growth_forecast: float, automation_risk: float,
+                          remote_percentage: float) -> Dict[str, Any]:
+        """Assemble the analyze_market response served for one industry"""
+        label = 'Cross-industry' if industry == OVERALL else industry.title()
+        direction = 'growing' if growth_forecast >= 0 else 'shrinking'
+        return {
+            'industry': industry,
+            'as_of': as_of,
+            'months_of_history': months,
+            'demand_score': round(float(demand_score), 1),
+            'salary_trends': {
+                'current_avg': int(round(current_avg)),
+                'growth_rate': round(float(salary_growth), 1)
+            },
+            'top_skills': TOP_SKILLS,
+            'growth_forecast': round(float(growth_forecast), 1),
+            'automation_risk': round(float(automation_risk), 1),
+            'emerging_positions': EMERGING_POSITIONS,
+            'location_data': {
+                'remote_percentage': round(float(remote_percentage), 1),
+                'top_cities': TOP_CITIES
+            },
+            'insights': [
+                f'{label} job postings {direction} {abs(growth_forecast):.1f}% year over year',
+                f'AI skill demand index at {demand_score * 10:.0f}/100',
+                f'{remote_percentage:.0f}% of postings offer remote work'
+            ]
+        }
@@ -0,0 +1,197 @@
+"""
+Exhaustive prediction tables for WorkforceTransformer Universal
+The skills and transition models have small discrete input domains, so a fitted model
+can be evaluated over every input once and served afterwards as a float32 array lookup
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+import logging
+import time
+
+import numpy as np
+
+from .artifact_store import ModelArtifactStore
+from .feature_encoding import (
+    INDUSTRIES, SKILLS, SKILLS_SLICE, SKILLS_FEATURE_COUNT, TRANSITION_FEATURE_COUNT, FEATURE_DTYPE
+)
+
+logger = logging.getLogger(__name__)
+
+# Industry code used for values outside INDUSTRIES (an all-zero one-hot block)
+UNKNOWN_INDUSTRY = len(INDUSTRIES)
+INDUSTRY_CODES = len(INDUSTRIES) + 1
+
+
+def _decode_one_hot(block: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (codes, valid) for a one-hot block where an all-zero row means unknown"""
+    binary = ((block == 0) | (block == 1)).all(axis=1)
+    active = block.sum(axis=1)
+    codes = np.where(active > 0, block.argmax(axis=1), UNKNOWN_INDUSTRY)
+    return codes, binary & (active <= 1)
+
+
+def _one_hot_block(codes: np.ndarray) -> np.ndarray:
+    """Inverse of ``_decode_one_hot``"""
+    block = np.zeros((len(codes), len(INDUSTRIES)), dtype=FEATURE_DTYPE)
+    known = np.flatnonzero(codes < UNKNOWN_INDUSTRY)
+    block[known, codes[known]] = 1
+    return block
+
+
+def _threshold_cap(model, feature: int) -> int:
+    """Smallest integer above every split threshold on ``feature``; larger values share its leaf paths"""
+    highest = 0.0
+    for estimator in np.ravel(model.estimators_):
+        tree = estimator.tree_
+        thresholds = tree.threshold[tree.feature == feature]
+        if thresholds.size:
+            highest = max(highest, float(thresholds.max()))
+    return int(np.floor(highest)) + 1
+
+
+class PredictionTable(ABC):
+    """Model outputs for every point of a discrete input domain, indexed by an integer key
+
+    Rows outside the domain (which the encoders never produce) are answered by ``fallback``.
+    """
+
+    def __init__(self, values: np.ndarray, caps: np.ndarray, fallback=None):
+        self.values = values
+        self.caps = caps
+        self.fallback = fallback
+
+    @classmethod
+    @abstractmethod
+    def build(cls, model) -> 'PredictionTable':
+        """Evaluate ``model`` over the whole input domain"""
+
+    @abstractmethod
+    def _keys(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (keys, in_domain) for an encoded feature matrix"""
+
+    @abstractmethod
+    def _fallback_values(self, X: np.ndarray) -> np.ndarray:
+        """Model outputs for rows outside the domain"""
+
+    def lookup(self, X) -> np.ndarray:
+        X = np.asarray(X, dtype=FEATURE_DTYPE)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        keys, valid = self._keys(X)
+        result = self.values[np.where(valid, keys, 0)].astype(np.float64)
+        if not valid.all():
+            outside = np.flatnonzero(~valid)
+            result[outside] = self._fallback_values(X[outside])
+        return result
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {'values': self.values, 'caps': self.caps}
+
+    @property
+    def size(self) -> int:
+        return len(self.values)
+
+
+class SkillsPredictionTable(PredictionTable):
+    """Scores for industry (incl. unknown) x skill subset x experience bucket"""
+
+    experience_levels = 4
+
+    @classmethod
+    def build(cls, model) -> 'SkillsPredictionTable':
+        industry, mask, experience = np.indices(
+            (INDUSTRY_CODES, 1 << len(SKILLS), cls.experience_levels)
+        ).reshape(3, -1)
+
+        X = np.zeros((len(industry), SKILLS_FEATURE_COUNT), dtype=FEATURE_DTYPE)
+        X[:, :SKILLS_SLICE.start] = _one_hot_block(industry)
+        X[:, SKILLS_SLICE] = (mask[:, np.newaxis] >> np.arange(len(SKILLS))) & 1
+        X[:, SKILLS_SLICE.stop] = experience + 1
+
+        values = model.predict(X).astype(np.float32)
+        return cls(values, np.array([cls.experience_levels]), fallback=model)
+
+    def _keys(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        industry, valid = _decode_one_hot(X[:, :SKILLS_SLICE.start])
+        skills = X[:, SKILLS_SLICE]
+        valid &= ((skills == 0) | (skills == 1)).all(axis=1)
+        mask = skills.astype(np.int64) @ (1 << np.arange(len(SKILLS), dtype=np.int64))
+        experience = X[:, SKILLS_SLICE.stop]
+        valid &= (experience >= 1) & (experience <= self.experience_levels) & (experience == np.round(experience))
+        keys = (industry * (1 << len(SKILLS)) + mask) * self.experience_levels + experience.astype(np.int64) - 1
+        return keys, valid
+
+    def _fallback_values(self, X: np.ndarray) -> np.ndarray:
+        return self.fallback.predict(X)
+
+    def predict(self, X) -> np.ndarray:
+        return self.lookup(X)
+
+
+class TransitionPredictionTable(PredictionTable):
+    """Success probabilities for from x to industry x experience years x skill count
+
+    Numeric features are tabulated as integers up to the first value above every
+    split threshold, and larger values are clamped to that cap.
+    """
+
+    @classmethod
+    def build(cls, model) -> 'TransitionPredictionTable':
+        k = len(INDUSTRIES)
+        caps = np.array([_threshold_cap(model, 2 * k), _threshold_cap(model, 2 * k + 1)])
+        from_code, to_code, experience, num_skills = np.indices(
+            (INDUSTRY_CODES, INDUSTRY_CODES, caps[0] + 1, caps[1] + 1)
+        ).reshape(4, -1)
+
+        X = np.zeros((len(from_code), TRANSITION_FEATURE_COUNT), dtype=FEATURE_DTYPE)
+        X[:, :k] = _one_hot_block(from_code)
+        X[:, k:2 * k] = _one_hot_block(to_code)
+        X[:, 2 * k] = experience
+        X[:, 2 * k + 1] = num_skills
+
+        values = model.predict_proba(X)[:, 1].astype(np.float32)
+        return cls(values, caps, fallback=model)
+
+    def _keys(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        k = len(INDUSTRIES)
+        from_code, from_valid = _decode_one_hot(X[:, :k])
+        to_code, to_valid = _decode_one_hot(X[:, k:2 * k])
+        numeric = X[:, 2 * k:]
+        valid = from_valid & to_valid & (numeric >= 0).all(axis=1) & (numeric == np.round(numeric)).all(axis=1)
+        experience, num_skills = np.minimum(numeric.astype(np.int64), self.caps).T
+        keys = ((from_code * INDUSTRY_CODES + to_code) * (self.caps[0] + 1) + experience) * (self.caps[1] + 1) + num_skills
+        return keys, valid
+
+    def _fallback_values(self, X: np.ndarray) -> np.ndarray:
+        return self.fallback.predict_proba(X)[:, 1]
+
+    def predict_proba(self, X) -> np.ndarray:
+        positive = self.lookup(X)
+        return np.column_stack([1.0 - positive, positive])
+
+    def predict(self, X) -> np.ndarray:
+        return self.fallback.classes_[(self.lookup(X) > 0.5).astype(int)]
+
+
+def load_or_build_table(table_cls, model, artifact_store: ModelArtifactStore, artifact_name: str,
+                        key: str, X_check: Optional[np.ndarray] = None) -> PredictionTable:
+    """Load the table persisted for ``key`` or evaluate ``model`` over its whole domain and persist it"""
+    table_name = f"{artifact_name}_table"
+    arrays = artifact_store.load(table_name, key)
+    if arrays is not None:
+        return table_cls(arrays['values'], np.asarray(arrays['caps']), fallback=model)
+
+    start = time.perf_counter()
+    table = table_cls.build(model)
+    logger.info(f"Built {table_name} with {table.size} entries in {time.perf_counter() - start:.2f}s")
+
+    if X_check is not None and len(X_check):
+        if hasattr(table, 'predict_proba'):
+            error = np.abs(table.predict_proba(X_check) - model.predict_proba(X_check)).max()
+        else:
+            error = np.abs(table.predict(X_check) - model.predict(X_check)).max()
+        logger.info(f"{table_name} max error vs model: {error:.3g}")
+
+    artifact_store.save(table_name, key, table.to_arrays())
+    return table
@@ -0,0 +1,122 @@
+"""
+Synthetic training data for WorkforceTransformer Universal models
+Bulk samplers on a seeded numpy Generator, with a chunked mode for datasets larger than memory
+"""
+
+from typing import Callable, Iterator
+from pathlib import Path
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .feature_encoding import INDUSTRIES, SKILLS, EXPERIENCE_LEVELS
+
+logger = logging.getLogger(__name__)
+
+# Score contribution of each experience bucket in the skills training data
+EXPERIENCE_BONUS = {'0-2': 0, '3-5': 10, '6-10': 15, '10+': 20}
+
+# Transition success rates between industry pairs; every other pair uses the default
+TRANSITION_COMPATIBILITY = {
+    ('cybersecurity', 'finance'): 0.85,
+    ('healthcare', 'education'): 0.80,
+    ('manufacturing', 'logistics'): 0.90,
+    ('finance', 'legal'): 0.75
+}
+DEFAULT_COMPATIBILITY = 0.60
+
+# Every skill subset as a tuple, indexed by its bitmask, so rows can be materialized with one take
+_skill_subsets = np.empty(1 << len(SKILLS), dtype=object)
+_skill_subsets[:] = [tuple(skill for bit, skill in enumerate(SKILLS) if mask >> bit & 1)
+                     for mask in range(1 << len(SKILLS))]
+_skill_bits = 1 << np.arange(len(SKILLS))
+_experience_bonus = np.array([EXPERIENCE_BONUS[level] for level in EXPERIENCE_LEVELS])
+_compatibility = np.full((len(INDUSTRIES), len(INDUSTRIES)), DEFAULT_COMPATIBILITY)
+for (_from, _to), _rate in TRANSITION_COMPATIBILITY.items():
+    _compatibility[INDUSTRIES.index(_from), INDUSTRIES.index(_to)] = _rate
+
+
+def sample_skills_profiles(rng: np.random.Generator, n_rows: int) -> pd.DataFrame:
+    """Sample skills-assessment training rows: industry, 3-7 distinct skills, experience and score"""
+    industry = rng.integers(0, len(INDUSTRIES), n_rows)
+    num_skills = rng.integers(3, 8, n_rows)
+    experience = rng.integers(0, len(EXPERIENCE_LEVELS), n_rows)
+
+    # A row's skills are its num_skills lowest-ranked columns under random keys,
+    # which is a uniform draw without replacement
+    ranks = rng.random((n_rows, len(SKILLS))).argsort(axis=1).argsort(axis=1)
+    has_skill = ranks < num_skills[:, np.newaxis]
+
+    base_score = (num_skills * 8
+                  + has_skill[:, SKILLS.index('ai-ml')] * 15
+                  + has_skill[:, SKILLS.index('data-analysis')] * 12
+                  + _experience_bonus[experience])
+    score = np.minimum(base_score + rng.normal(0, 5, n_rows), 100)
+
+    return pd.DataFrame({
+        'industry': pd.Categorical.from_codes(industry, INDUSTRIES),
+        'skills': _skill_subsets[has_skill @ _skill_bits],
+        'experience': pd.Categorical.from_codes(experience, EXPERIENCE_LEVELS),
+        'score': np.maximum(score, 20)
+    })
+
+
+def sample_transitions(rng: np.random.Generator, n_rows: int) -> pd.DataFrame:
+    """Sample career-transition training rows between two distinct industries"""
+    from_industry = rng.integers(0, len(INDUSTRIES), n_rows)
+    # Offsetting by 1..7 picks uniformly among the other industries
+    to_industry = (from_industry + rng.integers(1, len(INDUSTRIES), n_rows)) % len(INDUSTRIES)
+    success = (rng.random(n_rows) < _compatibility[from_industry, to_industry]).astype(int)
+
+    return pd.DataFrame({
+        'from_industry': pd.Categorical.from_codes(from_industry, INDUSTRIES),
+        'to_industry': pd.Categorical.from_codes(to_industry, INDUSTRIES),
+        'success': success,
+        'experience_years': rng.integers(1, 15, n_rows),
+        'num_skills': rng.integers(3, 10, n_rows)
+    })
+
+
+SAMPLERS = {
+    'skills': sample_skills_profiles,
+    'transitions': sample_transitions
+}
+
+
+def iter_chunks(sampler: Callable[[np.random.Generator, int], pd.DataFrame], n_rows: int,
+                chunk_size: int = 1_000_000, seed: int = 42) -> Iterator[pd.DataFrame]:
+    """Yield ``n_rows`` sampled rows as DataFrames of at most ``chunk_size`` rows"""
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_rows, chunk_size):
+        yield sampler(rng, min(chunk_size, n_rows - start))
+
+
+def write_chunks(path: Path, sampler: Callable[[np.random.Generator, int], pd.DataFrame], n_rows: int,
+                 chunk_size: int = 1_000_000, seed: int = 42) -> int:
+    """Stream a sampled dataset to CSV chunk by chunk; list columns are joined with '|'"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for chunk in iter_chunks(sampler, n_rows, chunk_size, seed):
+        if 'skills' in chunk.columns:
+            chunk['skills'] = chunk['skills'].str.join('|')
+        chunk.to_csv(path, mode='w' if written == 0 else 'a', header=written == 0, index=False)
+        written += len(chunk)
+        logger.info(f"Wrote {written}/{n_rows} rows to {path}")
+    return written
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write a synthetic training dataset to CSV")
+    parser.add_argument('dataset', choices=sorted(SAMPLERS))
+    parser.add_argument('output', type=Path)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunk-size', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    write_chunks(args.output, SAMPLERS[args.dataset], args.rows, args.chunk_size, args.seed)
@@ -0,0 +1,215 @@
+"""
+Tree ensemble compiler for WorkforceTransformer Universal
+Flattens fitted scikit-learn forests and boosted ensembles into contiguous arrays
+and evaluates them with a level-synchronous traversal that skips estimator dispatch
+"""
+
+from typing import Any, Dict, List, Optional
+import logging
+import time
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingClassifier, GradientBoostingRegressor, RandomForestRegressor
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_BACKENDS = ('sklearn', 'compiled', 'table')
+
+
+class CompiledTreeEnsemble:
+    """A tree ensemble stored as flat node arrays
+
+    Every tree is appended to one node table. Leaves point to themselves, so
+    walking ``max_depth`` levels lands every row on its leaf without branching
+    on leaf-ness. The raw output is ``base_score + leaf_values @ tree_weights``.
+    """
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, left: np.ndarray, right: np.ndarray,
+                 value: np.ndarray, roots: np.ndarray, tree_weights: np.ndarray, base_score: np.ndarray,
+                 max_depth: int, n_features: int, kind: str, classes: Optional[np.ndarray] = None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.tree_weights = tree_weights
+        self.base_score = base_score
+        self.max_depth = max_depth
+        self.n_features = n_features
+        self.kind = kind
+        self.classes_ = classes
+
+    @property
+    def node_count(self) -> int:
+        return len(self.feature)
+
+    @classmethod
+    def _from_trees(cls, trees: List[Any], tree_weights: np.ndarray, base_score: np.ndarray,
+                    n_features: int, kind: str, classes: Optional[np.ndarray] = None) -> 'CompiledTreeEnsemble':
+        """Concatenate fitted ``Tree`` objects into one node table"""
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for tree in trees:
+            count = tree.node_count
+            ids = np.arange(offset, offset + count, dtype=np.int32)
+            is_leaf = tree.children_left < 0
+
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.int32))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, ids, tree.children_left + offset).astype(np.int32))
+            rights.append(np.where(is_leaf, ids, tree.children_right + offset).astype(np.int32))
+            values.append(tree.value[:, 0, 0])
+            roots.append(offset)
+
+            max_depth = max(max_depth, tree.max_depth)
+            offset += count
+
+        return cls(
+            feature=np.ascontiguousarray(np.concatenate(features)),
+            threshold=np.ascontiguousarray(np.concatenate(thresholds)),
+            left=np.ascontiguousarray(np.concatenate(lefts)),
+            right=np.ascontiguousarray(np.concatenate(rights)),
+            value=np.ascontiguousarray(np.concatenate(values)),
+            roots=np.asarray(roots, dtype=np.int32),
+            tree_weights=tree_weights,
+            base_score=base_score,
+            max_depth=max_depth,
+            n_features=n_features,
+            kind=kind,
+            classes=classes
+        )
+
+    @classmethod
+    def from_random_forest(cls, model: RandomForestRegressor) -> 'CompiledTreeEnsemble':
+        """Compile a single-output random forest regressor (mean of tree outputs)"""
+        if model.n_outputs_ != 1:
+            raise ValueError("Only single-output forests can be compiled")
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        weights = np.full((len(trees), 1), 1.0 / len(trees))
+        return cls._from_trees(trees, weights, np.zeros(1), model.n_features_in_, 'regressor')
+
+    @classmethod
+    def from_gradient_boosting(cls, model) -> 'CompiledTreeEnsemble':
+        """Compile a gradient boosting regressor or classifier (init score plus shrunk stage sums)"""
+        n_stages, n_outputs = model.estimators_.shape
+        trees, weights = [], np.zeros((n_stages * n_outputs, n_outputs))
+        for stage in range(n_stages):
+            for k in range(n_outputs):
+                weights[len(trees), k] = model.learning_rate
+                trees.append(model.estimators_[stage, k].tree_)
+
+        probe = np.zeros((1, model.n_features_in_), dtype=np.float32)
+        base_score = np.asarray(model._raw_predict_init(probe), dtype=np.float64)[0]
+
+        if isinstance(model, GradientBoostingClassifier):
+            return cls._from_trees(trees, weights, base_score, model.n_features_in_, 'classifier', model.classes_)
+        return cls._from_trees(trees, weights, base_score, model.n_features_in_, 'regressor')
+
+    def decision_function(self, X) -> np.ndarray:
+        """Raw ensemble output with shape (n_samples, n_outputs)"""
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+
+        node = np.tile(self.roots, (X.shape[0], 1))
+        rows = np.arange(X.shape[0])[:, np.newaxis]
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+
+        return self.base_score + self.value[node] @ self.tree_weights
+
+    def predict_proba(self, X) -> np.ndarray:
+        if self.kind != 'classifier':
+            raise AttributeError("predict_proba is only available for classifiers")
+        raw = self.decision_function(X)
+        if raw.shape[1] == 1:
+            positive = 1.0 / (1.0 + np.exp(-raw[:, 0]))
+            return np.column_stack([1.0 - positive, positive])
+        raw = np.exp(raw - raw.max(axis=1, keepdims=True))
+        return raw / raw.sum(axis=1, keepdims=True)
+
+    def predict(self, X) -> np.ndarray:
+        if self.kind == 'classifier':
+            return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+        return self.decision_function(X)[:, 0]
+
+
+def compile_ensemble(model) -> CompiledTreeEnsemble:
+    """Compile a supported fitted scikit-learn ensemble"""
+    if isinstance(model, RandomForestRegressor):
+        return CompiledTreeEnsemble.from_random_forest(model)
+    if isinstance(model, (GradientBoostingClassifier, GradientBoostingRegressor)):
+        return CompiledTreeEnsemble.from_gradient_boosting(model)
+    raise TypeError(f"Cannot compile {type(model).__name__}")
+
+
+def max_prediction_error(compiled: CompiledTreeEnsemble, model, X: np.ndarray) -> float:
+    """Largest absolute difference between compiled and scikit-learn outputs on ``X``"""
+    if compiled.kind == 'classifier':
+        return float(np.max(np.abs(compiled.predict_proba(X) - model.predict_proba(X))))
+    return float(np.max(np.abs(compiled.predict(X) - model.predict(X))))
+
+
+def select_predictor(model, backend: str, X_check: np.ndarray, tolerance: float = 1e-6):
+    """Return the estimator to serve from: the compiled ensemble if requested and in parity, else ``model``"""
+    if backend not in INFERENCE_BACKENDS:
+        raise ValueError(f"Unknown inference backend '{backend}', expected one of {INFERENCE_BACKENDS}")
+    if backend != 'compiled':
+        return model
+
+    compiled = compile_ensemble(model)
+    error = max_prediction_error(compiled, model, X_check)
+    if error > tolerance:
+        logger.warning(f"Compiled {type(model).__name__} deviates by {error:.3g} > {tolerance:g}; serving with scikit-learn")
+        return model
+
+    logger.info(f"Compiled {type(model).__name__}: {compiled.node_count} nodes, depth {compiled.max_depth}, "
+                f"max error {error:.3g}")
+    return compiled
+
+
+def benchmark_single_row(predict, X: np.ndarray, iterations: int = 2000, warmup: int = 100) -> Dict[str, float]:
+    """Measure single-row latency percentiles in microseconds"""
+    rows = [X[i % len(X)][np.newaxis, :] for i in range(iterations + warmup)]
+    for row in rows[:warmup]:
+        predict(row)
+
+    timings = np.empty(iterations)
+    for i, row in enumerate(rows[warmup:]):
+        start = time.perf_counter_ns()
+        predict(row)
+        timings[i] = time.perf_counter_ns() - start
+
+    timings /= 1000.0
+    return {
+        'p50_us': round(float(np.percentile(timings, 50)), 1),
+        'p99_us': round(float(np.percentile(timings, 99)), 1),
+        'mean_us': round(float(timings.mean()), 1)
+    }
+
+
+if __name__ == "__main__":
+    import asyncio
+    from models.ai_models import SkillsAssessmentModel, CareerTransitionPredictor
+
+    async def _run_benchmarks():
+        skills_model = SkillsAssessmentModel()
+        transition_model = CareerTransitionPredictor()
+        await skills_model.initialize()
+        await transition_model.initialize()
+
+        cases = [
+            ('skills_assessment', skills_model.model, skills_model._prepare_features(skills_model._generate_training_data())[0], 'predict'),
+            ('career_transition', transition_model.model, transition_model._prepare_transition_features(transition_model._generate_transition_data())[0], 'predict_proba')
+        ]
+        for name, model, X, method in cases:
+            compiled = compile_ensemble(model)
+            print(f"{name}: max error {max_prediction_error(compiled, model, X):.3g}")
+            for label, estimator in (('sklearn', model), ('compiled', compiled)):
+                stats = benchmark_single_row(getattr(estimator, method), X)
+                print(f"  {label:<9} p50 {stats['p50_us']:>9.1f}us  p99 {stats['p99_us']:>9.1f}us")
+
+    asyncio.run(_run_benchmarks())
@@ -1,22 +1,61 @@
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import json
-import numpy as np
+import numbers
 from concurrent.futures import ThreadPoolExecutor
 import schedule
 import time
 from threading import Thread
 
+from models.categories import INDUSTRIES
+from utils.database import DatabaseManager
+from utils.lazy_imports import lazy_import
+from utils.metrics import HTTP_IN_FLIGHT, HTTP_LATENCY, ProcessSampler, latency_summary
+
+np = lazy_import('numpy')
+
 logger = logging.getLogger(__name__)
 
+# Models retrained incrementally: (model name, source table, row loader, frame builder)
+INCREMENTAL_MODELS = [
+    ('skills_assessment', 'skills_assessments', 'get_assessments_since', 'training_frame_from_assessments'),
+    ('career_transition', 'career_transitions', 'get_transitions_since', 'training_frame_from_transitions')
+]
+
+# Batch results are written through the bulk inserts in chunks of this many rows, one transaction each
+BULK_WRITE_ROWS = 10000
+
+# Monthly market figures the job market analyzer's snapshots are built from
+MARKET_FIELDS = ('job_postings', 'avg_salary', 'remote_percentage', 'ai_skill_demand')
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+def _monthly_market_rows(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Average the sources' reports into one market row per industry and month"""
+    grouped: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for record in records:
+        # Snapshots hold one row per month, so daily updates are dated to the first of their month
+        month = datetime.fromisoformat(record['data_date']).date().replace(day=1).isoformat()
+        grouped.setdefault((record['industry'], month), []).append(record)
+    return [
+        {'industry': industry, 'date': date,
+         **{field: sum(r[field] for r in reports) / len(reports) for field in MARKET_FIELDS}}
+        for (industry, date), reports in grouped.items()
+    ]
+
 class AutomationEngine:
-    def __init__(self):
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, model_provider: Any = None):
         self.is_running = False
         self.tasks = {}
         self.scheduler_thread = None
+        self.loop = None
         self.executor = ThreadPoolExecutor(max_workers=4)
+        # Serving models are fetched with ``await model_provider.get(name)`` (e.g. ModelBootstrapper)
+        self.db_manager = db_manager
+        self.model_provider = model_provider
         self.metrics = {
             'assessments_processed': 0,
             'data_updates_completed': 0,
@@ -24,11 +63,14 @@ class AutomationEngine:
             'errors_encountered': 0,
             'last_run_time': None
         }
+        self.process_sampler = ProcessSampler()
+        self._latency_totals = HTTP_LATENCY.totals()
         
-    def start(self):
-        """Start the automation engine"""
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start the automation engine; scheduled coroutines run on ``loop``"""
         if not self.is_running:
             self.is_running = True
+            self.loop = loop
             self._setup_scheduled_tasks()
             self.scheduler_thread = Thread(target=self._run_scheduler, daemon=True)
             self.scheduler_thread.start()
@@ -44,12 +86,12 @@ class AutomationEngine:
     def _setup_scheduled_tasks(self):
         """Setup scheduled automation tasks"""
         # Daily tasks
+        schedule.every().day.at("01:00").do(self._schedule_task, "daily_model_retrain", self.retrain_models)
         schedule.every().day.at("02:00").do(self._schedule_task, "daily_data_update", self.update_job_market_data)
         schedule.every().day.at("03:00").do(self._schedule_task, "daily_assessment_batch", self.run_batch_assessment)
         schedule.every().day.at("04:00").do(self._schedule_task, "daily_analytics_update", self.update_analytics_data)
         
         # Weekly tasks
-        schedule.every().monday.at("01:00").do(self._schedule_task, "weekly_model_retrain", self.retrain_models)
         schedule.every().sunday.at("23:00").do(self._schedule_task, "weekly_report", self.generate_weekly_report)
         
         # Hourly tasks
@@ -66,9 +108,12 @@ class AutomationEngine:
             'next_run': schedule.next_run()
         }
         
-        # Execute the task
+        # Execute the task (the scheduler thread has no loop of its own)
         try:
-            asyncio.create_task(task_func())
+            if self.loop is not None:
+                asyncio.run_coroutine_threadsafe(task_func(), self.loop)
+            else:
+                asyncio.create_task(task_func())
             self.tasks[task_name]['last_run'] = datetime.utcnow()
             self.tasks[task_name]['status'] = 'completed'
             logger.info(f"Task {task_name} completed successfully")
@@ -90,6 +135,7 @@ class AutomationEngine:
             
             # Simulate processing multiple user assessments
             batch_size = np.random.randint(50, 200)
+            results = []
             
             for i in range(batch_size):
                 # Simulate assessment processing
@@ -104,9 +150,12 @@ class AutomationEngine:
                     'recommendations_count': np.random.randint(3, 8)
                 }
                 
-                # Store result (in production, this would go to database)
-                await self._store_assessment_result(assessment_result)
+                results.append(assessment_result)
+                if len(results) >= BULK_WRITE_ROWS:
+                    await self._store_bulk('store_assessments_bulk', results)
+                    results = []
             
+            await self._store_bulk('store_assessments_bulk', results)
             self.metrics['assessments_processed'] += batch_size
             self.metrics['last_run_time'] = datetime.utcnow().isoformat()
             
@@ -129,24 +178,29 @@ class AutomationEngine:
                 'government_statistics'
             ]
             
-            updated_records = 0
+            market_data = []
+            data_date = datetime.utcnow().date().isoformat()
             
             for source in data_sources:
                 # Simulate API calls and data processing
                 await asyncio.sleep(2)
                 
-                # Generate mock market data
-                market_data = {
-                    'source': source,
-                    'timestamp': datetime.utcnow().isoformat(),
-                    'records_updated': np.random.randint(100, 1000),
-                    'industries_covered': np.random.randint(5, 8),
-                    'data_quality_score': np.random.uniform(0.85, 0.98)
-                }
-                
-                updated_records += market_data['records_updated']
-                await self._store_market_data(market_data)
+                # Generate mock market data, one record per industry the source covers
+                for industry in INDUSTRIES[:np.random.randint(5, 8)]:
+                    ai_skill_demand = float(np.random.uniform(40, 90))
+                    market_data.append({
+                        'industry': industry,
+                        'job_postings': int(np.random.randint(50000, 200000)),
+                        'avg_salary': round(float(np.random.uniform(60000, 120000)), 2),
+                        'remote_percentage': float(np.random.uniform(30, 80)),
+                        'ai_skill_demand': ai_skill_demand,
+                        'demand_score': round(ai_skill_demand / 10, 1),
+                        'data_date': data_date
+                    })
             
+            # All sources land in one transaction
+            updated_records = await self._store_bulk('store_market_data_bulk', market_data)
+            await self._refresh_market_snapshots(_monthly_market_rows(market_data))
             self.metrics['data_updates_completed'] += 1
             
             logger.info(f"Job market data update completed: {updated_records} records updated")
@@ -171,10 +225,10 @@ class AutomationEngine:
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            # Update industry-specific analytics
-            industries = ['cybersecurity', 'healthcare', 'manufacturing', 'finance', 'retail', 'education', 'logistics', 'legal']
+            metrics = self._metric_records('platform', analytics_data)
             
-            for industry in industries:
+            # Update industry-specific analytics
+            for industry in INDUSTRIES:
                 industry_analytics = {
                     'industry': industry,
                     'job_growth_rate': np.random.uniform(-5, 25),
@@ -184,9 +238,9 @@ class AutomationEngine:
                     'timestamp': datetime.utcnow().isoformat()
                 }
                 
-                await self._store_industry_analytics(industry_analytics)
+                metrics.extend(self._metric_records(f"industry.{industry}", industry_analytics))
             
-            await self._store_platform_analytics(analytics_data)
+            await self._store_bulk('store_metrics_bulk', metrics)
             
             logger.info("Analytics data update completed")
             
@@ -195,33 +249,41 @@ class AutomationEngine:
             self.metrics['errors_encountered'] += 1
     
     async def retrain_models(self):
-        """Retrain AI models with new data"""
+        """Incrementally retrain models on rows stored since the last watermark and hot-swap them"""
         try:
             logger.info("Starting model retraining")
             
-            models_to_retrain = [
-                'skills_assessment_model',
-                'career_transition_predictor',
-                'roi_calculator',
-                'training_recommendation_engine',
-                'job_market_analyzer'
-            ]
+            if self.db_manager is None or self.model_provider is None:
+                logger.warning("Model retraining skipped: no database or model provider attached")
+                return
             
-            for model_name in models_to_retrain:
-                # Simulate model retraining
-                await asyncio.sleep(5)  # Simulate training time
+            for model_name, source, load_rows, build_frame in INCREMENTAL_MODELS:
+                watermark = await self.db_manager.get_watermark(source)
+                rows = await getattr(self.db_manager, load_rows)(watermark)
+                if not rows:
+                    logger.info(f"Model {model_name}: no new rows in {source}")
+                    continue
+                
+                model = await self.model_provider.get(model_name)
+                training_start = datetime.utcnow().isoformat()
+                frame = getattr(model, build_frame)(rows)
+                outcome = await model.update_incremental(frame)
+                
+                # Rows that carry no usable label are consumed too, so they are not re-read
+                await self.db_manager.set_watermark(source, rows[-1]['id'])
                 
                 training_result = {
                     'model_name': model_name,
-                    'training_start': datetime.utcnow().isoformat(),
-                    'training_duration_minutes': np.random.randint(10, 60),
-                    'accuracy_improvement': np.random.uniform(0.01, 0.05),
-                    'data_points_used': np.random.randint(10000, 100000),
-                    'status': 'completed'
+                    'training_start': training_start,
+                    'rows_read': len(rows),
+                    'watermark': rows[-1]['id'],
+                    **outcome
                 }
                 
-                await self._store_training_result(training_result)
-                logger.info(f"Model {model_name} retrained successfully")
+                await self._store_bulk('store_metrics_bulk',
+                                       self._metric_records(f"model_training.{model_name}", training_result))
+                logger.info(f"Model {model_name} retraining {outcome['status']}: "
+                            f"{outcome['rows']} usable of {len(rows)} new rows")
             
             logger.info("Model retraining completed")
             
@@ -248,7 +310,7 @@ class AutomationEngine:
                 'generated_at': datetime.utcnow().isoformat()
             }
             
-            await self._store_weekly_report(weekly_report)
+            await self._store_bulk('store_metrics_bulk', self._metric_records('weekly_report', weekly_report))
             await self._send_report_notifications(weekly_report)
             
             logger.info("Weekly report generated and distributed")
@@ -260,15 +322,22 @@ class AutomationEngine:
     async def perform_health_check(self):
         """Perform system health check"""
         try:
+            # Latency is the mean over requests served since the previous check
+            latency = latency_summary(HTTP_LATENCY, since=self._latency_totals)
+            self._latency_totals = HTTP_LATENCY.totals()
+            process = self.process_sampler.sample()
+            
             health_status = {
                 'timestamp': datetime.utcnow().isoformat(),
                 'api_status': 'healthy',
-                'database_status': 'healthy',
-                'model_status': 'healthy',
-                'memory_usage': np.random.uniform(40, 80),
-                'cpu_usage': np.random.uniform(20, 60),
-                'response_time_ms': np.random.uniform(100, 500),
-                'active_connections': np.random.randint(50, 200)
+                'database_status': await self._check_database(),
+                'model_status': self._check_models(),
+                'memory_usage': process['memory_usage'],
+                'rss_mb': process['rss_mb'],
+                'cpu_usage': process['cpu_usage'],
+                'response_time_ms': latency['mean_ms'],
+                'requests_since_last_check': latency['count'],
+                'active_connections': int(sum(HTTP_IN_FLIGHT.values.values()))
             }
             
             # Check for any issues
@@ -280,40 +349,52 @@ class AutomationEngine:
                 health_status['alerts'] = health_status.get('alerts', []) + ['Slow response time']
                 await self._send_alert('Slow response time')
             
-            await self._store_health_check(health_status)
+            await self._store_bulk('store_metrics_bulk', self._metric_records('health_check', health_status))
             
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             self.metrics['errors_encountered'] += 1
     
-    async def _store_assessment_result(self, result: Dict[str, Any]):
-        """Store assessment result (mock implementation)"""
-        # In production, this would store to database
-        logger.debug(f"Stored assessment result for user {result['user_id']}")
-    
-    async def _store_market_data(self, data: Dict[str, Any]):
-        """Store market data (mock implementation)"""
-        logger.debug(f"Stored market data from {data['source']}")
-    
-    async def _store_industry_analytics(self, analytics: Dict[str, Any]):
-        """Store industry analytics (mock implementation)"""
-        logger.debug(f"Stored analytics for {analytics['industry']}")
+    async def _check_database(self) -> str:
+        if self.db_manager is None:
+            return 'not configured'
+        return 'healthy' if await self.db_manager.ping() else 'unhealthy'
     
-    async def _store_platform_analytics(self, analytics: Dict[str, Any]):
-        """Store platform analytics (mock implementation)"""
-        logger.debug("Stored platform analytics")
+    def _check_models(self) -> str:
+        if self.model_provider is None or not hasattr(self.model_provider, 'is_ready'):
+            return 'unknown'
+        return 'healthy' if self.model_provider.is_ready() else 'loading'
     
-    async def _store_training_result(self, result: Dict[str, Any]):
-        """Store model training result (mock implementation)"""
-        logger.debug(f"Stored training result for {result['model_name']}")
+    async def _refresh_market_snapshots(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """Feed new monthly market rows to the job market analyzer so served snapshots stay current"""
+        if not rows or self.model_provider is None:
+            return []
+        analyzer = await self.model_provider.get('job_market')
+        refreshed = analyzer.ingest_market_rows(rows)
+        logger.info(f"Refreshed market snapshots for {len(refreshed)} industries")
+        return refreshed
     
-    async def _store_weekly_report(self, report: Dict[str, Any]):
-        """Store weekly report (mock implementation)"""
-        logger.debug("Stored weekly report")
+    def _metric_records(self, prefix: str, values: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """One platform metric per numeric field of ``values``; the other fields are kept as metric_data"""
+        details = {key: value for key, value in values.items() if not _is_number(value)}
+        return [
+            {'metric_name': f"{prefix}.{key}", 'metric_value': float(value), 'metric_data': details}
+            for key, value in values.items() if _is_number(value)
+        ]
     
-    async def _store_health_check(self, health: Dict[str, Any]):
-        """Store health check result (mock implementation)"""
-        logger.debug("Stored health check result")
+    async def _store_bulk(self, method: str, rows: List[Dict[str, Any]]) -> int:
+        """Write ``rows`` in one transaction through the named DatabaseManager bulk insert"""
+        if not rows:
+            return 0
+        if self.db_manager is None:
+            logger.debug(f"No database attached; {len(rows)} rows for {method} not stored")
+            return 0
+        
+        written = await getattr(self.db_manager, method)(rows)
+        if written != len(rows):
+            self.metrics['errors_encountered'] += 1
+            logger.warning(f"{method} wrote {written} of {len(rows)} rows")
+        return written
     
     async def _send_report_notifications(self, report: Dict[str, Any]):
         """Send report notifications (mock implementation)"""
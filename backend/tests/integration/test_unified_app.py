@@ -0,0 +1,217 @@
+import asyncio
+import io
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import unified_app
+from utils.roi_sweep import SweepAxis
+
+
+@pytest.fixture
+def client():
+    unified_app.result_cache.invalidate()
+    return TestClient(unified_app.app)
+
+
+# Responses of the uncached baseline models; industry lookups are case-sensitive there
+ASSESS_CASES = [
+    ({'current_industry': 'Finance', 'skills': ['data-analysis', 'ai-ml'], 'experience_years': '3-5'},
+     58.3, 'Finance', ['Advance technical skills', 'Pursue certifications']),
+    ({'current_industry': 'finance', 'skills': ['ai-ml', 'data-analysis'], 'experience_years': '3-5'},
+     78.3, 'finance', ['Ready for leadership roles', 'Explore emerging technologies']),
+    ({'current_industry': ' finance', 'skills': ['ai-ml', 'data-analysis'], 'experience_years': '3-5',
+      'target_industry': 'Healthcare'},
+     58.3, 'Healthcare', ['Advance technical skills', 'Pursue certifications'])
+]
+
+
+@pytest.mark.parametrize("payload, score, industry, recommendations", ASSESS_CASES)
+def test_assessment_matches_baseline_cached_or_not(client, payload, score, industry, recommendations):
+    # Warm the cache with every case first, so a result shared between cases would show up
+    for other, *_ in ASSESS_CASES:
+        client.post("/api/assess", json=other)
+
+    for _ in range(2):
+        body = client.post("/api/assess", json=payload).json()
+        assert body['overall_score'] == score
+        assert body['recommendations'] == recommendations
+        assert {opportunity['industry'] for opportunity in body['transition_opportunities']} == {industry}
+
+
+def test_roi_matches_baseline_for_differently_cased_industries(client):
+    for industry, roi in (('Finance', 250.0), ('finance', 370.0), ('Finance', 250.0)):
+        body = client.post("/api/roi/calculate", json={
+            'industry': industry, 'employee_count': 100, 'training_budget': 50000, 'current_avg_salary': 60000
+        }).json()
+        assert body == {'traditional_cost': 250000, 'ai_enhanced_cost': 175000.0, 'cost_savings': 75000.0,
+                        'roi_percentage': roi, 'payback_months': 28, 'productivity_increase': roi}
+
+
+def test_transition_matches_baseline(client):
+    for current, probability in (('Cybersecurity', 0.7), ('cybersecurity', 0.95)):
+        body = client.get(f"/api/transition/emp-1/finance?current_industry={current}&skills=a,b").json()
+        assert body['success_probability'] == probability
+        assert body['required_skills'] == ['Financial Analysis', 'Risk Assessment', 'Regulations']
+
+
+def test_cache_serves_repeated_requests(client):
+    payload = ASSESS_CASES[0][0]
+    before = client.get("/api/cache/stats").json()
+    client.post("/api/assess", json=payload)
+    client.post("/api/assess", json=payload)
+
+    stats = client.get("/api/cache/stats").json()
+    assert stats['hits'] - before['hits'] == 1
+    assert stats['misses'] - before['misses'] == 1
+
+
+
+
+def test_model_executor_runs_only_measured_cheap_calls_inline():
+    executor = unified_app.BoundedModelExecutor(max_workers=2, queue_limit=4, queue_timeout=1, inline_max_seconds=0.002)
+
+    def cheap():
+        return threading.current_thread().name
+
+    def slow():
+        time.sleep(0.005)
+        return threading.current_thread().name
+
+    async def scenario():
+        return [await executor.run_inline(func) for func in (cheap, cheap, slow, slow)]
+
+    try:
+        first_cheap, second_cheap, first_slow, second_slow = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+    # Unmeasured calls go to the pool; only those measured below the threshold then run on the loop
+    assert first_cheap.startswith('model') and second_cheap == threading.main_thread().name
+    assert first_slow.startswith('model') and second_slow.startswith('model')
+    assert executor.inline == 1
+
+def test_roi_sweep_matches_single_calculations(client):
+    payload = {'industries': ['Finance', 'finance'], 'employee_counts': {'values': [100, 250]},
+               'training_budgets': {'values': [50000]}, 'reductions': ['max_roi']}
+    body = client.post("/api/roi/sweep", json=payload).json()
+    assert body['shape'] == [2, 2, 1] and body['scenarios'] == 4
+    assert body['columns']['roi_percentage'][::2] == [250.0, 370.0]
+
+    archive = np.load(io.BytesIO(client.post("/api/roi/sweep", json={**payload, 'format': 'npz'}).content))
+    assert archive['roi_percentage'].shape == (2, 2, 1)
+
+    for bad in ({'reductions': ['median']}, {'format': 'csv'}):
+        assert client.post("/api/roi/sweep", json={**payload, **bad}).status_code == 422
+
+
+@pytest.mark.parametrize("axis", [{'start': 1, 'stop': 10, 'num': 10 ** 10}, {'start': 1, 'stop': 10, 'num': 0},
+                                  {'start': 1, 'stop': 10, 'num': 600_000}])
+def test_roi_sweep_rejects_oversized_axes_before_building_them(client, monkeypatch, axis):
+    monkeypatch.setattr(SweepAxis, 'to_array', lambda self: pytest.fail("axis built for a rejected sweep"))
+    response = client.post("/api/roi/sweep", json={'industries': ['Finance', 'finance'], 'employee_counts': axis})
+    assert response.status_code == 422
+
+
+def test_roi_sweep_rejects_unknown_reductions_before_evaluating(client, monkeypatch):
+    monkeypatch.setattr(unified_app.ai_models, 'calculate_roi_grid',
+                        lambda *args: pytest.fail("grid evaluated for a rejected sweep"))
+    response = client.post("/api/roi/sweep", json={'employee_counts': {'values': [100]}, 'reductions': ['median']})
+    assert response.status_code == 422
+    assert "Unknown reduction 'median'" in response.json()['detail']
+
+def test_model_executor_admission():
+    executor = unified_app.BoundedModelExecutor(max_workers=1, queue_limit=1, queue_timeout=0.05)
+    release = threading.Event()
+
+    async def scenario():
+        # A pool call holds the only slot, so an inline call must wait for it
+        blocker = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.01)
+        waiting = asyncio.ensure_future(executor.run_inline(len, 'abc'))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as rejected:
+            await executor.run_inline(len, 'abc')
+        with pytest.raises(HTTPException) as timed_out:
+            await waiting
+        release.set()
+        await blocker
+        return rejected.value.status_code, timed_out.value.status_code, await executor.run_inline(len, 'abc')
+
+    try:
+        assert asyncio.run(scenario()) == (429, 503, 3)
+    finally:
+        release.set()
+        executor.shutdown()
+    assert (executor.rejected, executor.timed_out, executor.completed) == (1, 1, 2)
+    assert (executor.pending, executor.running) == (0, 0)
+
+
+def test_metrics_use_the_shared_backend_registry(client):
+    from utils.metrics import HTTP_REQUESTS, registry
+    before = HTTP_REQUESTS.values.get(('POST', '/api/assess', '200'), 0)
+    client.post("/api/assess", json=ASSESS_CASES[0][0])
+    assert HTTP_REQUESTS.values[('POST', '/api/assess', '200')] == before + 1
+
+    body = client.get("/metrics").text
+    assert body.startswith(registry.render())
+    assert 'model_inference_duration_seconds_count{model="unified",operation="assess_skills"}' in body
+    assert "result_cache_hits_total" in body
+
+
+def test_unified_app_imports_from_the_docker_image_layout(tmp_path):
+    # Rebuild /app from the root Dockerfile's COPY lines, so a new import of the repo fails here
+    root = Path(unified_app.__file__).resolve().parent
+    app_dir = tmp_path / 'app'
+    app_dir.mkdir()
+    for line in (root / 'Dockerfile').read_text().splitlines():
+        if line.startswith('COPY '):
+            source, target = line.split()[1:3]
+            destination = app_dir / target
+            if (root / source).is_dir():
+                shutil.copytree(root / source, destination, dirs_exist_ok=True)
+            else:
+                shutil.copy(root / source, destination)
+
+    env = {key: value for key, value in os.environ.items() if key != 'PYTHONPATH'}
+    result = subprocess.run([sys.executable, '-c', 'import unified_app'], cwd=app_dir, env=env,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_failing_worker_exits_without_running_supervisor_cleanup(tmp_path):
+    # In a separate interpreter, so a regression cannot fork a stray copy of the test run
+    script = (
+        "import os, sys\n"
+        f"sys.path[:0] = [{str(Path(unified_app.__file__).resolve().parent)!r}]\n"
+        "import unified_app\n"
+        "supervisor_pid = os.getpid()\n"
+        "class Failing(unified_app.WorkerSupervisor):\n"
+        "    def _serve_worker(self, ready_fd):\n"
+        "        raise RuntimeError('worker failed to start')\n"
+        "supervisor = Failing('127.0.0.1', 0, 1, ready_timeout=10, graceful_timeout=1)\n"
+        "try:\n"
+        "    print('spawned', supervisor._spawn(), flush=True)\n"
+        "finally:\n"
+        "    print('cleanup in', 'supervisor' if os.getpid() == supervisor_pid else 'worker', flush=True)\n"
+    )
+    result = subprocess.run([sys.executable, '-c', script], cwd=tmp_path, capture_output=True, text=True, timeout=60)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == ['spawned False', 'cleanup in supervisor']
+    assert 'worker failed to start' in result.stderr
+
+
+@pytest.mark.parametrize("dev_mode", [False, True])
+@pytest.mark.parametrize("path", ["/app.js%00", "/static/app.js%00.png", "/static/css/%00index.html"])
+def test_static_paths_with_nul_bytes_are_not_found(client, monkeypatch, dev_mode, path):
+    monkeypatch.setattr(unified_app.static_assets, 'dev_mode', dev_mode)
+    assert client.get(path).status_code == 404
@@ -0,0 +1,51 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from models.bootstrap import ModelBootstrapper, ModelNotReadyError, _initialize_in_worker
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    # Read by Settings in this process and inherited by the spawned pool workers
+    monkeypatch.setenv('MODEL_CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+
+def test_worker_persists_artifact_backed_models_instead_of_returning_them(cache_dir):
+    model, elapsed = _initialize_in_worker('skills_assessment')
+
+    assert model is None
+    assert elapsed > 0
+    assert list(cache_dir.glob('skills_assessment-*.joblib'))
+
+
+def test_worker_returns_models_without_artifacts(cache_dir):
+    model, _ = _initialize_in_worker('roi_calculator')
+
+    assert model.is_ready
+
+
+def test_bootstrapper_loads_persisted_artifacts_memory_mapped(cache_dir, monkeypatch):
+    monkeypatch.setenv('INFERENCE_BACKEND', 'table')
+
+    async def bootstrap():
+        bootstrapper = ModelBootstrapper(names=['skills_assessment', 'roi_calculator'], max_workers=2)
+        bootstrapper.start()
+        try:
+            skills = await bootstrapper.get('skills_assessment', timeout=120)
+            await bootstrapper.get('roi_calculator', timeout=120)
+            with pytest.raises(ModelNotReadyError):
+                await bootstrapper.get('job_market')
+            return skills, bootstrapper.readiness()
+        finally:
+            await bootstrapper.shutdown()
+
+    skills, readiness = asyncio.run(bootstrap())
+
+    assert readiness['ready']
+    assert readiness['models']['skills_assessment']['load_seconds'] is not None
+    assert readiness['models']['roi_calculator']['load_seconds'] is None
+    # The prediction table is served straight from the artifact file
+    assert isinstance(skills.predictor.values, np.memmap)
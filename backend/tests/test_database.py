@@ -0,0 +1,91 @@
+import asyncio
+import importlib
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+
+from utils.database import DatabaseManager, decode_cursor, encode_cursor, explain_query_plans, full_scan_steps
+from utils.migrations import apply_migrations
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # DatabaseManager opens workforce_transformer.db in the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('DB_PAGE_SIZE', '2')
+    return tmp_path
+
+
+def _history(rows):
+    return [{'user_id': user_id, 'overall_score': score, 'industry': 'finance'} for user_id, score in rows]
+
+
+async def _with_history(scenario, rows):
+    db = DatabaseManager()
+    try:
+        await db.store_assessments_bulk(_history(rows))
+        return await scenario(db)
+    finally:
+        await db.close()
+
+
+def test_get_user_assessments_returns_the_whole_history(workdir):
+    rows = [('u1', float(score)) for score in range(5)] + [('u2', 99.0)]
+
+    async def scenario(db):
+        first_page = await db.get_user_assessments_page('u1')
+        return first_page, await db.get_user_assessments('u1'), await db.get_user_assessments('u1', summary_only=True)
+
+    first_page, history, summaries = asyncio.run(_with_history(scenario, rows))
+
+    assert len(first_page['assessments']) == 2 and first_page['next_cursor']
+    # Rows stored within one second tie on created_at; id breaks the tie
+    assert [a['overall_score'] for a in history] == [4.0, 3.0, 2.0, 1.0, 0.0]
+    assert all(a['assessment_data']['user_id'] == 'u1' for a in history)
+    assert [a['overall_score'] for a in summaries] == [4.0, 3.0, 2.0, 1.0, 0.0]
+    assert 'assessment_data' not in summaries[0]
+
+
+@pytest.mark.parametrize("cursor", ['|', 'no-separator', '2024-01-01 00:00:00|x', 'yesterday|3'])
+def test_malformed_cursor_raises(workdir, cursor):
+    async def scenario(db):
+        return await db.get_user_assessments_page('u1', cursor)
+
+    with pytest.raises(ValueError, match="Malformed assessment cursor"):
+        asyncio.run(_with_history(scenario, [('u1', 1.0)]))
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor('2024-01-01 12:30:00', 7)) == ('2024-01-01 12:30:00', 7)
+
+
+def test_summary_pages_read_only_the_index(tmp_path):
+    conn = sqlite3.connect(tmp_path / 'plans.db')
+    apply_migrations(conn)
+    plans = explain_query_plans(conn)
+    conn.close()
+
+    for name in ('get_user_assessments_page[summary]', 'get_user_assessments_page[summary,cursor]'):
+        assert any('COVERING INDEX idx_skills_assessments_user_created_score' in step for step in plans[name])
+    assert not any(full_scan_steps(plan) for plan in plans.values())
+
+
+def test_history_endpoint_maps_malformed_cursor_to_400(workdir, monkeypatch):
+    main = importlib.import_module('main')
+    db = DatabaseManager()
+    monkeypatch.setattr(main, 'db_manager', db)
+    client = TestClient(main.app)
+    asyncio.run(db.store_assessments_bulk(_history([('u1', 1.0), ('u1', 2.0), ('u1', 3.0)])))
+
+    try:
+        page = client.get("/api/users/u1/assessments", params={'summary': True}).json()
+        assert [a['overall_score'] for a in page['assessments']] == [3.0, 2.0]
+        rest = client.get("/api/users/u1/assessments", params={'cursor': page['next_cursor']}).json()
+        assert [a['overall_score'] for a in rest['assessments']] == [1.0]
+
+        response = client.get("/api/users/u1/assessments", params={'cursor': 'not-a-cursor'})
+        assert response.status_code == 400
+        assert "Malformed assessment cursor" in response.json()['detail']
+    finally:
+        asyncio.run(db.close())
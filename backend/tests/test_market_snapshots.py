@@ -0,0 +1,112 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from models.ai_models import JobMarketAnalyzer
+from models.market_snapshots import HISTORY_MONTHS
+from services import automation_engine
+from services.automation_engine import AutomationEngine
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = JobMarketAnalyzer()
+    asyncio.run(analyzer.initialize())
+    return analyzer
+
+
+class StaticModelProvider:
+    def __init__(self, **models):
+        self.models = models
+
+    async def get(self, name, timeout=None):
+        return self.models[name]
+
+
+def test_ingested_rows_change_the_served_analysis(analyzer):
+    before = asyncio.run(analyzer.analyze_market('finance'))
+    overall_before = asyncio.run(analyzer.analyze_market('unknown-industry'))
+
+    refreshed = analyzer.ingest_market_rows([{
+        'industry': 'finance', 'date': datetime.utcnow().date().isoformat(),
+        'job_postings': 400000, 'avg_salary': 250000, 'remote_percentage': 95.0, 'ai_skill_demand': 90.0
+    }])
+    after = asyncio.run(analyzer.analyze_market('finance'))
+
+    assert refreshed == ['finance']
+    assert after['as_of'] == datetime.utcnow().date().replace(day=1).isoformat() != before['as_of']
+    assert after['salary_trends']['current_avg'] == 250000
+    assert after['location_data']['remote_percentage'] == 95.0
+    assert after['growth_forecast'] > before['growth_forecast']
+    # The cross-industry snapshot served for unknown industries is refreshed too
+    assert asyncio.run(analyzer.analyze_market('unknown-industry')) != overall_before
+
+
+def test_market_data_update_refreshes_analyzer_snapshots(analyzer, monkeypatch):
+    async def no_wait(seconds):
+        pass
+    monkeypatch.setattr(automation_engine.asyncio, 'sleep', no_wait)
+    before = {industry: asyncio.run(analyzer.analyze_market(industry)) for industry in automation_engine.INDUSTRIES}
+
+    engine = AutomationEngine(model_provider=StaticModelProvider(job_market=analyzer))
+    asyncio.run(engine.update_job_market_data())
+
+    this_month = datetime.utcnow().date().replace(day=1).isoformat()
+    updated = [industry for industry in automation_engine.INDUSTRIES
+               if asyncio.run(analyzer.analyze_market(industry)) != before[industry]]
+    assert engine.metrics['errors_encountered'] == 0
+    # Every source covers at least the first five industries
+    assert set(automation_engine.INDUSTRIES[:5]) <= set(updated)
+    assert all(asyncio.run(analyzer.analyze_market(industry))['as_of'] == this_month for industry in updated)
+
+
+
+def test_daily_rows_replace_their_month_instead_of_growing_the_window(analyzer):
+    month = datetime.utcnow().date().replace(day=1)
+    rows = [{'industry': 'finance', 'date': month.replace(day=day).isoformat(), 'job_postings': 300000 + day * 1000,
+             'avg_salary': 120000 + day * 100, 'remote_percentage': 40.0, 'ai_skill_demand': 70.0}
+            for day in (1, 8, 15, 22, 28)]
+    reference = JobMarketAnalyzer()
+    asyncio.run(reference.initialize())
+    reference.ingest_market_rows(rows[-1:])
+
+    for row in rows:
+        analyzer.ingest_market_rows([row])
+
+    history = analyzer.market._history['finance']
+    assert len(history) == HISTORY_MONTHS
+    assert history[-1][0].date() == month and history[-2][0].date() < month
+    served, expected = (asyncio.run(model.analyze_market('finance')) for model in (analyzer, reference))
+    assert served['months_of_history'] == HISTORY_MONTHS
+    assert served['growth_forecast'] == expected['growth_forecast']
+    assert served['salary_trends'] == expected['salary_trends']
+
+
+def test_market_update_rows_are_keyed_by_month():
+    reports = [{'industry': 'finance', 'data_date': date, 'job_postings': postings, 'avg_salary': 1.0,
+                'remote_percentage': 1.0, 'ai_skill_demand': 1.0}
+               for date, postings in (('2026-10-03', 100), ('2026-10-17', 300), ('2026-09-30', 50))]
+
+    rows = automation_engine._monthly_market_rows(reports)
+
+    assert sorted((row['date'], row['job_postings']) for row in rows) == [('2026-09-01', 50), ('2026-10-01', 200)]
+
+
+def test_predict_salary_falls_back_without_salary_data(analyzer):
+    analyzer.market.salaries.clear()
+
+    estimate = asyncio.run(analyzer.predict_salary('unknown-industry', ['ai-ml', 'sql'], '3-5'))
+
+    # Baseline formula: 70000 default base x 1.2 for 3-5 years + 2000 per skill, 15% uplift with training
+    assert estimate == {'current_estimate': 88000.0, 'with_training': 101200.0, 'increase': 13200.0}
+    assert asyncio.run(analyzer.predict_salary('finance', [], '6-10'))['current_estimate'] == 135000.0
+
+
+def test_predict_salary_uses_salary_bands_when_loaded(analyzer):
+    base, with_ai = analyzer.market.salary_band('finance', '3-5')
+
+    estimate = asyncio.run(analyzer.predict_salary('finance', ['ai-ml'], '3-5'))
+
+    assert estimate['current_estimate'] == round(base + 2000, 0)
+    assert estimate['with_training'] == round((base + 2000) * with_ai / base, 0)
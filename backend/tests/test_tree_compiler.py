@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingClassifier, GradientBoostingRegressor, RandomForestRegressor
+
+from models.tree_compiler import compile_ensemble, max_prediction_error, select_predictor
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(7)
+    X = rng.random((400, 12)).astype(np.float32)
+    y = X[:, 0] * 40 + X[:, 3] * 25 + rng.normal(0, 2, 400)
+    # Fixed probe set: unseen rows plus training rows, whose values sit exactly on split thresholds
+    probe = np.vstack([rng.random((200, 12)).astype(np.float32), X[:100]])
+    return X, y, probe
+
+
+def test_random_forest_matches_sklearn(data):
+    X, y, probe = data
+    model = RandomForestRegressor(n_estimators=25, max_depth=8, random_state=0).fit(X, y)
+    compiled = compile_ensemble(model)
+
+    np.testing.assert_allclose(compiled.predict(probe), model.predict(probe), rtol=0, atol=1e-9)
+    assert compiled.predict(probe[0]).shape == (1,)
+
+
+def test_gradient_boosting_regressor_matches_sklearn(data):
+    X, y, probe = data
+    model = GradientBoostingRegressor(n_estimators=40, max_depth=4, random_state=0).fit(X, y)
+
+    np.testing.assert_allclose(compile_ensemble(model).predict(probe), model.predict(probe), rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+def test_gradient_boosting_classifier_matches_sklearn(data, n_classes):
+    X, y, probe = data
+    labels = np.digitize(y, np.quantile(y, np.linspace(0, 1, n_classes + 1)[1:-1]))
+    model = GradientBoostingClassifier(n_estimators=30, max_depth=3, random_state=0).fit(X, labels)
+    compiled = compile_ensemble(model)
+
+    np.testing.assert_allclose(compiled.predict_proba(probe), model.predict_proba(probe), rtol=0, atol=1e-9)
+    np.testing.assert_array_equal(compiled.predict(probe), model.predict(probe))
+
+
+def test_select_predictor_serves_compiled_only_when_requested(data):
+    X, y, probe = data
+    model = RandomForestRegressor(n_estimators=5, random_state=0).fit(X, y)
+
+    assert select_predictor(model, 'sklearn', X) is model
+    compiled = select_predictor(model, 'compiled', X)
+    assert compiled is not model
+    assert max_prediction_error(compiled, model, probe) < 1e-9
+    with pytest.raises(ValueError):
+        select_predictor(model, 'gpu', X)
+
+
+def test_select_predictor_falls_back_when_out_of_parity(data):
+    X, y, _ = data
+    model = RandomForestRegressor(n_estimators=5, random_state=0).fit(X, y)
+
+    assert select_predictor(model, 'compiled', X, tolerance=-1.0) is model
+
+
+PROFILES = [
+    ('finance', 'healthcare', '0-2', ['data-analysis']),
+    ('cybersecurity', None, '3-5', ['ai-ml', 'critical-thinking', 'communication']),
+    ('manufacturing', 'logistics', '6-10', ['process-automation', 'project-management', 'adaptability', 'ai-ml']),
+    ('legal', 'finance', '10+', [])
+]
+
+
+def _initialized(model_cls, backend, cache_dir):
+    import asyncio
+    from models.artifact_store import ModelArtifactStore
+
+    model = model_cls(artifact_store=ModelArtifactStore(str(cache_dir)), inference_backend=backend)
+    model.training_rows = 800
+    asyncio.run(model.initialize())
+    assert model.is_ready
+    return model
+
+
+def _assert_close(actual, expected):
+    """Equal structure and values; floats may differ in the last bits from summation order"""
+    if isinstance(expected, dict):
+        assert actual.keys() == expected.keys()
+        for key in expected:
+            _assert_close(actual[key], expected[key])
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for a, e in zip(actual, expected):
+            _assert_close(a, e)
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9)
+    else:
+        assert actual == expected
+
+
+def _seeded(coroutine_fn, *args):
+    import asyncio
+
+    # Skill-gap importance, salary change and training time are drawn from np.random
+    np.random.seed(0)
+    return asyncio.run(coroutine_fn(*args))
+
+
+def test_compiled_backend_serves_same_assessments_as_sklearn(tmp_path):
+    from models.ai_models import CareerTransitionPredictor, SkillsAssessmentModel
+
+    for model_cls in (SkillsAssessmentModel, CareerTransitionPredictor):
+        # Both load the same fitted artifact, so any difference comes from the serving path
+        reference = _initialized(model_cls, 'sklearn', tmp_path)
+        compiled = _initialized(model_cls, 'compiled', tmp_path)
+        assert compiled.predictor is not compiled.model
+
+        for current, target, experience, skills in PROFILES:
+            if model_cls is SkillsAssessmentModel:
+                expected = _seeded(reference.assess_skills, current, target, experience, skills)
+                actual = _seeded(compiled.assess_skills, current, target, experience, skills)
+            else:
+                expected = _seeded(reference.predict_transitions, current, skills, experience)
+                actual = _seeded(compiled.predict_transitions, current, skills, experience)
+            _assert_close(actual, expected)
@@ -11,4 +11,16 @@ class Settings:
         self.redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
         self.openai_api_key = os.getenv("OPENAI_API_KEY", "")
         self.model_cache_dir = os.getenv("MODEL_CACHE_DIR", "./models/cache")
+        self.inference_backend = os.getenv("INFERENCE_BACKEND", "sklearn")
+        self.model_ready_timeout = float(os.getenv("MODEL_READY_TIMEOUT", "120"))
         self.data_dir = os.getenv("DATA_DIR", "../")
+        self.db_pool_size = int(os.getenv("DB_POOL_SIZE", "4"))
+        self.db_synchronous = os.getenv("DB_SYNCHRONOUS", "NORMAL")
+        self.db_cache_size_kb = int(os.getenv("DB_CACHE_SIZE_KB", "16000"))
+        self.db_mmap_size_mb = int(os.getenv("DB_MMAP_SIZE_MB", "256"))
+        self.db_busy_timeout_ms = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))
+        self.db_write_batch_rows = int(os.getenv("DB_WRITE_BATCH_ROWS", "500"))
+        self.db_write_batch_ms = float(os.getenv("DB_WRITE_BATCH_MS", "0"))
+        self.db_write_queue_limit = int(os.getenv("DB_WRITE_QUEUE_LIMIT", "10000"))
+        self.db_page_size = int(os.getenv("DB_PAGE_SIZE", "50"))
+        self.db_max_page_size = int(os.getenv("DB_MAX_PAGE_SIZE", "500"))
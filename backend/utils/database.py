@@ -1,190 +1,420 @@
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import json
 import sqlite3
 from pathlib import Path
 
+from utils.config import Settings
+from utils.metrics import DB_QUERY, timed
+from utils.migrations import apply_migrations, schema_version
+from utils.sqlite_pool import SQLitePool
+from utils.write_queue import WriteBehindQueue
+
 logger = logging.getLogger(__name__)
 
+INSERT_USER_SQL = '''
+    INSERT OR REPLACE INTO users (user_id, email, industry, experience_level)
+    VALUES (?, ?, ?, ?)
+'''
+
+INSERT_ASSESSMENT_SQL = '''
+    INSERT INTO skills_assessments (user_id, assessment_data, overall_score, industry)
+    VALUES (?, ?, ?, ?)
+'''
+
+INSERT_MARKET_DATA_SQL = '''
+    INSERT INTO job_market_data (industry, job_postings, avg_salary, demand_score, data_date)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+INSERT_METRIC_SQL = '''
+    INSERT INTO platform_metrics (metric_name, metric_value, metric_data)
+    VALUES (?, ?, ?)
+'''
+
+def user_assessments_sql(summary_only: bool, after_cursor: bool) -> str:
+    """Newest-first page of one user's assessments; summary pages never read the assessment_data blob"""
+    # Index (user_id, created_at, id, overall_score): the page is an index seek with no sort, and
+    # summary pages are answered from the index alone
+    return f'''
+    SELECT id, created_at, overall_score{'' if summary_only else ', assessment_data'}
+    FROM skills_assessments
+    WHERE user_id = ?{' AND (created_at, id) < (?, ?)' if after_cursor else ''}
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+'''
+
+SELECT_USER_ASSESSMENTS_SQL = {
+    (summary_only, after_cursor): user_assessments_sql(summary_only, after_cursor)
+    for summary_only in (False, True) for after_cursor in (False, True)
+}
+
+SELECT_ASSESSMENTS_SINCE_SQL = '''
+    SELECT id, user_id, assessment_data, overall_score, industry, created_at
+    FROM skills_assessments
+    WHERE id > ?
+    ORDER BY id
+    LIMIT ?
+'''
+
+SELECT_TRANSITIONS_SINCE_SQL = '''
+    SELECT ct.id, ct.user_id, ct.from_industry, ct.to_industry, ct.status,
+           u.experience_level,
+           (SELECT sa.assessment_data FROM skills_assessments sa
+            WHERE sa.user_id = ct.user_id
+            ORDER BY sa.created_at DESC LIMIT 1)
+    FROM career_transitions ct
+    LEFT JOIN users u ON u.user_id = ct.user_id
+    WHERE ct.id > ?
+    ORDER BY ct.id
+    LIMIT ?
+'''
+
+SELECT_WATERMARK_SQL = 'SELECT last_id FROM retraining_watermarks WHERE source = ?'
+
+UPSERT_WATERMARK_SQL = '''
+    INSERT OR REPLACE INTO retraining_watermarks (source, last_id, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+'''
+
+PING_SQL = 'SELECT 1'
+
+# Every statement DatabaseManager issues, keyed by the method (and DB_QUERY label) that issues it;
+# ``python -m utils.database --explain`` prints their query plans
+QUERIES = {
+    'store_user': INSERT_USER_SQL,
+    'store_assessment': INSERT_ASSESSMENT_SQL,
+    'store_market_data_bulk': INSERT_MARKET_DATA_SQL,
+    'store_metrics_bulk': INSERT_METRIC_SQL,
+    'get_user_assessments_page': SELECT_USER_ASSESSMENTS_SQL[False, False],
+    'get_user_assessments_page[cursor]': SELECT_USER_ASSESSMENTS_SQL[False, True],
+    'get_user_assessments_page[summary]': SELECT_USER_ASSESSMENTS_SQL[True, False],
+    'get_user_assessments_page[summary,cursor]': SELECT_USER_ASSESSMENTS_SQL[True, True],
+    'get_assessments_since': SELECT_ASSESSMENTS_SINCE_SQL,
+    'get_transitions_since': SELECT_TRANSITIONS_SINCE_SQL,
+    'get_watermark': SELECT_WATERMARK_SQL,
+    'set_watermark': UPSERT_WATERMARK_SQL,
+    'ping': PING_SQL
+}
+
+# Plan steps that read a whole table or index, or sort rows, instead of seeking
+FULL_SCAN_STEPS = ('SCAN ', 'USE TEMP B-TREE')
+
+def explain_query_plans(conn: sqlite3.Connection) -> Dict[str, List[str]]:
+    """``EXPLAIN QUERY PLAN`` steps for every query in ``QUERIES``, with NULL for each parameter"""
+    plans = {}
+    for name, sql in QUERIES.items():
+        rows = conn.execute(f'EXPLAIN QUERY PLAN {sql}', (None,) * sql.count('?')).fetchall()
+        plans[name] = [row[-1] for row in rows]
+    return plans
+
+def encode_cursor(created_at: str, row_id: int) -> str:
+    """Opaque keyset cursor for the row after which the next page starts"""
+    return f"{created_at}|{row_id}"
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Inverse of ``encode_cursor``; ValueError for anything it could not have produced"""
+    try:
+        created_at, row_id = cursor.rsplit('|', 1)
+        datetime.fromisoformat(created_at)
+        return created_at, int(row_id)
+    except ValueError:
+        raise ValueError(f"Malformed assessment cursor: {cursor!r}") from None
+
+def full_scan_steps(plan: List[str]) -> List[str]:
+    """Steps of a query plan that scan or sort rather than use an index"""
+    return [step for step in plan if step.startswith(FULL_SCAN_STEPS) and step != 'SCAN CONSTANT ROW']
+
 class DatabaseManager:
-    def __init__(self, database_url: str = "sqlite:///workforce_transformer.db"):
+    def __init__(self, database_url: str = "sqlite:///workforce_transformer.db", settings: Optional[Settings] = None):
+        settings = settings or Settings()
         self.database_url = database_url
         self.db_path = Path("workforce_transformer.db")
+        self.page_size = settings.db_page_size
+        self.max_page_size = settings.db_max_page_size
+        self.pool = SQLitePool(self.db_path, size=settings.db_pool_size, pragmas={
+            'synchronous': settings.db_synchronous,
+            'cache_size': -settings.db_cache_size_kb,
+            'mmap_size': settings.db_mmap_size_mb * 1024 * 1024,
+            'busy_timeout': settings.db_busy_timeout_ms
+        })
+        # User and assessment inserts are group-committed by a single writer task
+        self.write_queue = WriteBehindQueue(self.pool, batch_rows=settings.db_write_batch_rows,
+                                            batch_ms=settings.db_write_batch_ms,
+                                            max_pending=settings.db_write_queue_limit)
         self._init_database()
     
     def _init_database(self):
-        """Initialize SQLite database with required tables"""
+        """Bring the SQLite schema up to the latest migration"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Users table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT UNIQUE NOT NULL,
-                    email TEXT,
-                    industry TEXT,
-                    experience_level TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Skills assessments table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS skills_assessments (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT NOT NULL,
-                    assessment_data TEXT,
-                    overall_score REAL,
-                    industry TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (user_id)
-                )
-            ''')
-            
-            # Career transitions table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS career_transitions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT NOT NULL,
-                    from_industry TEXT,
-                    to_industry TEXT,
-                    success_probability REAL,
-                    status TEXT DEFAULT 'planned',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (user_id)
-                )
-            ''')
-            
-            # Training records table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS training_records (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT NOT NULL,
-                    program_name TEXT,
-                    completion_status TEXT DEFAULT 'enrolled',
-                    progress_percent REAL DEFAULT 0,
-                    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    completed_at TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (user_id)
-                )
-            ''')
-            
-            # Job market data table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS job_market_data (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    industry TEXT,
-                    job_postings INTEGER,
-                    avg_salary REAL,
-                    demand_score REAL,
-                    data_date DATE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Platform metrics table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS platform_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    metric_name TEXT,
-                    metric_value REAL,
-                    metric_data TEXT,
-                    recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            conn.commit()
+            # Runs once at startup, before the pool threads exist; also switches the file to WAL
+            conn = self.pool.connect()
+            applied = apply_migrations(conn)
+            version = schema_version(conn)
             conn.close()
-            logger.info("Database initialized successfully")
+            logger.info(f"Database initialized at schema version {version} ({len(applied)} migrations applied)")
             
         except Exception as e:
             logger.error(f"Database initialization failed: {e}")
     
+    async def queue_user(self, user_data: Dict[str, Any]) -> asyncio.Future:
+        """Queue a user upsert; the returned future resolves once it is committed"""
+        return await self.write_queue.submit(INSERT_USER_SQL, (
+            user_data.get('user_id'),
+            user_data.get('email'),
+            user_data.get('industry'),
+            user_data.get('experience_level')
+        ))
+    
+    async def queue_assessment(self, assessment_data: Dict[str, Any]) -> asyncio.Future:
+        """Queue a skills assessment insert; the returned future resolves once it is committed"""
+        return await self.write_queue.submit(INSERT_ASSESSMENT_SQL, (
+            assessment_data.get('user_id'),
+            json.dumps(assessment_data),
+            assessment_data.get('overall_score'),
+            assessment_data.get('industry')
+        ))
+    
+    @timed(DB_QUERY, 'store_user')
     async def store_user(self, user_data: Dict[str, Any]) -> bool:
         """Store user information"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO users (user_id, email, industry, experience_level)
-                VALUES (?, ?, ?, ?)
-            ''', (
-                user_data.get('user_id'),
-                user_data.get('email'),
-                user_data.get('industry'),
-                user_data.get('experience_level')
-            ))
-            
-            conn.commit()
-            conn.close()
+            committed = await self.queue_user(user_data)
+            await committed
             return True
             
         except Exception as e:
             logger.error(f"Failed to store user: {e}")
             return False
     
+    @timed(DB_QUERY, 'store_assessment')
     async def store_assessment(self, assessment_data: Dict[str, Any]) -> bool:
         """Store skills assessment result"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO skills_assessments (user_id, assessment_data, overall_score, industry)
-                VALUES (?, ?, ?, ?)
-            ''', (
-                assessment_data.get('user_id'),
-                json.dumps(assessment_data),
-                assessment_data.get('overall_score'),
-                assessment_data.get('industry')
-            ))
-            
-            conn.commit()
-            conn.close()
+            committed = await self.queue_assessment(assessment_data)
+            await committed
             return True
             
         except Exception as e:
             logger.error(f"Failed to store assessment: {e}")
             return False
     
-    async def get_user_assessments(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get user's assessment history"""
+    @timed(DB_QUERY, 'store_assessments_bulk')
+    async def store_assessments_bulk(self, assessments: List[Dict[str, Any]]) -> int:
+        """Store many skills assessments in one transaction and return the number of rows written"""
+        if not assessments:
+            return 0
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            # A generator, so JSON encoding happens on the pool thread rather than the event loop
+            return await self.pool.executemany(INSERT_ASSESSMENT_SQL, (
+                (a.get('user_id'), json.dumps(a, default=str), a.get('overall_score'), a.get('industry'))
+                for a in assessments
+            ))
             
-            cursor.execute('''
-                SELECT assessment_data, overall_score, created_at
-                FROM skills_assessments
-                WHERE user_id = ?
-                ORDER BY created_at DESC
-            ''', (user_id,))
+        except Exception as e:
+            logger.error(f"Failed to store {len(assessments)} assessments: {e}")
+            return 0
+    
+    @timed(DB_QUERY, 'store_market_data_bulk')
+    async def store_market_data_bulk(self, records: List[Dict[str, Any]]) -> int:
+        """Store many job market records in one transaction and return the number of rows written"""
+        if not records:
+            return 0
+        try:
+            return await self.pool.executemany(INSERT_MARKET_DATA_SQL, (
+                (r.get('industry'), r.get('job_postings'), r.get('avg_salary'), r.get('demand_score'), r.get('data_date'))
+                for r in records
+            ))
+            
+        except Exception as e:
+            logger.error(f"Failed to store {len(records)} job market records: {e}")
+            return 0
+    
+    @timed(DB_QUERY, 'store_metrics_bulk')
+    async def store_metrics_bulk(self, metrics: List[Dict[str, Any]]) -> int:
+        """Store many platform metrics (metric_name, metric_value, metric_data) in one transaction"""
+        if not metrics:
+            return 0
+        try:
+            return await self.pool.executemany(INSERT_METRIC_SQL, (
+                (m.get('metric_name'), m.get('metric_value'),
+                 json.dumps(m['metric_data'], default=str) if m.get('metric_data') is not None else None)
+                for m in metrics
+            ))
+            
+        except Exception as e:
+            logger.error(f"Failed to store {len(metrics)} platform metrics: {e}")
+            return 0
+    
+    @timed(DB_QUERY, 'get_user_assessments_page')
+    async def get_user_assessments_page(self, user_id: str, cursor: Optional[str] = None,
+                                        page_size: Optional[int] = None, summary_only: bool = False) -> Dict[str, Any]:
+        """Get one newest-first page of a user's assessment history and the cursor of the next page
+
+        ``page_size`` is capped at DB_MAX_PAGE_SIZE. With ``summary_only`` each row carries
+        only ``id``, ``overall_score`` and ``created_at``, and the JSON blob is not read.
+        ``next_cursor`` is None once the history is exhausted. A malformed ``cursor`` raises
+        ValueError rather than returning an empty page.
+        """
+        limit = max(1, min(page_size or self.page_size, self.max_page_size))
+        params = (user_id, *decode_cursor(cursor), limit) if cursor else (user_id, limit)
+        try:
+            rows = await self.pool.fetchall(SELECT_USER_ASSESSMENTS_SQL[summary_only, cursor is not None], params)
             
             results = []
-            for row in cursor.fetchall():
+            for row in rows:
+                result = {
+                    'id': row[0],
+                    'overall_score': row[2],
+                    'created_at': row[1]
+                }
+                if not summary_only:
+                    result['assessment_data'] = json.loads(row[3]) if row[3] else {}
+                results.append(result)
+            
+            return {
+                'assessments': results,
+                'next_cursor': encode_cursor(rows[-1][1], rows[-1][0]) if len(rows) == limit else None
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to get user assessments: {e}")
+            return {'assessments': [], 'next_cursor': None}
+    
+    async def iter_user_assessments(self, user_id: str, page_size: Optional[int] = None,
+                                    summary_only: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a user's whole assessment history newest first, holding one page in memory at a time"""
+        cursor = None
+        while True:
+            page = await self.get_user_assessments_page(user_id, cursor, page_size, summary_only)
+            for result in page['assessments']:
+                yield result
+            cursor = page['next_cursor']
+            if cursor is None:
+                return
+    
+    async def get_user_assessments(self, user_id: str, summary_only: bool = False) -> List[Dict[str, Any]]:
+        """Get the user's whole assessment history, newest first; long histories are better streamed"""
+        return [result async for result in self.iter_user_assessments(user_id, summary_only=summary_only)]
+    
+    @timed(DB_QUERY, 'get_assessments_since')
+    async def get_assessments_since(self, last_id: int, limit: int = 100000) -> List[Dict[str, Any]]:
+        """Get assessments stored after row ``last_id``, oldest first"""
+        try:
+            rows = await self.pool.fetchall(SELECT_ASSESSMENTS_SINCE_SQL, (last_id, limit))
+            
+            results = []
+            for row in rows:
                 results.append({
-                    'assessment_data': json.loads(row[0]),
-                    'overall_score': row[1],
-                    'created_at': row[2]
+                    'id': row[0],
+                    'user_id': row[1],
+                    'assessment_data': json.loads(row[2]) if row[2] else {},
+                    'overall_score': row[3],
+                    'industry': row[4],
+                    'created_at': row[5]
                 })
             
-            conn.close()
             return results
             
         except Exception as e:
-            logger.error(f"Failed to get user assessments: {e}")
+            logger.error(f"Failed to get new assessments: {e}")
+            return []
+    
+    @timed(DB_QUERY, 'get_transitions_since')
+    async def get_transitions_since(self, last_id: int, limit: int = 100000) -> List[Dict[str, Any]]:
+        """Get career transitions stored after row ``last_id`` with the user's experience and latest skills"""
+        try:
+            rows = await self.pool.fetchall(SELECT_TRANSITIONS_SINCE_SQL, (last_id, limit))
+            
+            results = []
+            for row in rows:
+                latest_assessment = json.loads(row[6]) if row[6] else {}
+                results.append({
+                    'id': row[0],
+                    'user_id': row[1],
+                    'from_industry': row[2],
+                    'to_industry': row[3],
+                    'status': row[4],
+                    'experience_level': row[5],
+                    'skills': latest_assessment.get('skills')
+                })
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to get new transitions: {e}")
             return []
+    
+    @timed(DB_QUERY, 'get_watermark')
+    async def get_watermark(self, source: str) -> int:
+        """Get the last row id consumed from ``source`` by retraining"""
+        try:
+            row = await self.pool.fetchone(SELECT_WATERMARK_SQL, (source,))
+            return row[0] if row else 0
+            
+        except Exception as e:
+            logger.error(f"Failed to get watermark for {source}: {e}")
+            return 0
+    
+    @timed(DB_QUERY, 'set_watermark')
+    async def set_watermark(self, source: str, last_id: int) -> bool:
+        """Record the last row id consumed from ``source`` by retraining"""
+        try:
+            await self.pool.execute(UPSERT_WATERMARK_SQL, (source, last_id))
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to set watermark for {source}: {e}")
+            return False
+    
+    @timed(DB_QUERY, 'ping')
+    async def ping(self) -> bool:
+        """Check that the database answers a trivial query"""
+        try:
+            await self.pool.fetchone(PING_SQL)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Database ping failed: {e}")
+            return False
+    
+    async def flush(self):
+        """Wait until every queued write is committed"""
+        await self.write_queue.flush()
+    
+    async def close(self):
+        """Commit queued writes, finish pending database calls and close the pooled connections"""
+        await self.write_queue.close()
+        self.pool.close()
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Migrate the database and show the query plan of every query")
+    parser.add_argument('--db', type=Path, default=Path("workforce_transformer.db"))
+    parser.add_argument('--explain', action='store_true', help="print EXPLAIN QUERY PLAN for every query")
+    parser.add_argument('--check', action='store_true', help="exit 1 if any query scans a table or sorts")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    conn = sqlite3.connect(args.db)
+    apply_migrations(conn)
+    print(f"{args.db}: schema version {schema_version(conn)}")
 
+    scans = {}
+    for name, plan in explain_query_plans(conn).items():
+        scans[name] = full_scan_steps(plan)
+        if args.explain:
+            print(f"\n{name}{'  <-- FULL SCAN' if scans[name] else ''}")
+            for step in plan or ['(no table access)']:
+                print(f"  {step}")
+    conn.close()
 
-class Settings:
-    def __init__(self):
-        self.database_url = "sqlite:///workforce_transformer.db"
-        self.api_key = "your-api-key-here"
-        self.debug = True
-        self.log_level = "INFO"
+    flagged = [name for name, steps in scans.items() if steps]
+    if flagged:
+        print(f"\nQueries that scan or sort: {', '.join(flagged)}")
+    if args.check and flagged:
+        sys.exit(1)
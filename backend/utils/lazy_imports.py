@@ -0,0 +1,30 @@
+"""
+Lazy imports for WorkforceTransformer Universal
+Module placeholders that defer importing heavy numeric and ML packages until an
+attribute is first used, so processes and routes that never touch them boot faster
+"""
+
+from types import ModuleType
+import importlib
+import sys
+
+
+class LazyModule(ModuleType):
+    """Stands in for a module and imports it on first attribute access
+
+    The real module's namespace is copied in once loaded, so later lookups are plain
+    attribute reads. Loading goes through ``importlib`` and is safe across threads.
+    """
+
+    def __getattr__(self, attr: str):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self.__name__}'>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return ``name`` if it is already imported, otherwise a placeholder that imports it on first use"""
+    return sys.modules.get(name) or LazyModule(name)
@@ -0,0 +1,300 @@
+"""
+Metrics for WorkforceTransformer Universal
+Prometheus-style counters, gauges and histograms kept in process memory, an ASGI
+middleware recording per-route HTTP metrics, and rendering in text exposition format
+"""
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Latency buckets in seconds, from sub-millisecond lookups to slow batch requests
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+BATCH_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # Label tuples are inserted from request handlers and executor threads
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"] + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self.values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                for labels, value in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float):
+        with self._lock:
+            self.values[labels] = value
+
+
+class Histogram(Metric):
+    """Cumulative-bucket histogram; each label set keeps per-bucket counts, a sum and a count"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.series: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, *labels: str):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def totals(self) -> Tuple[float, int]:
+        """(sum, count) over every label set"""
+        with self._lock:
+            return (sum(series[1] for series in self.series.values()),
+                    sum(series[2] for series in self.series.values()))
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(labels, (list(counts), total, count)) for labels, (counts, total, count) in sorted(self.series.items())]
+        lines = []
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {repr(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.setdefault(metric.name, metric)
+        return self.metrics[metric.name]
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self.metrics.values() for line in metric.render()) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests by method, route template and status code", ("method", "route", "status"))
+HTTP_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route template", ("method", "route"))
+HTTP_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served", ("method",))
+HTTP_REQUEST_SIZE = registry.histogram(
+    "http_request_size_bytes", "HTTP request body size by route template", ("route",), SIZE_BUCKETS)
+HTTP_RESPONSE_SIZE = registry.histogram(
+    "http_response_size_bytes", "HTTP response body size by route template", ("route",), SIZE_BUCKETS)
+MODEL_INFERENCE = registry.histogram(
+    "model_inference_duration_seconds", "Model inference time by model and operation", ("model", "operation"))
+DB_QUERY = registry.histogram(
+    "db_query_duration_seconds", "Database call time by operation", ("operation",))
+DB_WRITE_QUEUE_DEPTH = registry.gauge(
+    "db_write_queue_depth", "Writes waiting for the group-commit writer")
+DB_WRITE_BATCH_ROWS = registry.histogram(
+    "db_write_batch_rows", "Rows committed per group-commit transaction", buckets=BATCH_BUCKETS)
+DB_WRITE_COMMIT = registry.histogram(
+    "db_write_commit_seconds", "Time to write and commit one group-commit batch")
+DB_WRITE_WAIT = registry.histogram(
+    "db_write_wait_seconds", "Time from queueing a write until it is committed")
+
+
+def timed(histogram: Histogram, *labels: str):
+    """Decorate a sync or async callable so each call is observed in ``histogram``"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - start, *labels)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start, *labels)
+        return wrapper
+    return decorator
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request counts, latency, in-flight requests and payload sizes
+
+    Routes are labelled by their template (``/api/job-market/{industry}``) so label
+    cardinality stays bounded; requests that match no route share the ``unmatched`` label.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = registry, excluded_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.registry = registry
+        self.excluded_paths = set(excluded_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        start = time.perf_counter()
+        state = {'status': 500, 'request_bytes': 0, 'response_bytes': 0}
+
+        async def counting_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                state['request_bytes'] += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message):
+            if message["type"] == "http.response.start":
+                state['status'] = message["status"]
+            elif message["type"] == "http.response.body":
+                state['response_bytes'] += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc(method)
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            HTTP_IN_FLIGHT.dec(method)
+            route = scope.get("route")
+            route = getattr(route, "path", None) or "unmatched"
+            HTTP_LATENCY.observe(time.perf_counter() - start, method, route)
+            HTTP_REQUESTS.inc(method, route, str(state['status']))
+            HTTP_REQUEST_SIZE.observe(state['request_bytes'], route)
+            HTTP_RESPONSE_SIZE.observe(state['response_bytes'], route)
+
+
+def latency_summary(histogram: Histogram = HTTP_LATENCY, since: Optional[Tuple[float, int]] = None) -> Dict[str, Any]:
+    """Mean latency in milliseconds and request count, optionally relative to an earlier ``totals()``"""
+    total, count = histogram.totals()
+    if since is not None:
+        total, count = total - since[0], count - since[1]
+    return {'mean_ms': round(total / count * 1000, 3) if count else 0.0, 'count': count}
+
+
+class ProcessSampler:
+    """CPU and memory usage of this process, measured between successive ``sample()`` calls"""
+
+    def __init__(self):
+        self._last = (time.monotonic(), time.process_time())
+
+    @staticmethod
+    def _rss_bytes() -> int:
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            import resource
+            # ru_maxrss is the peak, in kilobytes on Linux and bytes on macOS
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak if sys.platform == "darwin" else peak * 1024
+
+    @staticmethod
+    def _total_memory_bytes() -> Optional[int]:
+        try:
+            return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def sample(self) -> Dict[str, float]:
+        now = (time.monotonic(), time.process_time())
+        wall, cpu = now[0] - self._last[0], now[1] - self._last[1]
+        self._last = now
+
+        rss = self._rss_bytes()
+        total = self._total_memory_bytes()
+        return {
+            'cpu_usage': round(cpu / wall / (os.cpu_count() or 1) * 100, 2) if wall > 0 else 0.0,
+            'memory_usage': round(rss / total * 100, 2) if total else 0.0,
+            'rss_mb': round(rss / 2 ** 20, 1)
+        }
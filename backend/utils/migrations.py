@@ -0,0 +1,139 @@
+"""
+Schema migrations for WorkforceTransformer Universal
+Ordered, versioned schema changes; the version reached is recorded in a schema_version
+table, so each migration runs exactly once per database file
+"""
+
+from typing import List, Tuple
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# (version, description, statements); append new migrations, never edit applied ones
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (1, 'initial schema', [
+        '''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT UNIQUE NOT NULL,
+            email TEXT,
+            industry TEXT,
+            experience_level TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS skills_assessments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            assessment_data TEXT,
+            overall_score REAL,
+            industry TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (user_id)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS career_transitions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            from_industry TEXT,
+            to_industry TEXT,
+            success_probability REAL,
+            status TEXT DEFAULT 'planned',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (user_id)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS training_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            program_name TEXT,
+            completion_status TEXT DEFAULT 'enrolled',
+            progress_percent REAL DEFAULT 0,
+            started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            completed_at TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (user_id)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS job_market_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            industry TEXT,
+            job_postings INTEGER,
+            avg_salary REAL,
+            demand_score REAL,
+            data_date DATE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS platform_metrics (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            metric_name TEXT,
+            metric_value REAL,
+            metric_data TEXT,
+            recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        # Last row id consumed per source table by incremental retraining
+        '''
+        CREATE TABLE IF NOT EXISTS retraining_watermarks (
+            source TEXT PRIMARY KEY,
+            last_id INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        '''
+    ]),
+    (2, 'indexes for per-user, per-industry and per-metric history', [
+        # The rowid is implicitly the last index column, so (created_at, id) keyset order needs no sort
+        'CREATE INDEX IF NOT EXISTS idx_skills_assessments_user_created ON skills_assessments (user_id, created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_job_market_data_industry_created ON job_market_data (industry, created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_platform_metrics_name_recorded ON platform_metrics (metric_name, recorded_at)'
+    ]),
+    (3, 'covering index for per-user assessment summaries', [
+        # overall_score lets summary pages skip the table; id keeps the (created_at, id) keyset order
+        'CREATE INDEX IF NOT EXISTS idx_skills_assessments_user_created_score '
+        'ON skills_assessments (user_id, created_at, id, overall_score)',
+        'DROP INDEX IF EXISTS idx_skills_assessments_user_created'
+    ])
+]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Highest migration version applied to this database, 0 for a new or pre-migration file"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    return conn.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version').fetchone()[0]
+
+
+def apply_migrations(conn: sqlite3.Connection) -> List[int]:
+    """Apply every pending migration, each in its own transaction, and return the versions applied"""
+    # Tables created before migrations existed match version 1, whose statements are idempotent
+    schema_version(conn)
+    applied = []
+    for version, description, statements in MIGRATIONS:
+        # IMMEDIATE takes the write lock first, so concurrent workers apply each migration once
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if conn.execute('SELECT 1 FROM schema_version WHERE version = ?', (version,)).fetchone():
+                conn.rollback()
+                continue
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute('INSERT INTO schema_version (version, description) VALUES (?, ?)', (version, description))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied.append(version)
+        logger.info(f"Applied schema migration {version}: {description}")
+    return applied
@@ -0,0 +1,70 @@
+"""
+ROI scenario sweeps for WorkforceTransformer Universal
+Request axes, size limits and per-industry reductions shared by the backend API and the
+unified app, so both validate and summarize a sweep grid the same way
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+from utils.lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+# Scenarios (industries x headcounts x budgets) one sweep request may evaluate
+MAX_SWEEP_CELLS = 1_000_000
+
+SWEEP_REDUCTIONS = ('max_roi', 'min_payback')
+
+
+class SweepAxis(BaseModel):
+    """Explicit ``values`` or an inclusive ``start``/``stop`` range of ``num`` points"""
+    values: Optional[List[float]] = None
+    start: Optional[float] = None
+    stop: Optional[float] = None
+    num: int = Field(10, ge=1, le=MAX_SWEEP_CELLS)
+
+    def size(self) -> int:
+        """Number of points, known before any array is built"""
+        return len(self.values) if self.values is not None else self.num
+
+    def to_array(self) -> 'np.ndarray':
+        if self.values is not None:
+            return np.asarray(self.values, dtype=float)
+        if self.start is None or self.stop is None:
+            raise ValueError("Sweep axis needs either values or start and stop")
+        return np.linspace(self.start, self.stop, self.num)
+
+
+def check_reductions(reductions: Sequence[str]):
+    """ValueError naming the first reduction ``reduce_sweep`` does not know"""
+    for reduction in reductions:
+        if reduction not in SWEEP_REDUCTIONS:
+            raise ValueError(f"Unknown reduction '{reduction}', expected one of {sorted(SWEEP_REDUCTIONS)}")
+
+
+def reduce_sweep(grid: Dict[str, 'np.ndarray'], industries: List[str], employee_counts: Sequence[float],
+                 training_budgets: Sequence[float], reductions: Sequence[str]) -> Dict[str, Any]:
+    """Per-industry best scenarios of a sweep grid, so the grid itself need not be returned
+
+    ``grid`` needs ``roi_percentage`` and ``payback_months`` arrays shaped
+    (industries, employee_counts, training_budgets).
+    """
+    check_reductions(reductions)
+    roi, payback = grid['roi_percentage'], grid['payback_months']
+    result = {}
+    for reduction in reductions:
+        flat = roi.reshape(len(industries), -1).argmax(axis=1) if reduction == 'max_roi' \
+            else payback.reshape(len(industries), -1).argmin(axis=1)
+        employee_index, budget_index = np.unravel_index(flat, roi.shape[1:])
+        result[reduction] = {
+            industry: {
+                'employee_count': float(employee_counts[e]),
+                'training_budget': float(training_budgets[b]),
+                'roi_percentage': round(float(roi[i, e, b]), 1),
+                'payback_months': round(float(payback[i, e, b]), 1)
+            }
+            for i, (industry, e, b) in enumerate(zip(industries, employee_index, budget_index))
+        }
+    return result
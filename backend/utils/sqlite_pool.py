@@ -0,0 +1,105 @@
+"""
+SQLite connection pool for WorkforceTransformer Universal
+A fixed set of worker threads, each owning one long-lived WAL-mode connection, so
+database calls run off the event loop without per-call connect and PRAGMA setup
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import asyncio
+import logging
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Applied to every pooled connection; journal_mode is persistent in the file, the rest per connection
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    # With WAL, NORMAL only fsyncs at checkpoints; a crash can drop the last commits but never corrupts
+    'synchronous': 'NORMAL',
+    'cache_size': -16000,
+    'mmap_size': 256 * 1024 * 1024,
+    'busy_timeout': 5000,
+    'temp_store': 'MEMORY'
+}
+
+# Prepared statements kept per connection; queries are constant strings, so repeats skip compilation
+STATEMENT_CACHE_SIZE = 256
+
+
+class SQLitePool:
+    """Thread-confined SQLite connections behind a thread pool
+
+    Each pool thread opens its connection when it starts and is the only thread that
+    uses it. Coroutines hand work to the pool with ``run`` (or the ``execute``/``fetch*``
+    helpers), so the event loop never blocks on disk I/O or lock waits.
+    """
+
+    def __init__(self, db_path: Path, size: int = 4, pragmas: Optional[Dict[str, Any]] = None):
+        self.db_path = Path(db_path)
+        self.size = size
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='sqlite',
+                                            initializer=self._open_thread_connection)
+        self._closed = False
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection configured with the pool's PRAGMAs"""
+        # Confined to one pool thread by construction; close() runs from another thread after they stop
+        conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
+        for name, value in self.pragmas.items():
+            conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    def _open_thread_connection(self):
+        conn = self.connect()
+        self._local.conn = conn
+        with self._lock:
+            self._connections.append(conn)
+
+    def _call(self, func: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+        return func(self._local.conn, *args)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func(connection, *args)`` on a pool thread"""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, func, args)
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Run one write statement in its own transaction and return the last inserted row id"""
+        def write(conn: sqlite3.Connection) -> int:
+            with conn:
+                return conn.execute(sql, params).lastrowid
+        return await self.run(write)
+
+    async def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> int:
+        """Run ``sql`` for every row in one transaction and return the number of rows written"""
+        def write(conn: sqlite3.Connection) -> int:
+            with conn:
+                return conn.executemany(sql, rows).rowcount
+        return await self.run(write)
+
+    async def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        return await self.run(lambda conn: conn.execute(sql, params).fetchall())
+
+    async def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[Tuple[Any, ...]]:
+        return await self.run(lambda conn: conn.execute(sql, params).fetchone())
+
+    def close(self):
+        """Wait for queued calls, then close every pooled connection"""
+        if self._closed:
+            return
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        logger.info("SQLite connection pool closed")
@@ -0,0 +1,147 @@
+"""
+Write-behind queue for WorkforceTransformer Universal
+Collects inserts from many coroutines and commits them in shared transactions from a
+single writer task, so write throughput is no longer bounded by one commit per row
+"""
+
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, List, Optional, Sequence, Tuple
+import asyncio
+import logging
+import sqlite3
+import time
+
+from utils.metrics import DB_WRITE_BATCH_ROWS, DB_WRITE_COMMIT, DB_WRITE_QUEUE_DEPTH, DB_WRITE_WAIT
+from utils.sqlite_pool import SQLitePool
+
+logger = logging.getLogger(__name__)
+
+
+def _write_batch(conn: sqlite3.Connection, writes: List[Tuple[str, Sequence[Any]]]):
+    """Write every row in one transaction; consecutive rows for the same statement go through executemany"""
+    with conn:
+        for sql, group in groupby(writes, key=itemgetter(0)):
+            conn.executemany(sql, [params for _, params in group])
+
+
+def _write_each(conn: sqlite3.Connection, writes: List[Tuple[str, Sequence[Any]]]) -> List[Optional[Exception]]:
+    """Fallback after a failed batch: one transaction per row, so only the bad rows fail"""
+    errors = []
+    for sql, params in writes:
+        try:
+            with conn:
+                conn.execute(sql, params)
+            errors.append(None)
+        except sqlite3.Error as e:
+            errors.append(e)
+    return errors
+
+
+class WriteBehindQueue:
+    """Group commit for single-row inserts
+
+    ``submit`` returns a future that resolves once the row is committed. The writer
+    takes the first pending write, waits up to ``batch_ms`` for more (less once
+    ``batch_rows`` are pending), and commits them together on the connection pool.
+    Writes that arrive while a batch commits form the next batch, so with the default
+    ``batch_ms`` of 0 batches grow with load and a lone write is committed immediately.
+    """
+
+    def __init__(self, pool: SQLitePool, batch_rows: int = 500, batch_ms: float = 0.0, max_pending: int = 10000):
+        self.pool = pool
+        self.batch_rows = batch_rows
+        self.batch_ms = batch_ms
+        self.max_pending = max_pending
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def _ensure_writer(self):
+        # The writer lives on the loop of its first caller (the server's loop in practice)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue(self.max_pending)
+            self._batch_ready = asyncio.Event()
+            self._task = loop.create_task(self._writer())
+
+    async def submit(self, sql: str, params: Sequence[Any]) -> asyncio.Future:
+        """Queue one write; waits only while the queue is full. Await the result to wait for the commit"""
+        if self._closed:
+            raise RuntimeError("Write queue is closed")
+        self._ensure_writer()
+        committed = self._loop.create_future()
+        await self._queue.put((sql, params, committed, time.perf_counter()))
+        DB_WRITE_QUEUE_DEPTH.set(value=self._queue.qsize())
+        if self._queue.qsize() >= self.batch_rows:
+            self._batch_ready.set()
+        return committed
+
+    async def _collect(self) -> List[Tuple[str, Sequence[Any], asyncio.Future, float]]:
+        batch = [await self._queue.get()]
+        if self.batch_ms > 0 and self._queue.qsize() < self.batch_rows - 1:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self.batch_ms / 1000)
+            except asyncio.TimeoutError:
+                pass
+        self._batch_ready.clear()
+        while len(batch) < self.batch_rows and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        DB_WRITE_QUEUE_DEPTH.set(value=self._queue.qsize())
+        return batch
+
+    async def _commit(self, batch: List[Tuple[str, Sequence[Any], asyncio.Future, float]]):
+        writes = [(sql, params) for sql, params, _, _ in batch]
+        start = time.perf_counter()
+        try:
+            await self.pool.run(_write_batch, writes)
+            errors: List[Optional[Exception]] = [None] * len(batch)
+        except Exception as e:
+            logger.warning(f"Group commit of {len(batch)} rows failed ({e}); retrying rows individually")
+            try:
+                errors = await self.pool.run(_write_each, writes)
+            except Exception as retry_error:
+                errors = [retry_error] * len(batch)
+
+        finished = time.perf_counter()
+        DB_WRITE_COMMIT.observe(finished - start)
+        DB_WRITE_BATCH_ROWS.observe(len(batch))
+        for (_, _, committed, queued_at), error in zip(batch, errors):
+            DB_WRITE_WAIT.observe(finished - queued_at)
+            if committed.done():
+                continue
+            if error is None:
+                committed.set_result(True)
+            else:
+                committed.set_exception(error)
+
+    async def _writer(self):
+        queue = self._queue
+        while True:
+            batch = await self._collect()
+            try:
+                await self._commit(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def flush(self):
+        """Wait until every write queued so far is committed"""
+        if self._queue is not None and self._loop is asyncio.get_running_loop() and not self._task.done():
+            self._batch_ready.set()
+            await self._queue.join()
+
+    async def close(self):
+        """Refuse new writes, commit everything pending, then stop the writer"""
+        self._closed = True
+        await self.flush()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Write-behind queue flushed and closed")
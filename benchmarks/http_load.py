@@ -0,0 +1,312 @@
+"""
+HTTP load benchmark for WorkforceTransformer Universal
+Drives the unified or backend ASGI app in process (or a running server over localhost)
+with a weighted mix of realistic requests and reports throughput, tail latency and
+allocations per request
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import gc
+import importlib
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import httpx
+
+from .reporting import (
+    HIGHER_IS_BETTER, LOWER_IS_BETTER, ROOT, check_baseline, default_baseline,
+    latency_summary, require_baseline, run_metadata, write_results
+)
+
+SUITE = 'http_load'
+
+INDUSTRIES = ['cybersecurity', 'healthcare', 'manufacturing', 'finance', 'retail', 'education', 'logistics', 'legal']
+SKILLS = ['ai-ml', 'data-analysis', 'digital-literacy', 'process-automation', 'human-ai-collaboration',
+          'critical-thinking', 'adaptability', 'communication', 'project-management', 'ethical-decision']
+EXPERIENCE_LEVELS = ['0-2', '3-5', '6-10', '10+']
+STATIC_PATHS = ['/', '/app.js', '/enhanced.js', '/enhanced.css', '/static/api-integration.js']
+
+# Regressions beyond the tolerance on these metrics fail the baseline comparison
+BASELINE_METRICS = {'requests_per_second': HIGHER_IS_BETTER, 'p95_ms': LOWER_IS_BETTER, 'p99_ms': LOWER_IS_BETTER}
+
+# A request is (scenario name, method, path, httpx keyword arguments)
+Request = Tuple[str, str, str, Dict[str, Any]]
+
+
+def _profile(rng: random.Random) -> Dict[str, Any]:
+    return {
+        'current_industry': rng.choice(INDUSTRIES),
+        'experience_years': rng.choice(EXPERIENCE_LEVELS),
+        'skills': rng.sample(SKILLS, rng.randint(1, 6))
+    }
+
+
+def _unified_assess(rng: random.Random) -> Tuple[str, str, Dict[str, Any]]:
+    return 'POST', '/api/assess', {'json': {**_profile(rng), 'target_industry': rng.choice(INDUSTRIES)}}
+
+
+def _unified_transition(rng: random.Random) -> Tuple[str, str, Dict[str, Any]]:
+    params = {'current_industry': rng.choice(INDUSTRIES), 'skills': ','.join(rng.sample(SKILLS, rng.randint(1, 5)))}
+    return 'GET', f"/api/transition/emp-{rng.randint(1, 5000)}/{rng.choice(INDUSTRIES)}", {'params': params}
+
+
+def _unified_roi(rng: random.Random) -> Tuple[str, str, Dict[str, Any]]:
+    return 'POST', '/api/roi/calculate', {'json': {
+        'industry': rng.choice(INDUSTRIES),
+        'employee_count': rng.choice([25, 50, 100, 250, 500, 1000, 5000]),
+        'training_budget': rng.choice([10000, 25000, 50000, 100000, 250000])
+    }}
+
+
+def _unified_job_market(rng: random.Random) -> Tuple[str, str, Dict[str, Any]]:
+    return 'GET', f"/api/analytics/job-market/{rng.choice(INDUSTRIES)}", {}
+
+
+def _static_asset(rng: random.Random) -> Tuple[str, str, Dict[str, Any]]:
+    return 'GET', rng.choice(STATIC_PATHS), {'headers': {'Accept-Encoding': 'gzip'}}
+
+
+def _backend_assess(rng: random.Random) -> Tuple[str, str, Dict[str, Any]]:
+    return 'POST', '/api/assess/batch', {'json': {'profiles': [_profile(rng) for _ in range(rng.randint(1, 3))]}}
+
+
+def _backend_job_market(rng: random.Random) -> Tuple[str, str, Dict[str, Any]]:
+    return 'GET', f"/api/job-market/{rng.choice(INDUSTRIES)}", {}
+
+
+def _backend_roi(rng: random.Random) -> Tuple[str, str, Dict[str, Any]]:
+    return 'POST', '/api/roi/sweep', {'json': {
+        'industries': rng.sample(INDUSTRIES, 2),
+        'employee_counts': {'start': 50, 'stop': rng.choice([500, 1000, 5000]), 'num': 10},
+        'training_budgets': {'values': [25000, 50000, 100000]},
+        'include_grid': False,
+        'reductions': ['max_roi']
+    }}
+
+
+def _health(rng: random.Random) -> Tuple[str, str, Dict[str, Any]]:
+    return 'GET', '/health', {}
+
+
+# Weighted workload per target: (scenario, weight, request builder)
+WORKLOADS: Dict[str, List[Tuple[str, int, Callable[[random.Random], Tuple[str, str, Dict[str, Any]]]]]] = {
+    'unified': [
+        ('assess', 35, _unified_assess),
+        ('transition', 20, _unified_transition),
+        ('roi', 15, _unified_roi),
+        ('job_market', 10, _unified_job_market),
+        ('static', 20, _static_asset)
+    ],
+    'backend': [
+        ('assess', 45, _backend_assess),
+        ('job_market', 25, _backend_job_market),
+        ('roi_sweep', 20, _backend_roi),
+        ('health', 10, _health)
+    ]
+}
+
+
+def build_plan(target: str, count: int, seed: int) -> List[Request]:
+    """Deterministic request sequence so runs on different revisions send identical traffic"""
+    rng = random.Random(seed)
+    workload = WORKLOADS[target]
+    names = rng.choices(range(len(workload)), weights=[weight for _, weight, _ in workload], k=count)
+    return [(workload[index][0], *workload[index][2](rng)) for index in names]
+
+
+def load_app(target: str):
+    """Import the target's ASGI app the way its server would"""
+    if target == 'backend':
+        # The backend runs from its own directory (relative database and model cache paths)
+        os.chdir(ROOT / 'backend')
+        sys.path.insert(0, str(ROOT / 'backend'))
+        return importlib.import_module('main').app
+    sys.path.insert(0, str(ROOT))
+    return importlib.import_module('unified_app').app
+
+
+@asynccontextmanager
+async def open_client(target: str, url: Optional[str], ready_timeout: float) -> AsyncIterator[Tuple[httpx.AsyncClient, bool]]:
+    """Yield a client for the target and whether it runs in this process
+
+    In-process clients run the app's startup and shutdown handlers around the benchmark.
+    """
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    if url:
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+            await _wait_ready(client, ready_timeout)
+            yield client, False
+        return
+
+    app = load_app(target)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://benchmark', timeout=60) as client:
+            await _wait_ready(client, ready_timeout)
+            yield client, True
+
+
+async def _wait_ready(client: httpx.AsyncClient, timeout: float):
+    """Wait until /ready answers 200 (the backend fits its models after startup)"""
+    deadline = time.perf_counter() + timeout
+    while True:
+        response = await client.get('/ready')
+        if response.status_code == 200:
+            return
+        if time.perf_counter() > deadline:
+            raise RuntimeError(f"/ready still {response.status_code} after {timeout}s: {response.text[:200]}")
+        await asyncio.sleep(0.25)
+
+
+async def run_load(client: httpx.AsyncClient, plan: List[Request], concurrency: int) -> Tuple[Dict[str, Any], float]:
+    """Issue ``plan`` from ``concurrency`` workers; returns per-scenario latencies and status counts, and wall time"""
+    samples: Dict[str, Dict[str, Any]] = {}
+    position = iter(plan)
+
+    async def worker():
+        for name, method, path, kwargs in position:
+            start = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            await response.aread()
+            elapsed = time.perf_counter() - start
+            scenario = samples.setdefault(name, {'latencies': [], 'statuses': {}})
+            scenario['latencies'].append(elapsed)
+            scenario['statuses'][response.status_code] = scenario['statuses'].get(response.status_code, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - start
+
+
+async def measure_allocations(client: httpx.AsyncClient, plan: List[Request], per_scenario: int) -> Dict[str, Dict[str, float]]:
+    """Per-scenario traced peak memory and net allocated blocks per request, measured one request at a time
+
+    Runs separately from the timed pass because tracing allocations slows every request.
+    """
+    by_scenario: Dict[str, List[Request]] = {}
+    for request in plan:
+        requests = by_scenario.setdefault(request[0], [])
+        if len(requests) < per_scenario:
+            requests.append(request)
+
+    results = {}
+    tracemalloc.start()
+    try:
+        for name, requests in sorted(by_scenario.items()):
+            peaks = []
+            blocks_before = sys.getallocatedblocks()
+            for _, method, path, kwargs in requests:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                response = await client.request(method, path, **kwargs)
+                await response.aread()
+                peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+            results[name] = {
+                'alloc_peak_kib': round(sum(peaks) / len(peaks) / 1024, 2),
+                'net_blocks_per_request': round((sys.getallocatedblocks() - blocks_before) / len(requests), 1)
+            }
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def summarize(samples: Dict[str, Any], wall_seconds: float, allocations: Dict[str, Dict[str, float]],
+              gc_collections: int) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    everything = []
+    for name, scenario in sorted(samples.items()):
+        latencies = scenario['latencies']
+        everything.extend(latencies)
+        errors = sum(count for status, count in scenario['statuses'].items() if status >= 400)
+        results[name] = {
+            **latency_summary(latencies),
+            'requests_per_second': round(len(latencies) / wall_seconds, 1),
+            'errors': errors,
+            'statuses': {str(status): count for status, count in sorted(scenario['statuses'].items())},
+            **allocations.get(name, {})
+        }
+    results['overall'] = {
+        **latency_summary(everything),
+        'requests_per_second': round(len(everything) / wall_seconds, 1),
+        'errors': sum(result['errors'] for result in results.values()),
+        'wall_seconds': round(wall_seconds, 3),
+        'gc_collections': gc_collections
+    }
+    return results
+
+
+async def benchmark(target: str, url: Optional[str], requests: int, concurrency: int, warmup: int,
+                    alloc_samples: int, seed: int, ready_timeout: float) -> Dict[str, Any]:
+    plan = build_plan(target, requests, seed)
+    async with open_client(target, url, ready_timeout) as (client, in_process):
+        if warmup:
+            await run_load(client, build_plan(target, warmup, seed + 1), concurrency)
+
+        gc.collect()
+        collections_before = sum(generation['collections'] for generation in gc.get_stats())
+        samples, wall_seconds = await run_load(client, plan, concurrency)
+        gc_collections = sum(generation['collections'] for generation in gc.get_stats()) - collections_before
+
+        # Allocations are only visible for an app running in this process
+        allocations = await measure_allocations(client, plan, alloc_samples) if in_process and alloc_samples else {}
+
+    return {
+        'suite': SUITE,
+        'meta': run_metadata(target=target, mode='url' if url else 'asgi', url=url, requests=requests,
+                             concurrency=concurrency, warmup=warmup, seed=seed),
+        'results': summarize(samples, wall_seconds, allocations, gc_collections)
+    }
+
+
+def print_report(payload: Dict[str, Any]):
+    meta = payload['meta']
+    print(f"HTTP load: {meta['target']} ({meta['mode']}), {meta['requests']} requests, concurrency {meta['concurrency']}")
+    print(f"  {'scenario':<12} {'count':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'errors':>7} {'peak KiB':>9} {'blocks':>8}")
+    for name, result in payload['results'].items():
+        print(f"  {name:<12} {result['count']:>7} {result['requests_per_second']:>9.1f} {result['p50_ms']:>9.2f} "
+              f"{result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} {result['errors']:>7} "
+              f"{result.get('alloc_peak_kib', ''):>9} {result.get('net_blocks_per_request', ''):>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mixed-workload HTTP benchmark with baseline comparison")
+    parser.add_argument("target", nargs="?", choices=sorted(WORKLOADS), default="unified")
+    parser.add_argument("--url", help="benchmark a running server (e.g. http://127.0.0.1:8000) instead of the app in process")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=500)
+    parser.add_argument("--alloc-samples", type=int, default=50, help="requests per scenario in the allocation pass")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--ready-timeout", type=float, default=300, help="seconds to wait for /ready")
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument("--baseline", nargs="?", const="", help="compare with a baseline, which must exist (default benchmarks/baselines/http_load_<target>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed fractional regression before failing")
+    args = parser.parse_args()
+    baseline_path = ROOT / args.baseline if args.baseline else default_baseline(SUITE, args.target)
+    if args.baseline is not None and not args.save_baseline:
+        # Fail before a long run whose comparison could not happen
+        require_baseline(baseline_path)
+
+    # Per-request application and client logging would dominate the measurement
+    logging.disable(logging.INFO)
+
+    payload = asyncio.run(benchmark(args.target, args.url, args.requests, args.concurrency, args.warmup,
+                                    args.alloc_samples, args.seed, args.ready_timeout))
+    print_report(payload)
+    if args.output:
+        write_results(payload, ROOT / args.output)
+
+    if args.save_baseline:
+        write_results(payload, baseline_path)
+        print(f"\nBaseline saved to {baseline_path}")
+    elif args.baseline is not None and not check_baseline(payload, baseline_path, BASELINE_METRICS, args.tolerance):
+        sys.exit(1)
@@ -0,0 +1,276 @@
+"""
+Micro-benchmarks for WorkforceTransformer Universal
+Times model scoring, model initialization and synthetic data generation at several
+input sizes, with warmup and repeated samples, so scaling curves can be charted
+across releases
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from statistics import mean, median, stdev
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import argparse
+import asyncio
+import gc
+import inspect
+import logging
+import re
+import sys
+import tempfile
+import time
+import uuid
+
+from .reporting import (
+    LOWER_IS_BETTER, ROOT, check_baseline, default_baseline, percentile, require_baseline, run_metadata,
+    write_results
+)
+
+SUITE = 'micro'
+
+sys.path[:0] = [str(ROOT), str(ROOT / 'backend')]
+
+INDUSTRIES = ['cybersecurity', 'healthcare', 'manufacturing', 'finance', 'retail', 'education', 'logistics', 'legal']
+SKILLS = ['ai-ml', 'data-analysis', 'digital-literacy', 'process-automation', 'human-ai-collaboration',
+          'critical-thinking', 'adaptability', 'communication', 'project-management', 'ethical-decision']
+
+BASELINE_METRICS = {'median_us': LOWER_IS_BETTER}
+
+
+def _skills(count: int) -> List[str]:
+    """``count`` skills; beyond the known ten they are unknown names, as free-text input produces"""
+    return (SKILLS + [f'custom-skill-{i}' for i in range(max(0, count - len(SKILLS)))])[:count]
+
+
+def _unified_models():
+    from unified_app import UnifiedAIModels
+    return UnifiedAIModels()
+
+
+def unified_assess_skills(size: int, workdir: Path) -> Callable:
+    models, skills = _unified_models(), _skills(size)
+    return lambda: models.assess_skills('finance', skills, '3-5', 'healthcare')
+
+
+def unified_predict_transition(size: int, workdir: Path) -> Callable:
+    models, skills = _unified_models(), _skills(size)
+    return lambda: models.predict_transition('cybersecurity', 'finance', skills)
+
+
+def unified_calculate_roi(size: int, workdir: Path) -> Callable:
+    models = _unified_models()
+    scenarios = [(INDUSTRIES[i % len(INDUSTRIES)], 50 + i, 10000.0 + 100 * i) for i in range(size)]
+
+    def run():
+        for industry, employee_count, training_budget in scenarios:
+            models.calculate_roi(industry, employee_count, training_budget, 50000)
+    return run
+
+
+def working_assess_skills(size: int, workdir: Path) -> Callable:
+    from models.working_ai_models import WorkingSkillsAssessmentModel
+    model, skills = WorkingSkillsAssessmentModel(), _skills(size)
+    return lambda: model.assess_skills('finance', skills, '3-5', 'healthcare')
+
+
+def working_predict_transition(size: int, workdir: Path) -> Callable:
+    from models.working_ai_models import WorkingCareerTransitionPredictor
+    model, skills = WorkingCareerTransitionPredictor(), _skills(size)
+    return lambda: model.predict_transition('emp-1', 'cybersecurity', 'finance', skills)
+
+
+def _skills_model(training_rows: int, cache_dir: Path):
+    from models.ai_models import SkillsAssessmentModel
+    from models.artifact_store import ModelArtifactStore
+    model = SkillsAssessmentModel(artifact_store=ModelArtifactStore(str(cache_dir)))
+    model.training_rows = training_rows
+    return model
+
+
+def skills_model_initialize_fit(size: int, workdir: Path) -> Callable:
+    async def run():
+        # A fresh artifact directory every call, so the forest is fitted each time
+        model = _skills_model(size, workdir / uuid.uuid4().hex)
+        await model.initialize()
+        assert model.is_ready
+    return run
+
+
+def skills_model_initialize_cached(size: int, workdir: Path) -> Callable:
+    cache_dir = workdir / f'cached-{size}'
+    asyncio.run(_skills_model(size, cache_dir).initialize())
+
+    async def run():
+        model = _skills_model(size, cache_dir)
+        await model.initialize()
+        assert model.is_ready
+    return run
+
+
+def synthetic_skills_profiles(size: int, workdir: Path) -> Callable:
+    import numpy as np
+    from models.synthetic_data import sample_skills_profiles
+    return lambda: sample_skills_profiles(np.random.default_rng(42), size)
+
+
+def synthetic_transitions(size: int, workdir: Path) -> Callable:
+    import numpy as np
+    from models.synthetic_data import sample_transitions
+    return lambda: sample_transitions(np.random.default_rng(42), size)
+
+
+def data_processor_generator(method: str) -> Callable[[Optional[int], Path], Callable]:
+    def prepare(size: Optional[int], workdir: Path) -> Callable:
+        from services.data_processor import DataProcessor
+        return getattr(DataProcessor(), method)
+    return prepare
+
+
+DATA_PROCESSOR_GENERATORS = ['_generate_skills_demand_data', '_generate_career_transition_data', '_generate_salary_data',
+                             '_generate_training_outcomes_data', '_generate_job_market_data']
+
+# (case name, size label, sizes, prepare(size, workdir) -> callable, max samples); cases without
+# sizes produce a fixed amount of output and record the length of one result as their size
+CASES: List[Tuple[str, str, Optional[List[int]], Callable[[Optional[int], Path], Callable], Optional[int]]] = [
+    ('unified.assess_skills', 'skills', [1, 5, 10, 25], unified_assess_skills, None),
+    ('unified.predict_transition', 'skills', [1, 5, 10, 25], unified_predict_transition, None),
+    ('unified.calculate_roi', 'scenarios', [1, 100, 10000], unified_calculate_roi, None),
+    ('working.assess_skills', 'skills', [1, 5, 10, 25], working_assess_skills, None),
+    ('working.predict_transition', 'skills', [1, 5, 10, 25], working_predict_transition, None),
+    ('skills_model.initialize[fit]', 'training_rows', [500, 2000, 5000], skills_model_initialize_fit, 3),
+    ('skills_model.initialize[cached]', 'training_rows', [500, 2000, 5000], skills_model_initialize_cached, None),
+    ('synthetic.sample_skills_profiles', 'rows', [1000, 10000, 100000], synthetic_skills_profiles, None),
+    ('synthetic.sample_transitions', 'rows', [1000, 10000, 100000], synthetic_transitions, None)
+] + [
+    (f'data_processor.{method}', 'rows', None, data_processor_generator(method), None)
+    for method in DATA_PROCESSOR_GENERATORS
+]
+
+
+@contextmanager
+def _gc_paused(enabled: bool) -> Iterator[None]:
+    """Keep the collector out of timed loops, as ``timeit`` does, unless asked otherwise"""
+    was_enabled = gc.isenabled()
+    if not enabled:
+        gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _timer(fn: Callable, loop: asyncio.AbstractEventLoop) -> Callable[[int], float]:
+    """Seconds taken by ``number`` back-to-back calls; awaitable results are awaited inside one task"""
+    first = fn()
+    if inspect.isawaitable(first):
+        loop.run_until_complete(first)
+
+        async def run_async(number: int) -> float:
+            start = time.perf_counter()
+            for _ in range(number):
+                await fn()
+            return time.perf_counter() - start
+        return lambda number: loop.run_until_complete(run_async(number))
+
+    def run(number: int) -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        return time.perf_counter() - start
+    return run
+
+
+def measure(fn: Callable, loop: asyncio.AbstractEventLoop, warmup: int, repeat: int, min_time: float,
+            keep_gc: bool) -> Dict[str, Any]:
+    """Calibrate calls per sample so each sample lasts ``min_time``, warm up, then take ``repeat`` samples"""
+    timer = _timer(fn, loop)
+    with _gc_paused(keep_gc):
+        number = 1
+        while True:
+            elapsed = timer(number)
+            if elapsed >= min_time or number >= 1_000_000:
+                break
+            number = min(1_000_000, max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.2)))
+        for _ in range(warmup):
+            timer(number)
+        samples = sorted(timer(number) / number for _ in range(repeat))
+
+    median_s = median(samples)
+    return {
+        'median_us': round(median_s * 1e6, 3),
+        'mean_us': round(mean(samples) * 1e6, 3),
+        'min_us': round(samples[0] * 1e6, 3),
+        'stdev_us': round(stdev(samples) * 1e6, 3) if len(samples) > 1 else 0.0,
+        'iqr_us': round((percentile(samples, 75) - percentile(samples, 25)) * 1e6, 3),
+        'ops_per_second': round(1 / median_s, 1) if median_s else None,
+        'samples': len(samples),
+        'calls_per_sample': number
+    }
+
+
+def run_suite(pattern: Optional[str], warmup: int, repeat: int, min_time: float, keep_gc: bool) -> Dict[str, Any]:
+    results = {}
+    loop = asyncio.new_event_loop()
+    try:
+        with tempfile.TemporaryDirectory(prefix='micro-bench-') as tmp:
+            for name, size_label, sizes, prepare, max_samples in CASES:
+                if pattern and not re.search(pattern, name):
+                    continue
+                for size in sizes or [None]:
+                    fn = prepare(size, Path(tmp))
+                    if size is None:
+                        size = len(fn())
+                    stats = measure(fn, loop, warmup if max_samples is None else min(warmup, 1),
+                                    repeat if max_samples is None else min(repeat, max_samples), min_time, keep_gc)
+                    key = f"{name}/{size_label}={size}" if sizes else name
+                    results[key] = {'case': name, 'size_label': size_label, 'size': size,
+                                    'per_item_us': round(stats['median_us'] / size, 4) if size else None, **stats}
+                    print(f"  {key:<58} {stats['median_us']:>13.2f} us  ±{stats['iqr_us']:>10.2f}  "
+                          f"({stats['samples']} x {stats['calls_per_sample']})", flush=True)
+    finally:
+        loop.close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for model scoring and data generation")
+    parser.add_argument("--filter", help="only run cases whose name matches this regular expression")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed samples before measuring")
+    parser.add_argument("--repeat", type=int, default=15, help="timed samples per case and size")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per sample")
+    parser.add_argument("--quick", action="store_true", help="fewer, shorter samples for a smoke run")
+    parser.add_argument("--gc", action="store_true", help="leave garbage collection enabled while timing")
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument("--baseline", nargs="?", const="", help="compare with a baseline, which must exist (default benchmarks/baselines/micro_local.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed fractional slowdown before failing")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, size_label, sizes, _, _ in CASES:
+            print(f"{name:<44} {size_label}: {', '.join(map(str, sizes)) if sizes else 'fixed'}")
+        sys.exit(0)
+    if args.quick:
+        args.warmup, args.repeat, args.min_time = 1, 5, 0.01
+    baseline_path = ROOT / args.baseline if args.baseline else default_baseline(SUITE, 'local')
+    if args.baseline is not None and not args.save_baseline:
+        # Fail before a long run whose comparison could not happen
+        require_baseline(baseline_path)
+
+    logging.disable(logging.INFO)
+    print(f"Micro-benchmarks: warmup {args.warmup}, {args.repeat} samples of >= {args.min_time}s each")
+    payload = {
+        'suite': SUITE,
+        'meta': run_metadata(filter=args.filter, warmup=args.warmup, repeat=args.repeat,
+                             min_time=args.min_time, gc_enabled=args.gc),
+        'results': run_suite(args.filter, args.warmup, args.repeat, args.min_time, args.gc)
+    }
+    if args.output:
+        write_results(payload, ROOT / args.output)
+
+    if args.save_baseline:
+        write_results(payload, baseline_path)
+        print(f"\nBaseline saved to {baseline_path}")
+    elif args.baseline is not None and not check_baseline(payload, baseline_path, BASELINE_METRICS, args.tolerance):
+        sys.exit(1)
@@ -0,0 +1,124 @@
+"""
+Benchmark reporting for WorkforceTransformer Universal
+Shared statistics, run metadata, JSON result files and baseline comparison for the
+benchmark suites
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_DIR = Path(__file__).resolve().parent / 'baselines'
+
+# Metric direction used by baseline comparison
+HIGHER_IS_BETTER = 'higher'
+LOWER_IS_BETTER = 'lower'
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def latency_summary(latencies: Sequence[float]) -> Dict[str, float]:
+    """Count, mean and tail percentiles in milliseconds for latencies in seconds"""
+    values = sorted(latencies)
+    if not values:
+        return {'count': 0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+    return {
+        'count': len(values),
+        'mean_ms': round(sum(values) / len(values) * 1000, 3),
+        'p50_ms': round(percentile(values, 50) * 1000, 3),
+        'p95_ms': round(percentile(values, 95) * 1000, 3),
+        'p99_ms': round(percentile(values, 99) * 1000, 3),
+        'max_ms': round(values[-1] * 1000, 3)
+    }
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, timeout=5).stdout.strip() or 'unknown'
+    except (OSError, subprocess.SubprocessError):
+        return 'unknown'
+
+
+def run_metadata(**options: Any) -> Dict[str, Any]:
+    """Environment and options recorded with every result file so runs can be compared across releases"""
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'git_revision': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        **options
+    }
+
+
+def write_results(payload: Dict[str, Any], path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def default_baseline(suite: str, target: str) -> Path:
+    return BASELINE_DIR / f"{suite}_{target}.json"
+
+
+def compare_to_baseline(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+                        metrics: Dict[str, str], tolerance: float) -> Tuple[List[str], List[str]]:
+    """Compare ``results`` case by case against ``baseline``
+
+    Returns a printable row per (case, metric) and one message per regression, where
+    a regression is a change in the bad direction larger than ``tolerance`` (a fraction).
+    """
+    rows, regressions = [], []
+    for case, values in results.items():
+        previous = baseline.get(case)
+        if previous is None:
+            rows.append(f"  {case:<32} (not in baseline)")
+            continue
+        for metric, direction in metrics.items():
+            if metric not in values or not previous.get(metric):
+                continue
+            change = (values[metric] - previous[metric]) / previous[metric]
+            worse = change < -tolerance if direction == HIGHER_IS_BETTER else change > tolerance
+            rows.append(f"  {case:<32} {metric:<14} {previous[metric]:>12.3f} -> {values[metric]:>12.3f}  "
+                        f"{change * 100:+7.1f}%{'  REGRESSION' if worse else ''}")
+            if worse:
+                regressions.append(f"{case} {metric} {previous[metric]:.3f} -> {values[metric]:.3f} "
+                                   f"({change * 100:+.1f}%, tolerance {tolerance * 100:.0f}%)")
+    return rows, regressions
+
+
+def require_baseline(baseline_path: Path) -> Path:
+    """Exit with an error when ``baseline_path`` is missing, rather than skipping the comparison"""
+    if not baseline_path.is_file():
+        # Baselines are machine-specific timings, so none is committed; each runner records its own
+        raise SystemExit(f"error: baseline {baseline_path} does not exist; record one on this machine "
+                         f"with --save-baseline or pass --baseline PATH")
+    return baseline_path
+
+
+def check_baseline(payload: Dict[str, Any], baseline_path: Path, metrics: Dict[str, str], tolerance: float) -> bool:
+    """Print the comparison against ``baseline_path``; False when any metric regressed"""
+    baseline = json.loads(require_baseline(baseline_path).read_text())
+    rows, regressions = compare_to_baseline(payload['results'], baseline['results'], metrics, tolerance)
+    print(f"\nCompared with {baseline_path} (revision {baseline['meta'].get('git_revision')}, "
+          f"{baseline['meta'].get('timestamp')})")
+    for key, value in payload['meta'].items():
+        if key not in ('timestamp', 'git_revision') and baseline['meta'].get(key, value) != value:
+            print(f"  warning: baseline was recorded with {key}={baseline['meta'][key]} (this run: {value})")
+    print("\n".join(rows))
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    return not regressions
@@ -0,0 +1,162 @@
+"""
+Startup profiler for WorkforceTransformer Universal
+Shows where boot time goes (per-package import time and time to first request) and
+optionally fails when startup exceeds a budget or pulls heavy packages in eagerly
+"""
+
+from pathlib import Path
+from statistics import median
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+ROOT = Path(__file__).resolve().parent
+
+# module to import, working directory, and the budgets applied by --check
+TARGETS = {
+    'unified': {'module': 'unified_app', 'cwd': ROOT, 'max_import_ms': 1500, 'max_ready_ms': 3000},
+    'backend': {'module': 'main', 'cwd': ROOT / 'backend', 'max_import_ms': 2000, 'max_ready_ms': 4000}
+}
+
+# Packages that no route needs at startup; each is imported on first use instead
+HEAVY_MODULES = ('numpy', 'pandas', 'sklearn', 'scipy', 'torch', 'transformers', 'sentence_transformers')
+
+PROBE_PATH = '/health'
+
+
+def profile_imports(module: str, cwd: Path) -> Dict[str, Any]:
+    """Import ``module`` in a fresh interpreter under ``-X importtime`` and aggregate by top-level package"""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=cwd, capture_output=True, text=True, env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'}
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr[-2000:]}")
+
+    packages: Dict[str, float] = {}
+    loaded = []
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        name = name.strip()
+        loaded.append(name)
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+        if name == module:
+            total_us = int(cumulative_us)
+
+    return {
+        'import_ms': round(total_us / 1000, 1),
+        'packages_ms': {name: round(us / 1000, 1) for name, us in sorted(packages.items(), key=lambda item: -item[1])},
+        'heavy_modules_loaded': [name for name in HEAVY_MODULES if name in loaded]
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_request(module: str, cwd: Path, timeout: float = 60.0) -> float:
+    """Milliseconds from launching a server process until it answers ``PROBE_PATH`` with 200"""
+    port = _free_port()
+    command = [sys.executable, '-c',
+               f'import uvicorn; uvicorn.run("{module}:app", host="127.0.0.1", port={port}, log_level="warning")']
+    url = f'http://127.0.0.1:{port}{PROBE_PATH}'
+
+    start = time.perf_counter()
+    server = subprocess.Popen(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    try:
+        while time.perf_counter() - start < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"server exited with {server.returncode}:\n{server.stderr.read().decode()[-2000:]}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return round((time.perf_counter() - start) * 1000, 1)
+            except (urllib.error.URLError, ConnectionError, OSError):
+                time.sleep(0.005)
+        raise RuntimeError(f"no response from {url} within {timeout}s")
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def profile(target: str, runs: int = 3) -> Dict[str, Any]:
+    config = TARGETS[target]
+    imports = profile_imports(config['module'], config['cwd'])
+    ready = [time_to_first_request(config['module'], config['cwd']) for _ in range(runs)]
+    return {
+        'target': target,
+        'module': config['module'],
+        'import_ms': imports['import_ms'],
+        'ready_ms': median(ready),
+        'ready_runs_ms': ready,
+        'heavy_modules_loaded': imports['heavy_modules_loaded'],
+        'packages_ms': imports['packages_ms']
+    }
+
+
+def check_budget(result: Dict[str, Any], max_import_ms: Optional[float],
+                 max_ready_ms: Optional[float]) -> List[str]:
+    """Return one message per violated budget; an empty list means startup is within budget"""
+    failures = []
+    if max_import_ms is not None and result['import_ms'] > max_import_ms:
+        failures.append(f"import {result['module']} took {result['import_ms']} ms (budget {max_import_ms} ms)")
+    if max_ready_ms is not None and result['ready_ms'] > max_ready_ms:
+        failures.append(f"first {PROBE_PATH} response after {result['ready_ms']} ms (budget {max_ready_ms} ms)")
+    if result['heavy_modules_loaded']:
+        failures.append(f"heavy modules imported at startup: {', '.join(result['heavy_modules_loaded'])}")
+    return failures
+
+
+def print_report(result: Dict[str, Any], top: int):
+    print(f"Startup profile: {result['target']} ({result['module']}:app)")
+    print(f"  import {result['module']:<24} {result['import_ms']:>9.1f} ms")
+    print(f"  first {PROBE_PATH} response{'':<9} {result['ready_ms']:>9.1f} ms  "
+          f"(median of {len(result['ready_runs_ms'])})")
+    print(f"\n  Top {top} packages by import time (self time, summed per top-level package)")
+    for name, ms in list(result['packages_ms'].items())[:top]:
+        share = ms / result['import_ms'] * 100 if result['import_ms'] else 0
+        print(f"    {name:<28} {ms:>9.1f} ms  {share:5.1f}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile application startup and enforce a startup budget")
+    parser.add_argument("target", nargs="?", choices=sorted(TARGETS), default="unified")
+    parser.add_argument("--runs", type=int, default=3, help="server launches to time (median is reported)")
+    parser.add_argument("--top", type=int, default=15, help="packages to list in the import breakdown")
+    parser.add_argument("--check", action="store_true", help="fail when the target's default budget is exceeded")
+    parser.add_argument("--max-import-ms", type=float, help="fail when importing the app takes longer")
+    parser.add_argument("--max-ready-ms", type=float, help="fail when the first request is answered later")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args()
+
+    result = profile(args.target, runs=args.runs)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result, args.top)
+
+    if args.check or args.max_import_ms is not None or args.max_ready_ms is not None:
+        defaults = TARGETS[args.target] if args.check else {}
+        failures = check_budget(result, args.max_import_ms or defaults.get('max_import_ms'),
+                                args.max_ready_ms or defaults.get('max_ready_ms'))
+        for failure in failures:
+            print(f"FAIL: {failure}", file=sys.stderr)
+        if failures:
+            sys.exit(1)
+        print("Startup within budget", file=sys.stderr)
@@ -3,17 +3,43 @@ WorkforceTransformer Universal - Unified Application
 Single file containing both backend API and frontend serving
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, AsyncIterator
 import logging
 import uvicorn
 from pathlib import Path
 from dotenv import load_dotenv
+import gzip
+import hashlib
+import io
+import mimetypes
 import os
+import re
+import asyncio
+import csv
+import gc
+import json
+import math
+import select
+import signal
+import socket
+import sys
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# Helpers shared with the backend API live in backend/utils, imported there as top-level ``utils``
+BACKEND_DIR = str(Path(__file__).resolve().parent / "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from utils.lazy_imports import lazy_import
+from utils.metrics import CONTENT_TYPE, MODEL_INFERENCE, MetricsMiddleware, registry
+from utils.roi_sweep import MAX_SWEEP_CELLS, SweepAxis, check_reductions, reduce_sweep
 
 # Load environment variables
 load_dotenv()
@@ -22,10 +48,23 @@ load_dotenv()
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", 8000))
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", 4096))
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", 300))
+MODEL_WORKERS = int(os.getenv("MODEL_WORKERS", min(4, os.cpu_count() or 1)))
+MODEL_QUEUE_LIMIT = int(os.getenv("MODEL_QUEUE_LIMIT", 64))
+MODEL_QUEUE_TIMEOUT = float(os.getenv("MODEL_QUEUE_TIMEOUT", 5))
+MODEL_INLINE_MAX_MS = float(os.getenv("MODEL_INLINE_MAX_MS", 0.5))
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", 500))
+WORKERS = int(os.getenv("WORKERS", os.cpu_count() or 1))
+WORKER_READY_TIMEOUT = float(os.getenv("WORKER_READY_TIMEOUT", 30))
+WORKER_GRACEFUL_TIMEOUT = float(os.getenv("WORKER_GRACEFUL_TIMEOUT", 30))
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# numpy is only needed by the ROI sweep, so it stays off the startup path
+np = lazy_import('numpy')
+
 # Initialize FastAPI app
 app = FastAPI(
     title="WorkforceTransformer Universal",
@@ -42,6 +81,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost, so latency includes CORS handling and error responses are counted
+app.add_middleware(MetricsMiddleware)
+
 # Pydantic models
 class HealthCheck(BaseModel):
     status: str
@@ -75,6 +117,14 @@ class ROICalculationRequest(BaseModel):
     training_budget: float
     current_avg_salary: Optional[float] = 50000
 
+class ROISweepRequest(BaseModel):
+    industries: Optional[List[str]] = None
+    employee_counts: SweepAxis
+    training_budgets: SweepAxis = SweepAxis(values=[0])
+    reductions: List[str] = []
+    include_grid: bool = True
+    format: str = "json"
+
 class ROICalculationResponse(BaseModel):
     traditional_cost: float
     ai_enhanced_cost: float
@@ -158,6 +208,18 @@ class UnifiedAIModels:
             'recommendations': recommendations
         }
 
+    def assess_skills_batch(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Assess many profiles, scoring each distinct profile once"""
+        results = []
+        seen = {}
+        for profile in profiles:
+            key = (profile['current_industry'], tuple(profile['skills']),
+                   profile['experience_years'], profile.get('target_industry'))
+            if key not in seen:
+                seen[key] = self.assess_skills(**profile)
+            results.append(seen[key])
+        return results
+
     def predict_transition(self, current_industry: str, target_industry: str, 
                           skills: List[str] = None) -> Dict[str, Any]:
         transition_matrix = {
@@ -203,9 +265,377 @@ class UnifiedAIModels:
             'productivity_increase': round(roi_percentage, 1)
         }
 
+    def calculate_roi_grid(self, industries: List[str], employee_counts: 'np.ndarray',
+                           training_budgets: 'np.ndarray') -> Dict[str, 'np.ndarray']:
+        """calculate_roi over industries x headcounts x budgets in one broadcast pass"""
+        shape = (len(industries), len(employee_counts), len(training_budgets))
+        multipliers = np.array([self.roi_multipliers.get(industry, 2.5) for industry in industries])[:, None, None]
+        traditional_cost = np.asarray(employee_counts, dtype=float)[None, :, None] * 2500
+        ai_enhanced_cost = traditional_cost * 0.7
+        cost_savings = traditional_cost - ai_enhanced_cost
+        columns = {
+            'traditional_cost': traditional_cost,
+            'ai_enhanced_cost': ai_enhanced_cost,
+            'cost_savings': cost_savings,
+            'roi_percentage': multipliers * 100,
+            'payback_months': np.maximum(1, np.trunc(ai_enhanced_cost / (cost_savings / 12)))
+        }
+        return {name: np.broadcast_to(values, shape) for name, values in columns.items()}
+
 # Initialize AI models
 ai_models = UnifiedAIModels()
 
+# Result cache
+class ResultCache:
+    """Bounded LRU cache of model results with a per-entry TTL
+    
+    Keys are the model inputs prefixed with a namespace, so one model's
+    entries can be dropped without touching the others.
+    """
+    
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: tuple) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key: tuple, value: Any):
+        self.entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        """Drop every entry, or only those of ``namespace``; call after reloading models"""
+        if namespace is None:
+            dropped = len(self.entries)
+            self.entries.clear()
+        else:
+            stale = [key for key in self.entries if key[0] == namespace]
+            for key in stale:
+                del self.entries[key]
+            dropped = len(stale)
+        logger.info(f"Invalidated {dropped} cached results")
+        return dropped
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+result_cache = ResultCache(max_entries=RESULT_CACHE_SIZE, ttl_seconds=RESULT_CACHE_TTL)
+
+def reload_ai_models():
+    """Swap in freshly built models and drop results computed by the old ones"""
+    global ai_models
+    ai_models = UnifiedAIModels()
+    result_cache.invalidate()
+
+# Model executor
+class BoundedModelExecutor:
+    """Admission control for model calls, with a worker pool for the expensive ones
+    
+    Every call first takes one of ``max_workers`` slots. Requests beyond ``queue_limit``
+    waiting calls are rejected with 429, and calls that wait longer than ``queue_timeout``
+    for a slot are dropped with 503, so /health never queues behind model work.
+    
+    ``run`` executes on the pool. ``run_inline`` executes on the event loop only functions
+    whose measured cost is below ``inline_max_seconds``, where a thread hop would cost more
+    than the call; unmeasured and slower functions go to the pool. Inline calls never yield,
+    so the semaphore does not bound them against each other (the loop runs one at a time)
+    and only counts them against pool work; the cost threshold is what keeps each one from
+    stalling other requests.
+    """
+    
+    def __init__(self, max_workers: int, queue_limit: int, queue_timeout: float, inline_max_seconds: float = 0.0):
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.queue_timeout = queue_timeout
+        self.inline_max_seconds = inline_max_seconds
+        # Smoothed service time per function name, measured on either path
+        self.costs: Dict[str, float] = {}
+        self.inline = 0
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="model")
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_times = deque(maxlen=1024)
+        self.service_times = deque(maxlen=1024)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def queued(self) -> int:
+        return max(self.pending - self.running, 0)
+    
+    @property
+    def saturated(self) -> bool:
+        return self.queued >= self.queue_limit
+    
+    def retry_after(self) -> int:
+        """Seconds until the current queue should have drained"""
+        service = sum(self.service_times) / len(self.service_times) if self.service_times else 0.01
+        return max(1, math.ceil(service * (self.queued + 1) / self.max_workers))
+    
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Counters and slots are only touched on the event loop; each loop gets its own gate
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots, self._slots_loop = asyncio.Semaphore(self.max_workers), loop
+        return self._slots
+    
+    async def _admit(self) -> asyncio.Semaphore:
+        """Wait for a slot: 429 if too many calls are already waiting, 503 if the wait times out"""
+        if self.saturated:
+            self.rejected += 1
+            raise HTTPException(status_code=429, detail="Model queue is full",
+                                headers={"Retry-After": str(self.retry_after())})
+        
+        slots = self._semaphore()
+        submitted = time.perf_counter()
+        self.pending += 1
+        try:
+            await asyncio.wait_for(slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.pending -= 1
+            self.timed_out += 1
+            raise HTTPException(status_code=503, detail="Model queue wait exceeded",
+                                headers={"Retry-After": str(self.retry_after())})
+        except BaseException:
+            self.pending -= 1
+            raise
+        self.running += 1
+        self.wait_times.append(time.perf_counter() - submitted)
+        return slots
+    
+    def _release(self, slots: asyncio.Semaphore, name: str, elapsed: float):
+        self.service_times.append(elapsed)
+        previous = self.costs.get(name)
+        self.costs[name] = elapsed if previous is None else previous * 0.9 + elapsed * 0.1
+        MODEL_INFERENCE.observe(elapsed, 'unified', name)
+        self.running -= 1
+        self.pending -= 1
+        self.completed += 1
+        slots.release()
+    
+    async def run_inline(self, func, *args, **kwargs) -> Any:
+        """Run ``func`` on the event loop once admitted if it has measured cheap, otherwise on the pool"""
+        cost = self.costs.get(func.__name__)
+        if cost is None or cost >= self.inline_max_seconds:
+            return await self.run(func, *args, **kwargs)
+        slots = await self._admit()
+        self.inline += 1
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._release(slots, func.__name__, time.perf_counter() - started)
+    
+    async def run(self, func, *args, **kwargs) -> Any:
+        """Run an expensive call on the worker pool once admitted"""
+        slots = await self._admit()
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, partial(func, *args, **kwargs))
+        finally:
+            self._release(slots, func.__name__, time.perf_counter() - started)
+    
+    def stats(self) -> Dict[str, Any]:
+        waits = sorted(self.wait_times)
+        return {
+            'workers': self.max_workers,
+            'queue_limit': self.queue_limit,
+            'queue_depth': self.queued,
+            'running': self.running,
+            'completed': self.completed,
+            'inline': self.inline,
+            'rejected': self.rejected,
+            'timed_out': self.timed_out,
+            'wait_ms': {
+                'mean': round(sum(waits) / len(waits) * 1000, 3) if waits else 0.0,
+                'p95': round(waits[int(len(waits) * 0.95)] * 1000, 3) if waits else 0.0,
+                'max': round(waits[-1] * 1000, 3) if waits else 0.0
+            }
+        }
+    
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+model_executor = BoundedModelExecutor(MODEL_WORKERS, MODEL_QUEUE_LIMIT, MODEL_QUEUE_TIMEOUT, MODEL_INLINE_MAX_MS / 1000)
+
+async def _cached(namespace: str, inputs: Dict[str, Any], compute) -> Dict[str, Any]:
+    """Return the cached result for ``inputs`` or score it through the model executor and store it"""
+    key = (namespace,) + tuple(tuple(value) if isinstance(value, list) else value for value in inputs.values())
+    results = result_cache.get(key)
+    if results is None:
+        results = await model_executor.run_inline(compute, **inputs)
+        result_cache.put(key, results)
+    return results
+
+def _assessment_inputs(request: SkillsAssessmentRequest) -> Dict[str, Any]:
+    # Passed through unchanged: industry lookups are case-sensitive and float sums follow skill order,
+    # so only identical requests may share a cached result
+    return {
+        'current_industry': request.current_industry,
+        'skills': request.skills,
+        'experience_years': request.experience_years,
+        'target_industry': request.target_industry
+    }
+
+async def cached_assessment(request: SkillsAssessmentRequest) -> Dict[str, Any]:
+    return await _cached('assess', _assessment_inputs(request), ai_models.assess_skills)
+
+# Bulk assessment streaming
+MAX_LINE_BYTES = 64 * 1024
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into lines without holding more than one partial line"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8").rstrip("\r")
+        if len(buffer) > MAX_LINE_BYTES:
+            raise ValueError(f"Line exceeds {MAX_LINE_BYTES} bytes")
+    if buffer:
+        yield buffer.decode("utf-8").rstrip("\r")
+
+async def _iter_upload(upload) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await upload.read(65536)
+        if not chunk:
+            return
+        yield chunk
+
+async def _iter_records(lines: AsyncIterator[str], fmt: str) -> AsyncIterator[tuple]:
+    """Yield (line_number, record or None, error) for every non-empty input line"""
+    header = None
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            if fmt == "csv":
+                values = next(csv.reader([line]))
+                if header is None:
+                    header = [column.strip() for column in values]
+                    continue
+                record = dict(zip(header, values))
+                # Skills are one CSV column separated by '|' (or ';')
+                record['skills'] = [skill.strip() for skill in record.get('skills', '').replace(';', '|').split('|')
+                                    if skill.strip()]
+                record = {key: value for key, value in record.items() if value != ''}
+            else:
+                record = json.loads(line)
+            yield line_number, record, None
+        except Exception as e:
+            yield line_number, None, str(e)
+
+class UploadStreamingResponse(StreamingResponse):
+    """StreamingResponse for bodies generated while the request is still being read
+    
+    The stock response listens for disconnects on ``receive``, which would swallow the
+    upload's body messages; here the body iterator is the only reader.
+    """
+    
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+def _stream_format(content_type: str, filename: str = "") -> str:
+    if "csv" in content_type or filename.lower().endswith(".csv"):
+        return "csv"
+    return "ndjson"
+
+async def _stream_assessments(records: AsyncIterator[tuple], chunk_size: int) -> AsyncIterator[bytes]:
+    """Score records in chunks on the model executor and emit one NDJSON line per input row"""
+    start = time.perf_counter()
+    counts = {'rows': 0, 'assessed': 0, 'errors': 0}
+    chunk: List[tuple] = []
+    
+    async def flush() -> bytes:
+        entries = [entry for entry in chunk if entry[2] is None]
+        results = iter(await model_executor.run(ai_models.assess_skills_batch, [entry[3] for entry in entries])
+                       if entries else [])
+        lines = []
+        for line_number, employee_id, error, _ in chunk:
+            out = {'line': line_number}
+            if employee_id is not None:
+                out['employee_id'] = employee_id
+            if error is None:
+                out['result'] = next(results)
+                counts['assessed'] += 1
+            else:
+                out['error'] = error
+                counts['errors'] += 1
+            lines.append(json.dumps(out))
+        chunk.clear()
+        return ("\n".join(lines) + "\n").encode()
+    
+    try:
+        async for line_number, record, error in records:
+            counts['rows'] += 1
+            employee_id = record.get('employee_id') if isinstance(record, dict) else None
+            inputs = None
+            if error is None:
+                try:
+                    inputs = _assessment_inputs(SkillsAssessmentRequest(**record))
+                except Exception as e:
+                    error = str(e).splitlines()[0]
+            chunk.append((line_number, employee_id, error, inputs))
+            if len(chunk) >= chunk_size:
+                yield await flush()
+        if chunk:
+            yield await flush()
+        status = 'complete'
+    except HTTPException as e:
+        # Headers are already sent, so overload mid-stream ends the stream with an error trailer
+        status = f'aborted: {e.detail}'
+    except Exception as e:
+        logger.error(f"Bulk assessment stream failed: {e}")
+        status = f'aborted: {e}'
+    
+    elapsed = time.perf_counter() - start
+    yield (json.dumps({'summary': {
+        'status': status,
+        **counts,
+        'elapsed_ms': round(elapsed * 1000, 2),
+        'rows_per_second': round(counts['rows'] / elapsed, 1) if elapsed > 0 else 0.0
+    }}) + "\n").encode()
+
+
 # API Endpoints
 @app.get("/health", response_model=HealthCheck)
 async def health_check():
@@ -215,32 +645,86 @@ async def health_check():
         "ai_models_status": "operational"
     }
 
+@app.get("/ready")
+async def readiness_check():
+    # Take this instance out of rotation while its model queue is full; /health stays 200
+    ready = not model_executor.saturated
+    return JSONResponse({"ready": ready, "executor": model_executor.stats()}, status_code=200 if ready else 503)
+
+@app.get("/metrics")
+async def metrics():
+    lines = [registry.render().rstrip("\n")]
+    # Cache and executor state is read at scrape time rather than tracked twice
+    cache, executor = result_cache.stats(), model_executor.stats()
+    for name, kind, documentation, value in (
+        ("result_cache_hits_total", "counter", "Result cache hits", cache['hits']),
+        ("result_cache_misses_total", "counter", "Result cache misses", cache['misses']),
+        ("result_cache_evictions_total", "counter", "Result cache LRU evictions", cache['evictions']),
+        ("result_cache_entries", "gauge", "Entries in the result cache", cache['entries']),
+        ("model_queue_depth", "gauge", "Model calls waiting for a worker", executor['queue_depth']),
+        ("model_queue_running", "gauge", "Model calls running", executor['running']),
+        ("model_queue_rejected_total", "counter", "Model calls rejected with 429", executor['rejected']),
+        ("model_queue_timed_out_total", "counter", "Model calls dropped with 503", executor['timed_out'])
+    ):
+        lines += [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}", f"{name} {value}"]
+    return Response("\n".join(lines) + "\n", media_type=CONTENT_TYPE)
+
+@app.get("/api/executor/stats")
+async def executor_stats():
+    return model_executor.stats()
+
+@app.on_event("shutdown")
+async def stop_model_executor():
+    model_executor.shutdown()
+
 @app.post("/api/assess", response_model=SkillsAssessmentResponse)
 async def assess_skills(request: SkillsAssessmentRequest):
     try:
         logger.info(f"Processing assessment for {request.current_industry}")
-        results = ai_models.assess_skills(
-            current_industry=request.current_industry,
-            skills=request.skills,
-            experience_years=request.experience_years,
-            target_industry=request.target_industry
-        )
+        results = await cached_assessment(request)
         return SkillsAssessmentResponse(**results)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Assessment error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/assess/stream")
+async def assess_skills_stream(request: Request):
+    """Assess an NDJSON or CSV upload row by row, streaming NDJSON results and a summary trailer"""
+    if model_executor.saturated:
+        raise HTTPException(status_code=429, detail="Model queue is full",
+                            headers={"Retry-After": str(model_executor.retry_after())})
+    
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        # Starlette spools uploads to disk past 1 MB, so the file is read back incrementally
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="Expected a 'file' upload")
+        fmt = _stream_format(upload.content_type or "", upload.filename or "")
+        chunks = _iter_upload(upload)
+    else:
+        fmt = _stream_format(content_type)
+        chunks = request.stream()
+    
+    records = _iter_records(_iter_lines(chunks), fmt)
+    return UploadStreamingResponse(_stream_assessments(records, BULK_CHUNK_SIZE), media_type="application/x-ndjson")
+
 @app.get("/api/transition/{employee_id}/{target_industry}", response_model=CareerTransitionResponse)
 async def predict_transition(employee_id: str, target_industry: str, 
                            current_industry: str = "technology", skills: Optional[str] = None):
     try:
         skill_list = skills.split(',') if skills else []
-        results = ai_models.predict_transition(
-            current_industry=current_industry,
-            target_industry=target_industry,
-            skills=skill_list
-        )
+        results = await _cached('transition', {
+            'current_industry': current_industry,
+            'target_industry': target_industry,
+            'skills': skill_list
+        }, ai_models.predict_transition)
         return CareerTransitionResponse(**results)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Transition prediction error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -249,17 +733,77 @@ async def predict_transition(employee_id: str, target_industry: str,
 async def calculate_roi(request: ROICalculationRequest):
     try:
         logger.info(f"Calculating ROI for {request.industry}")
-        results = ai_models.calculate_roi(
-            industry=request.industry,
-            employee_count=request.employee_count,
-            training_budget=request.training_budget,
-            current_avg_salary=request.current_avg_salary
-        )
+        results = await _cached('roi', {
+            'industry': request.industry,
+            'employee_count': request.employee_count,
+            'training_budget': request.training_budget,
+            'current_avg_salary': request.current_avg_salary
+        }, ai_models.calculate_roi)
         return ROICalculationResponse(**results)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"ROI calculation error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/roi/sweep")
+async def roi_scenario_sweep(request: ROISweepRequest):
+    """Evaluate ROI over an industries x headcounts x budgets grid, returned column-oriented"""
+    industries = list(request.industries or ai_models.roi_multipliers)
+    if request.format not in ("json", "npz"):
+        raise HTTPException(status_code=422, detail="format must be 'json' or 'npz'")
+    # Sized from the request alone, so an oversized sweep is rejected before any array is allocated
+    cells = len(industries) * request.employee_counts.size() * request.training_budgets.size()
+    if cells == 0 or cells > MAX_SWEEP_CELLS:
+        raise HTTPException(status_code=422, detail=f"Sweep must have between 1 and {MAX_SWEEP_CELLS} scenarios, got {cells}")
+    try:
+        check_reductions(request.reductions)
+        employee_counts = request.employee_counts.to_array()
+        training_budgets = request.training_budgets.to_array()
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if (employee_counts <= 0).any() or (training_budgets < 0).any():
+        raise HTTPException(status_code=422, detail="Employee counts must be positive and budgets non-negative")
+    
+    # Evaluation, reduction and encoding are all CPU-bound, so the whole sweep runs on the model pool
+    return await model_executor.run(_evaluate_sweep, request, industries, employee_counts, training_budgets)
+
+def _evaluate_sweep(request: ROISweepRequest, industries: List[str], employee_counts, training_budgets) -> Response:
+    """Evaluate, reduce and encode a validated sweep; runs on a model worker thread"""
+    start = time.perf_counter()
+    grid = ai_models.calculate_roi_grid(industries, employee_counts, training_budgets)
+    reductions = reduce_sweep(grid, industries, employee_counts, training_budgets, request.reductions)
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+    columns = grid if request.include_grid else {}
+    
+    if request.format == "npz":
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, industry=np.asarray(industries), employee_count=employee_counts,
+                            training_budget=training_budgets, **columns)
+        return Response(buffer.getvalue(), media_type="application/octet-stream", headers={
+            "Content-Disposition": 'attachment; filename="roi_sweep.npz"',
+            "X-Sweep-Shape": ",".join(map(str, grid['roi_percentage'].shape)),
+            "X-Elapsed-Ms": str(elapsed_ms)
+        })
+    
+    # Columns are flattened in C order over (industry, employee_count, training_budget)
+    return JSONResponse({
+        'shape': list(grid['roi_percentage'].shape),
+        'axes': {
+            'industry': industries,
+            'employee_count': employee_counts.tolist(),
+            'training_budget': training_budgets.tolist()
+        },
+        'columns': {name: np.round(values, 2).ravel().tolist() for name, values in columns.items()},
+        'reductions': reductions,
+        'scenarios': int(grid['roi_percentage'].size),
+        'elapsed_ms': elapsed_ms
+    })
+
+@app.get("/api/cache/stats")
+async def cache_stats():
+    return result_cache.stats()
+
 @app.get("/api/analytics/job-market/{industry}")
 async def get_job_market_analytics(industry: str):
     market_data = {
@@ -276,12 +820,7 @@ async def get_job_market_analytics(industry: str):
 
 @app.post("/api/training/recommendations")
 async def get_training_recommendations(request: SkillsAssessmentRequest):
-    assessment = ai_models.assess_skills(
-        current_industry=request.current_industry,
-        skills=request.skills,
-        experience_years=request.experience_years,
-        target_industry=request.target_industry
-    )
+    assessment = await cached_assessment(request)
     
     modules = []
     for gap in assessment['skill_gaps']:
@@ -303,38 +842,308 @@ async def get_training_recommendations(request: SkillsAssessmentRequest):
 # Serve frontend files
 frontend_path = Path(__file__).parent / "frontend"
 
-# Mount static files
-if frontend_path.exists():
-    app.mount("/static", StaticFiles(directory=str(frontend_path)), name="static")
+# Content types worth gzipping; images and archives are already compressed
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+# Files named like app.3f2a9c1e.js never change content, so clients may cache them for a year
+FINGERPRINTED = re.compile(r'\.[0-9a-f]{8,}\.[A-Za-z0-9]+$')
+
+class StaticAsset:
+    def __init__(self, path: Path):
+        stat = path.stat()
+        body = path.read_bytes()
+        self.mtime_ns = stat.st_mtime_ns
+        self.body = body
+        self.media_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self.gzip_body = None
+        if self.media_type.startswith(COMPRESSIBLE_TYPES):
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                self.gzip_body = compressed
+        self.cache_control = ("public, max-age=31536000, immutable" if FINGERPRINTED.search(path.name)
+                              else "no-cache")
+
+class StaticAssetCache:
+    """Frontend files held in memory with gzip variants and strong ETags
+    
+    In dev mode every hit re-checks the file mtime so edits show up without a restart.
+    """
+    
+    def __init__(self, root: Path, dev_mode: bool = False):
+        self.root = root.resolve()
+        self.dev_mode = dev_mode
+        self.assets: Dict[str, StaticAsset] = {}
+    
+    def preload(self):
+        # Workers forked from a supervisor inherit its copy; reloading would unshare those pages
+        if self.assets or not self.root.is_dir():
+            return
+        for path in self.root.rglob('*'):
+            if path.is_file():
+                relative = path.relative_to(self.root).as_posix()
+                self.assets[relative] = StaticAsset(path)
+        logger.info(f"Cached {len(self.assets)} frontend assets "
+                    f"({sum(len(asset.body) for asset in self.assets.values()) // 1024} KB)")
+    
+    def get(self, relative: str) -> Optional[StaticAsset]:
+        asset = self.assets.get(relative)
+        if asset is not None and not self.dev_mode:
+            return asset
+        
+        # No file name contains a NUL byte, and Path.resolve() raises ValueError on one
+        if '\x00' in relative:
+            return None
+        path = (self.root / relative).resolve()
+        if not path.is_relative_to(self.root):
+            return None
+        # Keyed by the resolved path, so dot-segment and other spellings of one file share an entry
+        key = path.relative_to(self.root).as_posix()
+        if not self.dev_mode:
+            # Only preloaded files are served; request paths never add entries
+            return self.assets.get(key)
+
+        if not path.is_file():
+            self.assets.pop(key, None)
+            return None
+        asset = self.assets.get(key)
+        if asset is None or path.stat().st_mtime_ns != asset.mtime_ns:
+            asset = self.assets[key] = StaticAsset(path)
+        return asset
+    
+    def response(self, relative: str, request: Request) -> Response:
+        asset = self.get(relative)
+        if asset is None:
+            raise HTTPException(status_code=404, detail="File not found")
+        
+        use_gzip = asset.gzip_body is not None and _accepts_gzip(request.headers.get('accept-encoding', ''))
+        # Each encoding is a distinct representation, so it gets its own strong validator
+        etag = f'{asset.etag[:-1]}-gz"' if use_gzip else asset.etag
+        headers = {'ETag': etag, 'Cache-Control': asset.cache_control}
+        if asset.gzip_body is not None:
+            headers['Vary'] = 'Accept-Encoding'
+        
+        if _etag_matches(request.headers.get('if-none-match'), etag):
+            return Response(status_code=304, headers=headers)
+        if use_gzip:
+            headers['Content-Encoding'] = 'gzip'
+            return Response(asset.gzip_body, media_type=asset.media_type, headers=headers)
+        return Response(asset.body, media_type=asset.media_type, headers=headers)
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for coding in accept_encoding.split(','):
+        name, _, params = coding.partition(';')
+        if name.strip().lower() in ('gzip', '*'):
+            quality = params.strip().lower().removeprefix('q=')
+            try:
+                return not quality or float(quality) > 0
+            except ValueError:
+                return True
+    return False
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    # If-None-Match uses the weak comparison, so a W/ prefix is ignored
+    return any(candidate.strip().removeprefix('W/') == etag for candidate in if_none_match.split(','))
+
+static_assets = StaticAssetCache(frontend_path, dev_mode=DEBUG)
+
+@app.on_event("startup")
+async def preload_static_assets():
+    static_assets.preload()
 
 @app.get("/")
-async def serve_frontend():
-    frontend_file = frontend_path / "index.html"
-    if frontend_file.exists():
-        return FileResponse(str(frontend_file))
+async def serve_frontend(request: Request):
+    if static_assets.get("index.html") is not None:
+        return static_assets.response("index.html", request)
     else:
         return {"message": "WorkforceTransformer Universal API", "docs": "/docs"}
 
+@app.get("/static/{filename:path}")
+async def serve_static_assets(filename: str, request: Request):
+    return static_assets.response(filename, request)
+
 @app.get("/{filename}")
-async def serve_static_files(filename: str):
-    file_path = frontend_path / filename
-    if file_path.exists() and file_path.is_file():
-        return FileResponse(str(file_path))
-    raise HTTPException(status_code=404, detail="File not found")
+async def serve_static_files(filename: str, request: Request):
+    return static_assets.response(filename, request)
+
+# Multi-process serving
+_worker_ready_fd: Optional[int] = None
+
+@app.on_event("startup")
+async def notify_supervisor():
+    """Tell the supervisor this worker finished startup and is accepting connections"""
+    global _worker_ready_fd
+    if _worker_ready_fd is not None:
+        os.write(_worker_ready_fd, b"1")
+        os.close(_worker_ready_fd)
+        _worker_ready_fd = None
+
+class WorkerSupervisor:
+    """Pre-fork supervisor running several uvicorn workers on one listening socket
+    
+    Models and frontend assets are built once here and inherited copy-on-write by
+    every worker. SIGHUP replaces workers one at a time, starting each replacement
+    before its predecessor drains; SIGTERM/SIGINT stop all workers gracefully, and
+    workers that exit unexpectedly are respawned.
+    """
+    
+    def __init__(self, host: str, port: int, workers: int,
+                 ready_timeout: float = 30.0, graceful_timeout: float = 30.0):
+        self.host = host
+        self.port = port
+        self.worker_count = workers
+        self.ready_timeout = ready_timeout
+        self.graceful_timeout = graceful_timeout
+        self.workers: List[int] = []
+        self.sock = None
+        self._stopping = False
+        self._reload_requested = False
+    
+    def run(self):
+        static_assets.preload()
+        # Import numpy once here so workers share it instead of each importing it on first sweep
+        np.ndarray
+        self.sock = socket.socket(socket.AF_INET6 if ":" in self.host else socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((self.host, self.port))
+        self.sock.listen(2048)
+        self.sock.set_inheritable(True)
+        
+        # Move everything built so far out of the collector's reach, so gc passes in the
+        # workers do not write to (and un-share) the inherited pages
+        gc.collect()
+        gc.freeze()
+        
+        signal.signal(signal.SIGHUP, self._request_reload)
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+        
+        logger.info(f"Supervisor {os.getpid()} serving http://{self.host}:{self.port} with {self.worker_count} workers")
+        for _ in range(self.worker_count):
+            self._spawn()
+        
+        try:
+            while not self._stopping:
+                if self._reload_requested:
+                    self._reload_requested = False
+                    self._rolling_restart()
+                self._reap()
+                time.sleep(0.5)
+        finally:
+            for pid in list(self.workers):
+                self._stop_worker(pid)
+            self.sock.close()
+            logger.info("Supervisor stopped")
+    
+    def _request_reload(self, signum, frame):
+        self._reload_requested = True
+    
+    def _request_stop(self, signum, frame):
+        self._stopping = True
+    
+    def _spawn(self) -> bool:
+        """Fork one worker and wait until it reports ready"""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # The child must never unwind into the supervisor's stack, whose cleanup stops the workers
+            try:
+                os.close(read_fd)
+                self._serve_worker(write_fd)
+            except BaseException:
+                logger.exception(f"Worker {os.getpid()} failed")
+                os._exit(1)
+            else:
+                os._exit(0)
+        
+        os.close(write_fd)
+        try:
+            readable, _, _ = select.select([read_fd], [], [], self.ready_timeout)
+            ready = bool(readable) and os.read(read_fd, 1) == b"1"
+        finally:
+            os.close(read_fd)
+        
+        self.workers.append(pid)
+        if not ready:
+            logger.error(f"Worker {pid} did not become ready within {self.ready_timeout}s")
+            self._stop_worker(pid)
+            return False
+        logger.info(f"Worker {pid} ready")
+        return True
+    
+    def _serve_worker(self, ready_fd: int):
+        global _worker_ready_fd
+        for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, signal.SIG_DFL)
+        _worker_ready_fd = ready_fd
+        config = uvicorn.Config(app, reload=False, log_level="info",
+                                timeout_graceful_shutdown=int(self.graceful_timeout))
+        uvicorn.Server(config).run(sockets=[self.sock])
+    
+    def _stop_worker(self, pid: int):
+        """SIGTERM a worker, letting in-flight requests finish, and SIGKILL it after the graceful timeout"""
+        if pid in self.workers:
+            self.workers.remove(pid)
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        deadline = time.monotonic() + self.graceful_timeout
+        while time.monotonic() < deadline:
+            try:
+                done, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if done:
+                return
+            time.sleep(0.1)
+        logger.warning(f"Worker {pid} did not stop within {self.graceful_timeout}s; killing it")
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+    
+    def _rolling_restart(self):
+        logger.info(f"Rolling restart of {len(self.workers)} workers")
+        for pid in list(self.workers):
+            if not self._spawn():
+                logger.error("Replacement worker failed to start; keeping the remaining workers")
+                return
+            self._stop_worker(pid)
+        logger.info("Rolling restart complete")
+    
+    def _reap(self):
+        """Collect workers that exited on their own and replace them"""
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            if pid in self.workers:
+                self.workers.remove(pid)
+                logger.warning(f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}; respawning")
+                if not self._stopping:
+                    self._spawn()
 
 if __name__ == "__main__":
     logger.info("🚀 Starting WorkforceTransformer Universal")
-    logger.info("📊 Backend API: http://localhost:8000/docs")
-    logger.info("🌐 Frontend: http://localhost:8000")
+    logger.info(f"📊 Backend API: http://localhost:{PORT}/docs")
+    logger.info(f"🌐 Frontend: http://localhost:{PORT}")
     
     try:
-        uvicorn.run(
-            app, 
-            host="0.0.0.0", 
-            port=8000, 
-            reload=False,  # Disable reload to prevent shutdown
-            log_level="info"
-        )
+        if WORKERS > 1 and hasattr(os, "fork"):
+            WorkerSupervisor(HOST, PORT, WORKERS, WORKER_READY_TIMEOUT, WORKER_GRACEFUL_TIMEOUT).run()
+        else:
+            uvicorn.run(
+                app, 
+                host=HOST, 
+                port=PORT, 
+                reload=False,  # Disable reload to prevent shutdown
+                log_level="info"
+            )
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e: